@@ -0,0 +1,88 @@
+"""Per-call framework overhead of verb-decorated endpoints.
+
+Each endpoint and its raw `Session.request` counterpart share a session 
+that answers without any I/O, so the difference between them is the time 
+toboggan adds on top of the client.
+
+::
+
+    python -m benchmarks.call_overhead
+"""
+# Standard
+from timeit import repeat
+from typing import Callable
+
+# Local
+from .stubs import NullSession
+from toboggan import (
+    Body,
+    Connector,
+    Path,
+    Query,
+    QueryKebab,
+    get,
+    headers,
+    params,
+    post,
+    retry,
+    returns,
+    sends,
+)
+
+NUMBER = 20_000
+
+
+class Api(Connector):
+
+    @get(path='items/{item_id}')
+    def get_item(self, item_id: Path, limit: Query, page_size: QueryKebab):
+        pass
+
+    @retry(total=3, backoff_factor=0.1, status_forcelist=[502, 503])
+    @returns.json
+    @sends.json
+    @headers({'X-Request-Source': 'benchmark'})
+    @params({'lang': 'en'})
+    @post(path='items/{item_id}')
+    def post_item(self, item_id: Path, body: Body):
+        pass
+
+
+def _best(stmt: Callable) -> float:
+    return min(repeat(stmt, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def _report(name: str, raw: float, decorated: float) -> None:
+    print(
+        f'{name:<24} raw {raw:8.2f} us  decorated {decorated:8.2f} us  '
+        f'overhead {decorated - raw:8.2f} us'
+    )
+
+
+def main() -> None:
+    session = NullSession()
+    api = Api(base_url='http://stub/', client=session)
+    _report(
+        'bare endpoint',
+        _best(lambda: session.request(
+            method='GET',
+            url='http://stub/items/1',
+            params={'limit': 10, 'page-size': 50}
+        )),
+        _best(lambda: api.get_item(1, limit=10, page_size=50))
+    )
+    _report(
+        'five decorators',
+        _best(lambda: session.request(
+            method='POST',
+            url='http://stub/items/1',
+            headers={'X-Request-Source': 'benchmark'},
+            params={'lang': 'en'},
+            json={'name': 'toboggan'}
+        ).json()),
+        _best(lambda: api.post_item(1, body={'name': 'toboggan'}))
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""Throughput of `Connector.amap` and `Connector.map` against a local 
+stand-in server.
+
+One endpoint is called over many argument sets, each call waiting on a 
+slow route.  `amap` is compared w/ awaiting the calls one by one and w/ a 
+hand-rolled `asyncio.gather` plus semaphore; `map` w/ blocking calls made 
+one by one.
+
+::
+
+    python -m benchmarks.fanout
+"""
+# Standard
+from asyncio import Semaphore, gather, run
+from time import perf_counter
+from typing import Awaitable, Callable
+
+# Third-party
+from aiohttp import ClientSession, TCPConnector
+from httpx import AsyncClient, Client, Limits
+from requests import Session
+
+# Local
+from .server import LocalServer
+from toboggan import Connector, Query, get, returns
+
+CALLS = 1_000
+LIMIT = 100
+DELAY_MS = 10
+
+
+class Api(Connector):
+
+    @returns.json
+    @get(path='slow')
+    def get_slow(self, ms: Query):
+        pass
+
+
+async def _sequential(api: Api) -> None:
+    for _ in range(CALLS // 10):
+        await api.get_slow(ms=DELAY_MS)
+
+
+async def _gather(api: Api) -> None:
+    semaphore = Semaphore(LIMIT)
+
+    async def call() -> None:
+        async with semaphore:
+            await api.get_slow(ms=DELAY_MS)
+
+    await gather(*(call() for _ in range(CALLS)))
+
+
+async def _amap(api: Api, ordered: bool) -> None:
+    arguments = ({'ms': DELAY_MS} for _ in range(CALLS))
+    async for _ in api.amap(
+            api.get_slow, arguments, limit=LIMIT, ordered=ordered
+    ):
+        pass
+
+
+async def _measure(
+        name: str, calls: int, run_: Callable[[], Awaitable]
+) -> None:
+    start = perf_counter()
+    await run_()
+    elapsed = perf_counter() - start
+    print(f'  {name:<24} {calls / elapsed:10.0f} calls/s')
+
+
+def main_sync(base_url: str) -> None:
+    for label, client in (('requests', Session), ('httpx', Client)):
+        print(f'{label} ({CALLS} calls, {DELAY_MS} ms each, limit {LIMIT})')
+        api = Api(base_url=base_url, client=client())
+        arguments = [{'ms': DELAY_MS}] * CALLS
+        start = perf_counter()
+        for _ in range(CALLS // 10):
+            api.get_slow(ms=DELAY_MS)
+        elapsed = perf_counter() - start
+        print(f'  {"sequential":<24} {CALLS // 10 / elapsed:10.0f} calls/s')
+        start = perf_counter()
+        for _ in api.map(api.get_slow, arguments, limit=LIMIT):
+            pass
+        elapsed = perf_counter() - start
+        print(f'  {"map":<24} {CALLS / elapsed:10.0f} calls/s')
+
+
+async def main(base_url: str) -> None:
+    for label, client in (
+            ('aiohttp', lambda: ClientSession(
+                connector=TCPConnector(limit=LIMIT)
+            )),
+            ('httpx', lambda: AsyncClient(
+                limits=Limits(max_connections=LIMIT)
+            )),
+    ):
+        print(f'{label} ({CALLS} calls, {DELAY_MS} ms each, limit {LIMIT})')
+        api = Api(base_url=base_url, client=client())
+        async with api.session():
+            await _measure('sequential', CALLS // 10, lambda: _sequential(api))
+            await _measure('gather + semaphore', CALLS, lambda: _gather(api))
+            await _measure('amap ordered', CALLS, lambda: _amap(api, True))
+            await _measure('amap as completed', CALLS, lambda: _amap(api, False))
+
+
+if __name__ == '__main__':
+    with LocalServer() as server:
+        run(main(server.base_url))
+        main_sync(server.base_url)
@@ -0,0 +1,393 @@
+"""Per-stage framework overhead of verb-decorated endpoints, w/ the
+transport stubbed out under every backend.
+
+`requests` runs on a `BaseAdapter` stub, `httpx` on an `httpx.MockTransport`
+and `aiohttp` on a session that answers from memory, so no call waits on
+I/O and what is left is Python.  Endpoints w/ 0, 3 and 10 annotated
+parameters and 0 to 5 stacked decorators are each called through toboggan
+and as the equivalent raw client call, and the stages of a call are
+measured on their own by replaying the arguments they were called w/:
+
+- `signature`: `_EvalSignature.dump`, binding the call's arguments
+- `settings`: `Settings.dump`, assembling the client call's arguments
+- `requests`: `Requests.__init__`, including `Responses` and `EvalReturn`
+- `responses`: `Responses.resolve_response_*`, decoding the body
+- `evaluate`: `EvalReturn.evaluate`, validating the return value
+
+Times are the best of several runs, in microseconds per call, and
+allocations the peak of memory traced by `tracemalloc` during one call,
+in bytes.  `call` is the whole decorated call, `over` its difference w/
+the raw client call and `stages` the sum of the stages.  `over` is only
+as steady as the raw call is short; `stages` is measured w/o the client
+and is what `--check` holds to a budget.
+
+W/ `--check`, the run fails if the stages of any endpoint are over
+budget.  Times are budgeted in units of a fixed pure-Python workload
+timed on the same machine, so the budget holds from a laptop to a CI
+runner; allocations are budgeted in bytes.  Both budgets grow linearly
+w/ the parameters and decorators of the endpoint.
+
+::
+
+    python -m benchmarks.overhead
+    python -m benchmarks.overhead --backends requests aiohttp --params 3
+    python -m benchmarks.overhead --check
+"""
+# Standard
+from argparse import ArgumentParser
+from asyncio import run
+from contextlib import contextmanager
+from functools import partial
+from inspect import Parameter, Signature, iscoroutinefunction
+from time import perf_counter
+from timeit import repeat
+from tracemalloc import get_traced_memory, reset_peak, start, stop
+from typing import (
+    Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple,
+)
+
+# Local
+from .stubs import (
+    StubClientSession, stub_async_client, stub_client, stub_session,
+)
+from toboggan import (
+    Connector,
+    Path,
+    Query,
+    QueryKebab,
+    circuit_breaker,
+    get,
+    headers,
+    params,
+    retry,
+    returns,
+)
+from toboggan.adapters import EvalReturn
+from toboggan.clients import Requests, Settings
+from toboggan.clients.responses import Responses
+from toboggan.decos.evaluators import _EvalSignature
+
+BACKENDS = ('requests', 'httpx-sync', 'httpx-async', 'aiohttp',)
+PARAMS = (0, 3, 10,)
+DECORATORS = (0, 1, 2, 3, 4, 5,)
+DURATION = 0.02
+"""Seconds each of the runs of a measurement lasts, roughly."""
+REPEAT = 5
+STAGES: Tuple[Tuple[str, type, str], ...] = (
+    ('signature', _EvalSignature, 'dump'),
+    ('settings', Settings, 'dump'),
+    ('requests', Requests, '__init__'),
+    ('responses', Responses, 'resolve_response_std'),
+    ('responses', Responses, 'resolve_response_awaitable'),
+    ('evaluate', EvalReturn, 'evaluate'),
+)
+BUDGET: Dict[str, Tuple[float, float, float]] = {
+    'time': (25.0, 2.5, 4.0),
+    'allocated': (6_000.0, 160.0, 400.0),
+}
+"""The `stages` allowed per metric, as `(base, per parameter, per
+decorator)`.  Time is in units of :py:func:`_unit`."""
+
+_ROLES = (Query, QueryKebab,)
+_STAGES = tuple(dict.fromkeys(stage for stage, _, _ in STAGES))
+_COLUMNS = ('raw', 'call', 'over', 'stages',) + _STAGES
+
+
+def _decorators() -> Tuple[Callable[[Callable], Callable], ...]:
+    return (
+        returns.json,
+        headers({'X-Request-Source': 'benchmark'}),
+        params({'lang': 'en'}),
+        retry(total=3, backoff_factor=0.1, status_forcelist=[502, 503]),
+        circuit_breaker(),
+    )
+
+
+def _endpoint(count: int, decorators: int) -> Callable:
+    """A `get` endpoint w/ `count` annotated parameters, the first of them
+    a `Path` and the rest `Query` and `QueryKebab` in turn, under the first
+    `decorators` of :py:func:`_decorators`.
+    """
+    names = [f'param_{index}' for index in range(count)]
+    roles = [Path] + [_ROLES[index % 2] for index in range(count - 1)]
+
+    def endpoint(self, **kwargs):
+        pass
+
+    endpoint.__name__ = endpoint.__qualname__ = f'get_{count}_{decorators}'
+    endpoint.__annotations__ = dict(zip(names, roles))
+    endpoint.__signature__ = Signature([
+        Parameter(name, Parameter.POSITIONAL_OR_KEYWORD, annotation=role)
+        for name, role in [('self', Parameter.empty)] + list(zip(names, roles))
+    ])
+    func = get(path='items/{param_0}' if count else 'items')(endpoint)
+    for decorator in _decorators()[:decorators]:
+        func = decorator(func)
+    return func
+
+
+def _unit() -> float:
+    """Microseconds taken by a fixed workload of the kind a call is made
+    of: a function call w/ keyword arguments, a few small `dict`s and a
+    formatted string.
+    """
+    def work(key: str, value: int, **kwargs) -> Dict:
+        mapping = {key: value, **kwargs}
+        return {'url': f'http://stub/{key}/{value}', 'params': mapping}
+
+    return _time_sync(lambda: work('item', 1, limit=10, page=2))
+
+
+def _number(elapsed: float) -> int:
+    return max(10, int(DURATION / max(elapsed, 1e-7)))
+
+
+def _time_sync(call: Callable[[], Any]) -> float:
+    started = perf_counter()
+    call()
+    number = _number(perf_counter() - started)
+    return min(repeat(call, number=number, repeat=REPEAT)) / number * 1e6
+
+
+async def _time_async(call: Callable[[], Awaitable]) -> float:
+    started = perf_counter()
+    await call()
+    number = _number(perf_counter() - started)
+    best = float('inf')
+    for _ in range(REPEAT):
+        started = perf_counter()
+        for _ in range(number):
+            await call()
+        best = min(best, perf_counter() - started)
+    return best / number * 1e6
+
+
+def _allocated_sync(call: Callable[[], Any]) -> int:
+    start()
+    try:
+        call()
+        best = None
+        for _ in range(REPEAT):
+            current, _ = get_traced_memory()
+            reset_peak()
+            call()
+            peak = get_traced_memory()[1] - current
+            best = peak if best is None else min(best, peak)
+        return best
+    finally:
+        stop()
+
+
+async def _allocated_async(call: Callable[[], Awaitable]) -> int:
+    start()
+    try:
+        await call()
+        best = None
+        for _ in range(REPEAT):
+            current, _ = get_traced_memory()
+            reset_peak()
+            await call()
+            peak = get_traced_memory()[1] - current
+            best = peak if best is None else min(best, peak)
+        return best
+    finally:
+        stop()
+
+
+@contextmanager
+def _captured() -> Iterator[Dict[str, Callable]]:
+    """Records the first call to every stage while the block runs, as a
+    replay of it.
+    """
+    replays: Dict[str, Callable] = {}
+    originals = [(owner, attr, owner.__dict__[attr]) for _, owner, attr in STAGES]
+
+    def recorder(stage: str, original: Callable) -> Callable:
+        def record(*args, **kwargs):
+            replays.setdefault(stage, partial(original, *args, **kwargs))
+            return original(*args, **kwargs)
+        return record
+
+    for (stage, _, _), (owner, attr, original) in zip(STAGES, originals):
+        setattr(owner, attr, recorder(stage, original))
+    try:
+        yield replays
+    finally:
+        for owner, attr, original in originals:
+            setattr(owner, attr, original)
+
+
+def _raw(
+        backend: str, client: Any, request: Dict[str, Any], decode: bool
+) -> Callable:
+    """The client call toboggan makes w/ `request`, the keyword arguments
+    it assembled, made directly.
+    """
+    if backend == 'aiohttp':
+
+        async def call() -> Any:
+            response = await client.request(**request)
+            return await response.json() if decode else response
+        return call
+    if backend == 'httpx-async':
+
+        async def call() -> Any:
+            response = await client.request(**request)
+            return response.json() if decode else response
+        return call
+    if decode:
+        return lambda: client.request(**request).json()
+    return partial(client.request, **request)
+
+
+async def _measure(
+        backend: str, client: Any, count: int, decorators: int
+) -> Dict[str, Any]:
+    name = f'get_{count}_{decorators}'
+    api = type('Api', (Connector,), {name: _endpoint(count, decorators)})(
+        base_url='http://stub/', client=client
+    )
+    kwargs = {f'param_{index}': index + 1 for index in range(count)}
+    call = partial(getattr(api, name), **kwargs)
+    nonblocking = backend in ('httpx-async', 'aiohttp')
+    with _captured() as replays:
+        await call() if nonblocking else call()
+    raw = _raw(
+        backend, client, replays['requests'].keywords['request'], decorators > 0
+    )
+    measured = dict(raw=raw, call=call, **replays)
+    time: Dict[str, float] = {}
+    allocated: Dict[str, int] = {}
+    for stage, replay in measured.items():
+        original = getattr(replay, 'func', None)
+        if stage in ('raw', 'call') and nonblocking or \
+                original is not None and iscoroutinefunction(original):
+            time[stage] = await _time_async(replay)
+            allocated[stage] = await _allocated_async(replay)
+        else:
+            time[stage] = _time_sync(replay)
+            allocated[stage] = _allocated_sync(replay)
+    for metric in (time, allocated):
+        metric['over'] = metric['call'] - metric['raw']
+        metric['stages'] = sum(metric.get(stage) or 0 for stage in _STAGES)
+    return dict(
+        backend=backend,
+        params=count,
+        decorators=decorators,
+        time=time,
+        allocated=allocated,
+    )
+
+
+async def _bench_backend(
+        backend: str, counts: Sequence[int], decorators: Sequence[int]
+) -> List[Dict[str, Any]]:
+    if backend == 'aiohttp':
+        client = StubClientSession()
+    elif backend == 'httpx-async':
+        client = stub_async_client()
+    elif backend == 'httpx-sync':
+        client = stub_client()
+    else:
+        client = stub_session()
+    try:
+        rows = []
+        for count in counts:
+            for level in decorators:
+                row = await _measure(backend, client, count, level)
+                _report(row)
+                rows.append(row)
+        return rows
+    finally:
+        if backend == 'aiohttp':
+            await client.close()
+        elif backend == 'httpx-async':
+            await client.aclose()
+        else:
+            client.close()
+
+
+def _header() -> None:
+    print(
+        f'{"backend":<12} {"params":>6} {"decos":>5}  '
+        + ' '.join(f'{column:>9}' for column in _COLUMNS)
+        + '   us per call / bytes allocated'
+    )
+
+
+def _report(row: Dict[str, Any]) -> None:
+    prefix = f'{row["backend"]:<12} {row["params"]:>6} {row["decorators"]:>5}  '
+    time, allocated = row['time'], row['allocated']
+    print(prefix + ' '.join(
+        f'{time[column]:9.2f}' if column in time else f'{"-":>9}'
+        for column in _COLUMNS
+    ))
+    print(' ' * len(prefix) + ' '.join(
+        f'{allocated[column]:9d}' if column in allocated else f'{"-":>9}'
+        for column in _COLUMNS
+    ))
+
+
+def _budget(metric: str, row: Dict[str, Any], unit: float = 1.0) -> float:
+    base, per_param, per_decorator = BUDGET[metric]
+    return (
+        base + per_param * row['params'] + per_decorator * row['decorators']
+    ) * unit
+
+
+def check(rows: Sequence[Dict[str, Any]], unit: float) -> List[str]:
+    """The endpoints whose stages are over :py:data:`BUDGET`, one line
+    each.
+    """
+    failures = []
+    for row in rows:
+        for metric in BUDGET:
+            value = row[metric]['stages']
+            budget = _budget(metric, row, unit if metric == 'time' else 1.0)
+            if value > budget:
+                failures.append(
+                    f'{row["backend"]} w/ {row["params"]} params and '
+                    f'{row["decorators"]} decorators: {metric} of stages '
+                    f'{value:.2f} over budget {budget:.2f}'
+                )
+    return failures
+
+
+def bench(
+        backends: Sequence[str] = BACKENDS,
+        counts: Sequence[int] = PARAMS,
+        decorators: Sequence[int] = DECORATORS
+) -> List[Dict[str, Any]]:
+    """Measures every combination of backend, parameter count and
+    decorator count and returns one row per combination.
+    """
+    _header()
+    rows = []
+    for backend in backends:
+        rows.extend(run(_bench_backend(backend, counts, decorators)))
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--backends', nargs='+', choices=BACKENDS, default=BACKENDS)
+    parser.add_argument('--params', nargs='+', type=int, default=PARAMS)
+    parser.add_argument('--decorators', nargs='+', type=int, choices=DECORATORS,
+                        default=DECORATORS)
+    parser.add_argument('--check', action='store_true',
+                        help='exit w/ an error if any stages are over budget')
+    args = parser.parse_args(argv)
+    unit = _unit()
+    print(f'unit {unit:.3f} us')
+    rows = bench(args.backends, args.params, args.decorators)
+    if args.check:
+        failures = check(rows, unit)
+        for failure in failures:
+            print(failure)
+        if failures:
+            raise SystemExit(1)
+        print('stages within budget')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+"""A minimal HTTP/1.1 stand-in server built on asyncio streams.
+
+It runs in-process, on a thread w/ its own event loop, so benchmarks can
+measure throughput w/o depending on a remote service.  Routes:
+
+- `/json`: a small JSON object
+- `/large?kb=<n>`: a JSON array of about `n` KiB
+- `/slow?ms=<n>`: a small JSON object after `n` milliseconds
+- `/error?status=<n>`: a small JSON error w/ status `n`
+"""
+# Standard
+from asyncio import (
+    AbstractEventLoop,
+    CancelledError,
+    IncompleteReadError,
+    StreamReader,
+    StreamWriter,
+    all_tasks,
+    current_task,
+    gather,
+    new_event_loop,
+    run_coroutine_threadsafe,
+    sleep,
+    start_server,
+)
+from functools import lru_cache
+from json import dumps
+from threading import Thread
+from typing import Callable, Dict, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+__all__ = ('LocalServer',)
+
+_JSON = b'{"hello": "world"}'
+_ERROR = b'{"error": "stand-in failure"}'
+_REASONS = {
+    200: b'OK',
+    400: b'Bad Request',
+    404: b'Not Found',
+    429: b'Too Many Requests',
+    500: b'Internal Server Error',
+    502: b'Bad Gateway',
+    503: b'Service Unavailable',
+}
+
+
+@lru_cache(maxsize=16)
+def _large_payload(kb: int) -> bytes:
+    item = {'id': 0, 'name': 'item', 'tags': ['a', 'b', 'c'], 'score': 0.5}
+    size = len(dumps(item)) + 2
+    return dumps([
+        dict(item, id=no) for no in range(max(1, kb * 1024 // size))
+    ]).encode()
+
+
+async def _json(query: Dict[str, str], body: bytes) -> Tuple[int, bytes]:
+    return 200, _JSON
+
+
+async def _large(query: Dict[str, str], body: bytes) -> Tuple[int, bytes]:
+    return 200, _large_payload(int(query.get('kb', '256')))
+
+
+async def _error(query: Dict[str, str], body: bytes) -> Tuple[int, bytes]:
+    return int(query.get('status', '500')), _ERROR
+
+
+async def _slow(query: Dict[str, str], body: bytes) -> Tuple[int, bytes]:
+    await sleep(int(query.get('ms', '10')) / 1000)
+    return 200, _JSON
+
+
+class LocalServer:
+    """Serves the stand-in routes on `127.0.0.1` for the lifetime of a
+    `with` block.
+
+    ::
+
+        with LocalServer() as server:
+            session.get(f'{server.base_url}json')
+    """
+
+    routes: Dict[str, Callable] = {
+        '/json': _json, '/large': _large, '/slow': _slow, '/error': _error,
+    }
+
+    def __init__(self, port: int = 0):
+        self.port = port
+        self.loop: AbstractEventLoop = new_event_loop()
+        self.thread = Thread(target=self.loop.run_forever, daemon=True)
+        self.server = None
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self.port}/'
+
+    async def _handle(self, reader: StreamReader, writer: StreamWriter):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                request_line, *header_lines = head.decode('latin-1').split(
+                    '\r\n'
+                )
+                method, target, _ = request_line.split(' ', 2)
+                headers = {}
+                for line in header_lines:
+                    if line:
+                        key, _, value = line.partition(':')
+                        headers[key.strip().lower()] = value.strip()
+                length = int(headers.get('content-length', 0))
+                body = await reader.readexactly(length) if length else b''
+                url = urlsplit(target)
+                route = self.routes.get(url.path)
+                if route is None:
+                    status, payload = 404, b'{}'
+                else:
+                    status, payload = await route(dict(parse_qsl(url.query)), body)
+                writer.write(
+                    b'HTTP/1.1 %d %s\r\n'
+                    b'Content-Type: application/json\r\n'
+                    b'Content-Length: %d\r\n'
+                    b'Connection: keep-alive\r\n\r\n'
+                    % (status, _REASONS.get(status, b'Unknown'), len(payload))
+                )
+                writer.write(payload)
+                await writer.drain()
+        except (CancelledError, ConnectionError, IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def __enter__(self) -> 'LocalServer':
+        self.thread.start()
+        self.server = run_coroutine_threadsafe(
+            start_server(self._handle, '127.0.0.1', self.port, backlog=4096),
+            self.loop
+        ).result()
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def _shutdown(self) -> None:
+        self.server.close()
+        tasks = all_tasks() - {current_task()}
+        for task in tasks:
+            task.cancel()
+        await gather(*tasks, return_exceptions=True)
+
+    def __exit__(self, *exc) -> None:
+        run_coroutine_threadsafe(self._shutdown(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
@@ -0,0 +1,155 @@
+# Standard
+from json import loads
+from typing import Any, Dict, Optional
+from warnings import catch_warnings, simplefilter
+
+# Third-party
+from aiohttp import ClientSession
+from httpx import AsyncClient, Client, MockTransport, Request
+from httpx import Response as HttpxResponse
+from multidict import CIMultiDict, CIMultiDictProxy
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter
+
+__all__ = (
+    'NullSession',
+    'StubAdapter',
+    'StubClientResponse',
+    'StubClientSession',
+    'stub_async_client',
+    'stub_client',
+    'stub_session',
+)
+
+BODY = b'{"hello": "world"}'
+
+
+class StubAdapter(BaseAdapter):
+    """A zero-latency `requests` transport.  Every request is answered 
+    with the same canned body, so the time spent per call is the cost of 
+    `requests` plus whatever sits on top of it.
+    """
+
+    def __init__(
+            self,
+            body: bytes = BODY,
+            status_code: int = 200,
+            headers: Optional[Dict[str, str]] = None
+    ):
+        super().__init__()
+        self.body = body
+        self.status_code = status_code
+        self.headers = headers or {'Content-Type': 'application/json'}
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        response = Response()
+        response.status_code = self.status_code
+        response.headers.update(self.headers)
+        response._content = self.body
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+class NullSession(Session):
+    """A `requests.Session` whose `request` returns a prebuilt response 
+    without touching the transport stack.  Calling it directly gives the 
+    floor that a decorated endpoint is measured against.
+    """
+
+    def __init__(self, body: bytes = BODY):
+        super().__init__()
+        self.response = Response()
+        self.response.status_code = 200
+        self.response.headers['Content-Type'] = 'application/json'
+        self.response._content = body
+        self.response.encoding = 'utf-8'
+
+    def request(self, method, url, **kwargs) -> Response:
+        return self.response
+
+
+def stub_session(**kwargs) -> Session:
+    session = Session()
+    session.mount('http://', StubAdapter(**kwargs))
+    session.mount('https://', StubAdapter(**kwargs))
+    return session
+
+
+def _transport(
+        body: bytes = BODY,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None
+) -> MockTransport:
+    headers = headers or {'Content-Type': 'application/json'}
+
+    def handler(request: Request) -> HttpxResponse:
+        return HttpxResponse(status_code, headers=headers, content=body)
+    return MockTransport(handler)
+
+
+def stub_client(**kwargs) -> Client:
+    """An `httpx.Client` on a zero-latency `httpx.MockTransport`.
+    """
+    return Client(transport=_transport(**kwargs))
+
+
+def stub_async_client(**kwargs) -> AsyncClient:
+    """An `httpx.AsyncClient` on a zero-latency `httpx.MockTransport`.
+    """
+    return AsyncClient(transport=_transport(**kwargs))
+
+
+class StubClientResponse:
+    """The parts of an `aiohttp.ClientResponse` that toboggan reads, w/ 
+    the body already in memory.
+    """
+
+    def __init__(
+            self,
+            body: bytes = BODY,
+            status: int = 200,
+            headers: Optional[Dict[str, str]] = None
+    ):
+        self.body = body
+        self.status = status
+        self.headers = CIMultiDictProxy(CIMultiDict(
+            headers or {'Content-Type': 'application/json'}
+        ))
+
+    async def read(self) -> bytes:
+        return self.body
+
+    async def text(self, encoding: str = 'utf-8') -> str:
+        return self.body.decode(encoding)
+
+    async def json(self, loads: Any = loads, **kwargs) -> Any:
+        return loads(self.body)
+
+    def release(self) -> None:
+        pass
+
+
+with catch_warnings():
+    simplefilter('ignore', DeprecationWarning)
+
+    class StubClientSession(ClientSession):
+        """An `aiohttp.ClientSession` that answers every request w/ the 
+        same :py:class:`StubClientResponse`, w/o a connector being 
+        involved.  `aiohttp` has no pluggable transport, so this stands 
+        in one level higher than the `requests` and `httpx` stubs do.  
+        Has to be created inside a running event loop.
+        """
+
+        def __init__(
+                self, response: Optional[StubClientResponse] = None, **kwargs
+        ):
+            super().__init__(**kwargs)
+            self.response = response or StubClientResponse()
+
+        async def _request(self, method: str, url: Any, **kwargs) -> Any:
+            return self.response
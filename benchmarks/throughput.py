@@ -0,0 +1,383 @@
+"""End-to-end throughput of decorated endpoints against the raw clients,
+on a local stand-in server.
+
+For each backend, route and concurrency level, the same calls are made
+through a toboggan endpoint and through the client it wraps, each side
+doing the same work: the JSON routes are decoded and the error route
+returns its status code.  Blocking clients run `concurrency` threads and
+nonblocking ones `concurrency` tasks.  Requests per second and the p50 and
+p99 latencies are printed and saved as JSON, so runs can be diffed between
+commits.  The stand-in server shares the process, so absolute numbers are
+bounded by it; the gap between toboggan and the raw client is what to
+watch.
+
+::
+
+    python -m benchmarks.throughput
+    python -m benchmarks.throughput --backends aiohttp httpx-async --concurrency 1 100
+    python -m benchmarks.throughput --compare throughput-3f2a1c0.json
+    python -m benchmarks.throughput --compare throughput-3f2a1c0.json throughput-8cd185d.json
+"""
+# Standard
+from argparse import ArgumentParser
+from asyncio import gather, run
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from itertools import count
+from json import dump, load
+from math import ceil
+from os.path import dirname
+from platform import platform, python_version
+from subprocess import CalledProcessError, check_output
+from threading import Lock
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Third-party
+from aiohttp import ClientSession, TCPConnector
+from httpx import AsyncClient, Client, Limits
+from requests import Session
+
+# Local
+from .server import LocalServer
+from toboggan import Connector, Query, get, returns
+
+BACKENDS = ('requests', 'httpx-sync', 'httpx-async', 'aiohttp',)
+CONCURRENCY = (1, 10, 100, 1000,)
+CALLS = 2_000
+ROUTES: Dict[str, Tuple[Dict[str, Any], bool]] = {
+    'json': ({}, True),
+    'large': ({'kb': 256}, True),
+    'slow': ({'ms': 10}, True),
+    'error': ({'status': 503}, False),
+}
+
+
+class Api(Connector):
+    """One endpoint per route, named `get_<route>`.
+    """
+
+    @returns.json
+    @get(path='json')
+    def get_json(self):
+        pass
+
+    @returns.json
+    @get(path='large')
+    def get_large(self, kb: Query):
+        pass
+
+    @returns.json
+    @get(path='slow')
+    def get_slow(self, ms: Query):
+        pass
+
+    @returns.status_code
+    @get(path='error')
+    def get_error(self, status: Query):
+        pass
+
+
+def _raise_fd_limit() -> None:
+    """Lifts the soft limit on open files to the hard limit, since the
+    client and the server each hold a socket per connection.
+    """
+    try:
+        from resource import RLIMIT_NOFILE, getrlimit, setrlimit
+    except ImportError:
+        return
+    soft, hard = getrlimit(RLIMIT_NOFILE)
+    if soft < hard:
+        setrlimit(RLIMIT_NOFILE, (hard, hard))
+
+
+def _summary(
+        latencies: List[float], elapsed: float, errors: int
+) -> Dict[str, Any]:
+    latencies.sort()
+
+    def quantile(value: float) -> Optional[float]:
+        if not latencies:
+            return None
+        return latencies[max(0, ceil(value * len(latencies)) - 1)] * 1e3
+
+    return dict(
+        calls=len(latencies),
+        errors=errors,
+        rps=len(latencies) / elapsed if elapsed else 0.0,
+        p50_ms=quantile(0.5),
+        p99_ms=quantile(0.99),
+    )
+
+
+def _run_sync(
+        calls: Sequence[Callable[[], Any]], total: int
+) -> Dict[str, Any]:
+    """Runs `total` calls over one thread per callable in `calls`.
+    """
+    counter = count()
+    lock = Lock()
+    latencies: List[float] = []
+    errors = [0]
+
+    def worker(call: Callable[[], Any]) -> None:
+        local: List[float] = []
+        failed = 0
+        while next(counter) < total:
+            start = perf_counter()
+            try:
+                call()
+            except Exception:
+                failed += 1
+                continue
+            local.append(perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        start = perf_counter()
+        for future in [executor.submit(worker, call) for call in calls]:
+            future.result()
+        elapsed = perf_counter() - start
+    return _summary(latencies, elapsed, errors[0])
+
+
+async def _run_async(
+        call: Callable[[], Awaitable], concurrency: int, total: int
+) -> Dict[str, Any]:
+    """Runs `total` calls over `concurrency` tasks.
+    """
+    counter = count()
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        while next(counter) < total:
+            start = perf_counter()
+            try:
+                await call()
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(perf_counter() - start)
+
+    start = perf_counter()
+    await gather(*(worker() for _ in range(concurrency)))
+    return _summary(latencies, perf_counter() - start, errors)
+
+
+def _raw_sync(
+        client: Any, base_url: str, route: str
+) -> Callable[[], Any]:
+    query, decode = ROUTES[route]
+    url = base_url + route
+    if decode:
+        return lambda: client.get(url, params=query).json()
+    return lambda: client.get(url, params=query).status_code
+
+
+def _decorated(api: Api, route: str) -> Callable[[], Any]:
+    query, _ = ROUTES[route]
+    endpoint = getattr(api, f'get_{route}')
+    return lambda: endpoint(**query)
+
+
+def _bench_sync(
+        backend: str, base_url: str, route: str, concurrency: int, total: int
+) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for variant in ('raw', 'toboggan'):
+        if backend == 'requests':
+            clients = [Session() for _ in range(concurrency)]
+        else:
+            client = Client(limits=Limits(
+                max_connections=concurrency,
+                max_keepalive_connections=concurrency
+            ))
+            clients = [client] * concurrency
+        if variant == 'raw':
+            calls = [_raw_sync(client, base_url, route) for client in clients]
+        else:
+            calls = [
+                _decorated(Api(base_url=base_url, client=client), route)
+                for client in clients
+            ]
+        _run_sync(calls, concurrency)
+        results[variant] = _run_sync(calls, total)
+        for client in {id(client): client for client in clients}.values():
+            client.close()
+    return results
+
+
+def _raw_async(
+        client: Any, base_url: str, route: str
+) -> Callable[[], Awaitable]:
+    query, decode = ROUTES[route]
+    url = base_url + route
+    if isinstance(client, ClientSession):
+
+        async def call() -> Any:
+            async with client.get(url, params=query) as response:
+                return await response.json() if decode else response.status
+    else:
+
+        async def call() -> Any:
+            response = await client.get(url, params=query)
+            return response.json() if decode else response.status_code
+    return call
+
+
+async def _bench_async(
+        backend: str, base_url: str, route: str, concurrency: int, total: int
+) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for variant in ('raw', 'toboggan'):
+        if backend == 'aiohttp':
+            client = ClientSession(connector=TCPConnector(limit=concurrency))
+        else:
+            client = AsyncClient(limits=Limits(
+                max_connections=concurrency,
+                max_keepalive_connections=concurrency
+            ))
+        if variant == 'raw':
+            call = _raw_async(client, base_url, route)
+        else:
+            call = _decorated(Api(base_url=base_url, client=client), route)
+        try:
+            await _run_async(call, concurrency, concurrency)
+            results[variant] = await _run_async(call, concurrency, total)
+        finally:
+            if backend == 'aiohttp':
+                await client.close()
+            else:
+                await client.aclose()
+    return results
+
+
+def _meta() -> Dict[str, Any]:
+    try:
+        commit = check_output(
+            ('git', 'rev-parse', '--short', 'HEAD'), cwd=dirname(__file__), text=True
+        ).strip()
+    except (CalledProcessError, OSError):
+        commit = None
+    packages = {}
+    for package in ('requests', 'httpx', 'aiohttp', 'pydantic', 'msgspec'):
+        try:
+            packages[package] = version(package)
+        except PackageNotFoundError:
+            packages[package] = None
+    return dict(
+        commit=commit,
+        timestamp=datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        python=python_version(),
+        platform=platform(),
+        packages=packages,
+    )
+
+
+def _report(row: Dict[str, Any]) -> None:
+    raw, decorated = row['raw'], row['toboggan']
+    overhead = (raw['rps'] / decorated['rps'] - 1) * 100 if decorated['rps'] \
+        else float('nan')
+    print(
+        f'{row["backend"]:<12} {row["route"]:<6} {row["concurrency"]:>5}  '
+        f'raw {raw["rps"]:8.0f} rps {raw["p50_ms"]:7.2f}/{raw["p99_ms"]:7.2f} ms  '
+        f'toboggan {decorated["rps"]:8.0f} rps '
+        f'{decorated["p50_ms"]:7.2f}/{decorated["p99_ms"]:7.2f} ms  '
+        f'overhead {overhead:6.1f}%'
+    )
+
+
+def bench(
+        base_url: str,
+        backends: Sequence[str] = BACKENDS,
+        routes: Sequence[str] = tuple(ROUTES),
+        concurrency: Sequence[int] = CONCURRENCY,
+        calls: int = CALLS
+) -> List[Dict[str, Any]]:
+    """Measures every combination of backend, route and concurrency level
+    and returns one row per combination.
+    """
+    rows = []
+    for backend in backends:
+        for route in routes:
+            for level in concurrency:
+                total = max(calls, 4 * level)
+                if backend in ('httpx-async', 'aiohttp'):
+                    results = run(_bench_async(backend, base_url, route, level, total))
+                else:
+                    results = _bench_sync(backend, base_url, route, level, total)
+                row = dict(backend=backend, route=route, concurrency=level, **results)
+                _report(row)
+                rows.append(row)
+    return rows
+
+
+def compare(base: Dict[str, Any], head: Dict[str, Any]) -> None:
+    """Prints the change in throughput and p99 latency of toboggan from
+    one run to another, for the combinations found in both.
+    """
+    def key(row: Dict[str, Any]) -> Tuple:
+        return row['backend'], row['route'], row['concurrency']
+
+    before = {key(row): row['toboggan'] for row in base['results']}
+    print(' -> '.join(
+        run['meta']['commit'] or run['meta']['timestamp'] for run in (base, head)
+    ))
+    for row in head['results']:
+        old = before.get(key(row))
+        if old is None:
+            continue
+        new = row['toboggan']
+        rps = (new['rps'] / old['rps'] - 1) * 100 if old['rps'] else float('nan')
+        p99 = (new['p99_ms'] / old['p99_ms'] - 1) * 100 if old['p99_ms'] \
+            else float('nan')
+        print(
+            f'{row["backend"]:<12} {row["route"]:<6} {row["concurrency"]:>5}  '
+            f'rps {old["rps"]:8.0f} -> {new["rps"]:8.0f} ({rps:+6.1f}%)  '
+            f'p99 {old["p99_ms"]:7.2f} -> {new["p99_ms"]:7.2f} ms ({p99:+6.1f}%)'
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--backends', nargs='+', choices=BACKENDS, default=BACKENDS)
+    parser.add_argument('--routes', nargs='+', choices=tuple(ROUTES), default=tuple(ROUTES))
+    parser.add_argument('--concurrency', nargs='+', type=int, default=CONCURRENCY)
+    parser.add_argument('--calls', type=int, default=CALLS)
+    parser.add_argument('--output', help='defaults to throughput-<commit>.json')
+    parser.add_argument(
+        '--compare', nargs='+', metavar='RESULTS',
+        help='a previous run to compare this run with, or two runs to compare'
+    )
+    args = parser.parse_args(argv)
+    if args.compare and len(args.compare) == 2:
+        with open(args.compare[0]) as base, open(args.compare[1]) as head:
+            compare(load(base), load(head))
+        return
+    _raise_fd_limit()
+    meta = _meta()
+    with LocalServer() as server:
+        rows = bench(
+            base_url=server.base_url,
+            backends=args.backends,
+            routes=args.routes,
+            concurrency=args.concurrency,
+            calls=args.calls
+        )
+    results = dict(meta=meta, results=rows)
+    output = args.output or f'throughput-{meta["commit"] or "local"}.json'
+    with open(output, 'w') as file:
+        dump(results, file, indent=2)
+    print(f'saved {output}')
+    if args.compare:
+        with open(args.compare[0]) as base:
+            compare(load(base), results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Throughput of validated and unvalidated JSON endpoints.
+
+Every endpoint decodes the same list response from a session that answers 
+without any I/O.  One returns plain JSON, the others are annotated w/ a 
+list of `pydantic.BaseModel` or `msgspec.Struct` and validate every item.
+
+::
+
+    python -m benchmarks.validation
+"""
+# Standard
+from json import dumps
+from timeit import repeat
+from typing import Callable, List
+
+# Third-party
+from msgspec import Struct
+from pydantic import BaseModel
+
+# Local
+from .stubs import NullSession
+from toboggan import Connector, get, returns
+
+NUMBER = 2_000
+ITEMS = 100
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    tags: List[str]
+    price: float
+
+
+class ItemStruct(Struct):
+    id: int
+    name: str
+    tags: List[str]
+    price: float
+
+
+class Api(Connector):
+
+    @returns.json
+    @get(path='items')
+    def get_items(self):
+        pass
+
+    @returns.json
+    @get(path='items')
+    def get_items_validated(self) -> List[Item]:
+        pass
+
+    @returns.json
+    @get(path='items')
+    def get_items_struct(self) -> List[ItemStruct]:
+        pass
+
+
+def _calls_per_second(stmt: Callable) -> float:
+    return NUMBER / min(repeat(stmt, number=NUMBER, repeat=5))
+
+
+def main() -> None:
+    body = dumps([
+        {'id': i, 'name': f'item-{i}', 'tags': ['a', 'b'], 'price': i / 3}
+        for i in range(ITEMS)
+    ]).encode()
+    api = Api(base_url='http://stub/', client=NullSession(body=body))
+    unvalidated = _calls_per_second(api.get_items)
+    print(f'{ITEMS} items per response')
+    print(f'{"unvalidated":<16} {unvalidated:10.0f} calls/s')
+    for name, method in (
+            ('pydantic', api.get_items_validated),
+            ('msgspec', api.get_items_struct),
+    ):
+        validated = _calls_per_second(method)
+        print(
+            f'{name:<16} {validated:10.0f} calls/s  '
+            f'{validated / unvalidated:5.2f}x unvalidated'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# Standard
+from io import BytesIO
+from time import sleep
+
+# Third-party
+from pytest import fixture
+from requests import Response, Session
+from requests.adapters import BaseAdapter
+
+
+class ScriptAdapter(BaseAdapter):
+    """Answers w/ each entry of `script` in turn, a status code or an
+    exception to raise, then w/ 200s.  Responses carry `headers` and
+    `body`, bytes or a callable that makes them from the request, unless
+    `respond` is set: it's called w/ each request instead and returns
+    the status code, headers and body to answer w/.  The body is served
+    from a `raw` stream built from it.  `on_send` is called w/ each
+    request before it's answered, `delay` seconds later; the `stream`
+    flag of each send and each response are kept.
+    """
+
+    def __init__(
+            self, script=(), body=b'{}', headers=None, respond=None,
+            on_send=None, raw=BytesIO, delay=0.0
+    ):
+        super().__init__()
+        self.script = list(script)
+        self.body = body
+        self.headers = headers or {}
+        self.respond = respond
+        self.on_send = on_send
+        self.raw = raw
+        self.delay = delay
+        self.hits = 0
+        self.streams = []
+        self.responses = []
+
+    def send(self, request, stream=False, **kwargs):
+        self.hits += 1
+        self.streams.append(stream)
+        if self.on_send is not None:
+            self.on_send(request)
+        if self.delay:
+            sleep(self.delay)
+        if self.respond is not None:
+            status, headers, body = self.respond(request)
+        else:
+            status = self.script.pop(0) if self.script else 200
+            if isinstance(status, Exception):
+                raise status
+            headers, body = self.headers, self.body
+            if callable(body):
+                body = body(request)
+        response = Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response.raw = self.raw(body)
+        response.url = request.url
+        response.request = request
+        self.responses.append(response)
+        return response
+
+    def close(self):
+        pass
+
+
+@fixture
+def script_session():
+    """Builds a `requests.Session` that sends through a `ScriptAdapter`,
+    and returns both.
+    """
+
+    def build(script=(), **kwargs):
+        session = Session()
+        adapter = ScriptAdapter(script, **kwargs)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session, adapter
+
+    return build
@@ -0,0 +1,58 @@
+# Standard
+from typing import Dict, List
+
+# Third-party
+from msgspec import Struct
+from pydantic import BaseModel
+from pytest import raises
+
+# Local
+from toboggan.adapters import EvalReturn
+from toboggan.adapters.evaluators import _resolve_validator, _validators
+
+
+class Item(BaseModel):
+    id: int
+
+
+def test_evaluate_model():
+    assert EvalReturn(eval_type=Item).evaluate({'id': '1'}) == Item(id=1)
+
+
+def test_evaluate_model_list():
+    assert EvalReturn(eval_type=List[Item]).evaluate([{'id': 1}]) == [Item(id=1)]
+
+
+def test_evaluate_invalid():
+    with raises(Exception):
+        EvalReturn(eval_type=Item).evaluate({'id': 'one'})
+
+
+def test_evaluate_passthrough():
+    response = {'id': 'one'}
+    assert EvalReturn(eval_type=None).evaluate(response) is response
+    assert EvalReturn(eval_type=Dict).evaluate(response) is response
+    assert EvalReturn(eval_type=List[Dict[str, int]]).evaluate(response) is response
+
+
+def test_validator_cached_per_annotation():
+    EvalReturn(eval_type=List[Item])
+    validator = _validators[List[Item]]
+    EvalReturn(eval_type=List[Item])
+    assert _resolve_validator(List[Item]) is validator
+
+
+class ItemStruct(Struct):
+    id: int
+
+
+def test_evaluate_struct():
+    evaluator = EvalReturn(eval_type=List[ItemStruct])
+    assert evaluator.validates_json
+    assert evaluator.evaluate([{'id': 1}]) == [ItemStruct(id=1)]
+    assert evaluator.evaluate_json(b'[{"id": 2}]') == [ItemStruct(id=2)]
+
+
+def test_evaluate_struct_invalid():
+    with raises(Exception):
+        EvalReturn(eval_type=ItemStruct).evaluate_json(b'{"id": "one"}')
@@ -0,0 +1,225 @@
+# Standard
+from asyncio import TimeoutError, wait_for
+from time import sleep
+
+# Third-party
+from httpx import AsyncClient, MockTransport, Response as HttpxResponse
+from pytest import mark, raises
+from requests import ConnectionError
+
+# Local
+from toboggan import (
+    CircuitOpenError,
+    Connector,
+    circuit_breaker,
+    get,
+    rate_limit,
+    retry,
+    returns,
+)
+from toboggan.aliases import AliasCircuitState
+from toboggan.clients.breakers import Breaker, Breakers, resolve_breakers
+from toboggan.models import TypeCircuitBreakerDump
+
+
+def _config(**kwargs):
+    return TypeCircuitBreakerDump(**{
+        'window_size': 4, 'minimum_calls': 4, 'open_timeout': 0.05,
+        'half_open_calls': 2, **kwargs
+    })
+
+
+def test_breaker_opens_on_failure_rate():
+    breaker = Breaker('items', _config())
+    for failed in (False, True, False):
+        breaker.acquire()
+        breaker.record(0.0, failed)
+    assert breaker.state is AliasCircuitState.CLOSED
+    breaker.acquire()
+    breaker.record_status(0.0, 503)
+    assert breaker.state is AliasCircuitState.OPEN
+    with raises(CircuitOpenError) as err:
+        breaker.acquire()
+    stats = err.value.args[0].stats
+    assert stats.name == 'items' and 0 < stats.retry_in <= 0.05
+
+
+def test_breaker_window_slides():
+    breaker = Breaker('items', _config(failure_rate_threshold=0.75))
+    for failed in (True, True, False, False, False, True):
+        breaker.record(0.0, failed)
+    assert breaker.stats().calls == 4
+    assert breaker.stats().failure_rate == 0.25
+    assert breaker.state is AliasCircuitState.CLOSED
+
+
+def test_breaker_opens_on_slow_calls():
+    breaker = Breaker('items', _config(
+        slow_call_rate_threshold=0.5, slow_call_duration=1
+    ))
+    for duration in (0.1, 2, 0.1, 3):
+        breaker.record(duration, False)
+    assert breaker.state is AliasCircuitState.OPEN
+
+
+def test_breaker_half_open_probes():
+    breaker = Breaker('items', _config())
+    for _ in range(4):
+        breaker.record(0.0, True)
+    sleep(0.06)
+    assert breaker.state is AliasCircuitState.HALF_OPEN
+    breaker.acquire()
+    breaker.acquire()
+    with raises(CircuitOpenError):
+        breaker.acquire()
+    breaker.cancel()
+    breaker.acquire()
+    breaker.record(0.0, False)
+    breaker.record(0.0, True)
+    assert breaker.state is AliasCircuitState.OPEN
+    sleep(0.06)
+    for _ in range(2):
+        breaker.acquire()
+        breaker.record(0.0, False)
+    assert breaker.state is AliasCircuitState.CLOSED
+    assert breaker.stats().calls == 0
+
+
+def test_resolve_breakers():
+    assert resolve_breakers(None) is None
+    assert resolve_breakers(False) is None
+    breakers = resolve_breakers({'open_timeout': 5})
+    assert breakers['a'] is breakers['a']
+    assert breakers['a'].config.open_timeout == 5
+    assert set(breakers.stats()) == {'a'}
+    assert resolve_breakers(breakers) is breakers
+    assert isinstance(resolve_breakers(True), Breakers)
+
+
+def test_circuit_breaker_decorator(script_session):
+
+    class Api(Connector):
+
+        @circuit_breaker(window_size=2, minimum_calls=2, open_timeout=60)
+        @returns.status_code
+        @get(path='items')
+        def get_items(self):
+            pass
+
+    session, adapter = script_session([500, ConnectionError('reset')])
+    api = Api(base_url='http://stub/', client=session)
+    assert api.get_items() == 500
+    with raises(ConnectionError):
+        api.get_items()
+    with raises(CircuitOpenError):
+        api.get_items()
+    assert adapter.hits == 2
+    breaker = Api.get_items.__toboggan_endpoint__.spec.circuit_breaker
+    assert breaker.name == 'test_circuit_breaker_decorator.<locals>.Api.get_items'
+    assert breaker.state is AliasCircuitState.OPEN
+
+
+def test_connector_breakers_per_endpoint(script_session):
+
+    class Api(Connector):
+
+        @returns.status_code
+        @get(path='one')
+        def get_one(self):
+            pass
+
+        @returns.status_code
+        @get(path='two')
+        def get_two(self):
+            pass
+
+    session, adapter = script_session([503, 503])
+    api = Api(
+        base_url='http://stub/',
+        client=session,
+        circuit_breaker={'window_size': 2, 'minimum_calls': 2}
+    )
+    api.get_one()
+    api.get_one()
+    with raises(CircuitOpenError):
+        api.get_one()
+    assert api.get_two() == 200
+    states = {
+        name.rsplit('.', 1)[-1]: stats.state
+        for name, stats in api.circuit_breakers.stats().items()
+    }
+    assert states == {
+        'get_one': AliasCircuitState.OPEN, 'get_two': AliasCircuitState.CLOSED
+    }
+
+
+def test_open_circuit_stops_retries(script_session):
+
+    class Api(Connector):
+
+        @retry(total=5, backoff_factor=0, status_forcelist=[503])
+        @circuit_breaker(window_size=2, minimum_calls=2, open_timeout=60)
+        @returns.status_code
+        @get(path='items')
+        def get_items(self):
+            pass
+
+    session, adapter = script_session([503] * 6)
+    api = Api(base_url='http://stub/', client=session)
+    with raises(CircuitOpenError):
+        api.get_items()
+    assert adapter.hits == 2
+
+
+@mark.asyncio
+async def test_circuit_breaker_async():
+
+    class Api(Connector):
+
+        @circuit_breaker(window_size=2, minimum_calls=2, open_timeout=60)
+        @returns.status_code
+        @get(path='items')
+        def get_items(self):
+            pass
+
+    async with Api(
+            base_url='http://stub/',
+            client=AsyncClient(transport=MockTransport(
+                lambda request: HttpxResponse(502)
+            ))
+    ) as api:
+        assert await api.get_items() == 502
+        assert await api.get_items() == 502
+        with raises(CircuitOpenError):
+            await api.get_items()
+
+
+@mark.asyncio
+async def test_breaker_permit_returned_when_rate_limit_wait_is_cancelled():
+
+    class Api(Connector):
+
+        @rate_limit(rate=0.1, burst=1)
+        @circuit_breaker(
+            window_size=2, minimum_calls=2, open_timeout=0.05, half_open_calls=1
+        )
+        @returns.status_code
+        @get(path='items')
+        def get_items(self):
+            pass
+
+    spec = Api.get_items.__toboggan_endpoint__.spec
+    for _ in range(2):
+        spec.circuit_breaker.record(0.0, True)
+    spec.rate_limit.reserve()
+    sleep(0.06)
+    async with Api(
+            base_url='http://stub/',
+            client=AsyncClient(transport=MockTransport(
+                lambda request: HttpxResponse(200)
+            ))
+    ) as api:
+        with raises(TimeoutError):
+            await wait_for(api.get_items(), 0.05)
+    assert spec.circuit_breaker.state is AliasCircuitState.HALF_OPEN
+    spec.circuit_breaker.acquire()
@@ -0,0 +1,209 @@
+# Standard
+from asyncio import sleep
+from json import dumps
+from time import sleep as sleep_sync
+
+# Third-party
+from httpx import AsyncClient, Client, MockTransport, Response as HttpxResponse
+from pytest import mark
+from requests import Session
+
+# Local
+from toboggan import Connector, Path, Query, cache, get, post, returns
+from toboggan.aliases import AliasCacheState
+from toboggan.clients import HttpxDriver, RequestsDriver
+from toboggan.clients.caches import ResponseCache, _parse_cache_control
+
+
+class Origin:
+    """Serves a versioned JSON document w/ an `ETag` and counts hits;
+    called w/ a `requests` request, it answers as a `ScriptAdapter`.
+    """
+
+    def __init__(self, cache_control: str = ''):
+        self.version = 1
+        self.hits = 0
+        self.not_modified = 0
+        self.cache_control = cache_control
+
+    def respond(self, url: str, if_none_match: str):
+        self.hits += 1
+        etag = f'"v{self.version}"'
+        headers = {'ETag': etag}
+        if self.cache_control:
+            headers['Cache-Control'] = self.cache_control
+        if if_none_match == etag:
+            self.not_modified += 1
+            return 304, headers, b''
+        body = dumps({'url': url, 'version': self.version}).encode()
+        return 200, headers, body
+
+    def __call__(self, request):
+        return self.respond(request.url, request.headers.get('If-None-Match'))
+
+
+def _api(ttl: float = 60, **kwargs):
+
+    class Api(Connector):
+
+        @cache(ttl=ttl, **kwargs)
+        @returns.json
+        @get(path='items/{no}')
+        def get_item(self, no: Path, q: Query = None):
+            pass
+
+        @cache(ttl=ttl)
+        @returns.json
+        @post(path='items/{no}')
+        def post_item(self, no: Path):
+            pass
+
+    return Api
+
+
+def test_parse_cache_control():
+    assert _parse_cache_control('max-age=60, No-Store, s="x"') == {
+        'max-age': '60', 'no-store': None, 's': 'x'
+    }
+    assert _parse_cache_control(None) == {}
+
+
+def test_cache_hit(script_session):
+    origin = Origin()
+    session, _ = script_session(respond=origin)
+    api = _api()(base_url='http://stub/', client=session)
+    first = api.get_item(1)
+    assert api.get_item(1) == first
+    assert api.get_item(no=1) == first
+    first['version'] = 0
+    assert api.get_item(1)['version'] == 1
+    api.get_item(1, q='a')
+    api.get_item(2)
+    assert origin.hits == 3
+
+
+def test_cache_skips_unsafe_methods(script_session):
+    origin = Origin()
+    session, _ = script_session(respond=origin)
+    api = _api()(base_url='http://stub/', client=session)
+    api.post_item(1)
+    api.post_item(1)
+    assert origin.hits == 2
+
+
+def test_cache_revalidates_w_etag(script_session):
+    origin = Origin()
+    session, _ = script_session(respond=origin)
+    api = _api(ttl=0)(base_url='http://stub/', client=session)
+    first = api.get_item(1)
+    assert api.get_item(1) == first
+    assert origin.not_modified == 1
+    origin.version = 2
+    assert api.get_item(1)['version'] == 2
+    assert origin.hits == 3
+
+
+def test_cache_control_precedence(script_session):
+    origin = Origin(cache_control='no-store')
+    session, _ = script_session(respond=origin)
+    api = _api()(base_url='http://stub/', client=session)
+    api.get_item(1)
+    api.get_item(1)
+    assert origin.hits == 2 and origin.not_modified == 0
+    origin.cache_control = 'max-age=0'
+    api.get_item(1)
+    api.get_item(1)
+    assert origin.not_modified == 1
+
+
+def test_cache_stale_while_revalidate(script_session):
+    origin = Origin()
+    session, adapter = script_session(respond=origin)
+    api = _api(ttl=0, stale_while_revalidate=60)(
+        base_url='http://stub/', client=session
+    )
+    assert api.get_item(1)['version'] == 1
+    origin.version = 2
+    assert api.get_item(1)['version'] == 1
+    for _ in range(100):
+        if origin.hits == 2:
+            break
+        sleep_sync(0.01)
+    assert api.get_item(1)['version'] == 2
+    assert adapter.hits == 1
+
+
+def test_response_cache_eviction():
+    store = ResponseCache(ttl=60, maxsize=2, maxbytes=10)
+    for key, size in (('a', 4), ('b', 4), ('c', 4)):
+        store.store(key, key, {}, size)
+    assert len(store) == 2 and store.nbytes == 8
+    assert store.lookup('a') == (None, AliasCacheState.MISS)
+    store.lookup('b')
+    store.store('d', 'd', {}, 4)
+    assert store.lookup('c')[1] is AliasCacheState.MISS
+    assert store.lookup('b')[1] is AliasCacheState.FRESH
+    store.store('e', 'e', {}, 11)
+    assert store.lookup('e')[1] is AliasCacheState.MISS
+
+
+def test_response_cache_vary():
+    store = ResponseCache(ttl=60, vary=('Authorization',))
+    one = store.key('get', 'http://stub/', {'a': [1, 2]}, {'authorization': 'x'})
+    two = store.key('GET', 'http://stub/', {'a': (1, 2)}, {'Authorization': 'y'})
+    assert one[:3] == two[:3] and one != two
+
+
+def test_cache_keyed_on_credentials(script_session):
+    origin = Origin()
+    Api = _api()
+    alice, _ = script_session(respond=origin)
+    bob, _ = script_session(respond=origin)
+    alice.headers['Authorization'] = 'Bearer alice'
+    bob.headers['Authorization'] = 'Bearer bob'
+    first = Api(base_url='http://stub/', client=alice).get_item(1)
+    origin.version = 2
+    assert Api(base_url='http://stub/', client=bob).get_item(1)['version'] == 2
+    assert Api(base_url='http://stub/', client=alice).get_item(1) == first
+    carol, _ = script_session(respond=origin)
+    carol.auth = ('carol', 'secret')
+    carol.cookies.set('session', 'carol', domain='stub')
+    Api(base_url='http://stub/', client=carol).get_item(1)
+    assert origin.hits == 3
+
+
+def test_driver_credentials():
+    session = Session()
+    session.auth = ('alice', 'secret')
+    one = RequestsDriver().credentials(session)
+    session.cookies.set('session', 'x', domain='stub')
+    assert RequestsDriver().credentials(session) != one
+    assert RequestsDriver().credentials(Session()) != one
+    client = Client(auth=('alice', 'secret'), cookies={'session': 'x'})
+    assert HttpxDriver().credentials(client) != \
+        HttpxDriver().credentials(Client(auth=('bob', 'secret')))
+    client.close()
+
+
+@mark.asyncio
+async def test_cache_async():
+    origin = Origin()
+
+    def handler(request):
+        status, headers, body = origin.respond(
+            str(request.url), request.headers.get('If-None-Match')
+        )
+        return HttpxResponse(status, headers=headers, content=body)
+
+    api = _api(ttl=0, stale_while_revalidate=60)(
+        base_url='http://stub/',
+        client=AsyncClient(transport=MockTransport(handler))
+    )
+    async with api:
+        first = await api.get_item(1)
+        assert await api.get_item(1) == first
+        for _ in range(100):
+            if origin.not_modified:
+                break
+            await sleep(0.01)
+        assert origin.not_modified == 1
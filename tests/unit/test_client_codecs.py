@@ -0,0 +1,69 @@
+# Third-party
+from pytest import raises
+
+# Local
+from toboggan import Body, Connector
+from toboggan.aliases import AliasCodecType, AliasSessionType
+from toboggan.clients.codecs import codec_modules, resolve_codec
+from toboggan.clients.resolvers import _resolve_headers, _resolve_send
+from toboggan.models import TypeKwDump, TypeKwObjDump
+
+
+def test_resolve_codec_none():
+    assert resolve_codec(None) is None
+
+
+def test_resolve_codec_auto():
+    preferred = next(
+        type_ for type_ in (
+            AliasCodecType.ORJSON, AliasCodecType.MSGSPEC, AliasCodecType.JSON,
+        ) if type_ in codec_modules
+    )
+    assert resolve_codec('auto').codec_type is preferred
+
+
+def test_resolve_codec_named():
+    for codec_type in codec_modules:
+        codec = resolve_codec(codec_type.name.lower())
+        assert codec.codec_type is codec_type
+        assert codec.loads(codec.dumps({'a': [1, 2]})) == {'a': [1, 2]}
+        assert isinstance(codec.dumps({}), bytes)
+
+
+def test_resolve_codec_unknown():
+    with raises(ModuleNotFoundError):
+        resolve_codec('yaml')
+
+
+def test_connector_codec():
+    assert Connector(codec='json').codec.codec_type is AliasCodecType.JSON
+    assert Connector().codec is None
+
+
+def test_connector_codec_reset():
+    conn = Connector(codec='json')
+    assert conn(base_url='http://stub/').codec.codec_type is AliasCodecType.JSON
+    assert conn(codec=None).codec is None
+    assert conn(codec='json').codec.codec_type is AliasCodecType.JSON
+
+
+def test_resolve_send_encoded():
+    codec = resolve_codec('json')
+    kw_dump = TypeKwDump(dump={
+        'body': TypeKwObjDump(sig_type=Body, kw_value={'key': 'value'})
+    })
+    assert _resolve_send(
+        kw_dump, codec=codec, client_type=AliasSessionType.REQUESTS
+    ) == {'data': b'{"key":"value"}'}
+    assert _resolve_send(
+        kw_dump, codec=codec, client_type=AliasSessionType.HTTPX_SYNC
+    ) == {'content': b'{"key":"value"}'}
+
+
+def test_resolve_headers_content_type():
+    assert _resolve_headers({}, {}, 'application/json') == {
+        'Content-Type': 'application/json'
+    }
+    assert _resolve_headers({'content-type': 'text/json'}, {}, 'application/json') == {
+        'content-type': 'text/json'
+    }
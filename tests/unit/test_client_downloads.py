@@ -0,0 +1,129 @@
+# Standard
+from hashlib import md5, sha256
+from io import BytesIO
+from os import umask
+
+# Third-party
+from httpx import AsyncClient, MockTransport, Response as HttpxResponse
+from pytest import mark, raises
+
+# Local
+from toboggan import Connector, Path, get, returns
+from toboggan.clients.downloads import Download
+from toboggan.models import TypeDownloadDump
+
+REPORT = b'id,name\n' + b''.join(b'%d,row-%d\n' % (no, no) for no in range(5000))
+
+
+class BrokenRaw(BytesIO):
+    """A raw body whose connection drops after its first kilobyte."""
+
+    def read(self, *args, **kwargs):
+        if self.tell() > 1000:
+            raise OSError('connection reset')
+        return super().read(*args, **kwargs)
+
+
+def _api(target, session, **kwargs):
+
+    class Reports(Connector):
+
+        @returns.file(target, chunk_size=4096, **kwargs)
+        @get(path='reports/{name}')
+        def get_report(self, name: Path):
+            pass
+
+    return Reports(base_url='http://stub/', client=session)
+
+
+def _report(script_session, script=(), **kwargs):
+    return script_session(
+        script, body=REPORT,
+        headers={'Content-Length': str(len(REPORT))}, **kwargs
+    )
+
+
+def test_download_commit_and_abort(tmp_path):
+    target = tmp_path / 'report.csv'
+    download = Download(TypeDownloadDump(target=target, hash_algorithm='md5'))
+    download.write(REPORT[:10])
+    assert not target.exists() and len(list(tmp_path.iterdir())) == 1
+    download.write(REPORT[10:])
+    dump = download.commit()
+    assert dump.path == str(target) and dump.size == len(REPORT)
+    assert dump.hash == md5(REPORT).hexdigest() and dump.hash_algorithm == 'md5'
+    assert target.read_bytes() == REPORT
+    aborted = Download(TypeDownloadDump(target=target))
+    aborted.write(b'partial')
+    aborted.abort()
+    assert list(tmp_path.iterdir()) == [target]
+    assert target.read_bytes() == REPORT
+
+
+def test_download_commit_failure_and_mode(tmp_path):
+    target = tmp_path / 'report.csv'
+    target.mkdir()
+    download = Download(TypeDownloadDump(target=target))
+    download.write(REPORT)
+    with raises(OSError):
+        download.commit()
+    assert list(tmp_path.iterdir()) == [target]
+    target.rmdir()
+    download = Download(TypeDownloadDump(target=target))
+    download.write(REPORT)
+    download.commit()
+    mask = umask(0)
+    umask(mask)
+    assert target.stat().st_mode & 0o777 == 0o666 & ~mask
+
+
+def test_download_requests(tmp_path, script_session):
+    target = tmp_path / 'report.csv'
+    seen = []
+    session, adapter = _report(script_session)
+    api = _api(target, session, progress=lambda size, total: seen.append((size, total)))
+    dump = api.get_report('daily')
+    assert adapter.streams == [True]
+    assert dump.path == str(target) and dump.size == len(REPORT)
+    assert dump.hash == sha256(REPORT).hexdigest()
+    assert target.read_bytes() == REPORT
+    assert seen[0] == (4096, len(REPORT)) and seen[-1] == (len(REPORT), len(REPORT))
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_download_failures_keep_target(tmp_path, script_session):
+    target = tmp_path / 'report.csv'
+    target.write_bytes(b'previous')
+    session, _ = _report(script_session, [404])
+    with raises(RuntimeError) as err:
+        _api(target, session).get_report('daily')
+    assert err.value.args[0].status_code == 404
+    session, _ = _report(script_session, raw=BrokenRaw)
+    with raises(OSError):
+        _api(target, session).get_report('daily')
+    assert list(tmp_path.iterdir()) == [target]
+    assert target.read_bytes() == b'previous'
+    with raises(ValueError):
+        returns.file(target, hash_algorithm='nope')
+
+
+@mark.asyncio
+async def test_download_async_to_file_object():
+    buffer = BytesIO()
+
+    class Reports(Connector):
+
+        @returns.file(buffer, chunk_size=1000)
+        @get(path='reports/{name}')
+        def get_report(self, name: Path):
+            pass
+
+    async with Reports(
+            base_url='http://stub/',
+            client=AsyncClient(transport=MockTransport(
+                lambda request: HttpxResponse(200, content=REPORT)
+            ))
+    ) as api:
+        dump = await api.get_report('daily')
+    assert dump.path is None and dump.size == len(REPORT)
+    assert buffer.getvalue() == REPORT
@@ -0,0 +1,113 @@
+# Standard
+from gc import collect
+from json import dumps
+from weakref import ref
+
+# Third-party
+from aiohttp import ClientSession
+from httpx import AsyncClient, Client
+from pytest import mark, raises
+from requests import Session
+
+# Local
+from toboggan import Connector, Driver, Path, drivers, get, returns
+from toboggan.aliases import AliasSessionType
+from toboggan.clients import (
+    AiohttpDriver,
+    HttpxAsyncDriver,
+    HttpxDriver,
+    RequestsDriver,
+    resolve_client_type,
+    resolve_driver,
+)
+
+
+class CountingSession(Session):
+    pass
+
+
+class CountingDriver(RequestsDriver):
+    __slots__ = ('sent',)
+
+    def __init__(self):
+        self.sent = 0
+
+    def send(self, session, request):
+        self.sent += 1
+        return super().send(session, request)
+
+
+class Httpbin(Connector):
+
+    @returns.json
+    @get(path='anything/{no}')
+    def get_anything(self, no: Path):
+        pass
+
+
+def test_resolve_driver():
+    assert isinstance(resolve_driver(Session()), RequestsDriver)
+    assert isinstance(resolve_driver(Session), RequestsDriver)
+    assert isinstance(resolve_driver(CountingSession), RequestsDriver)
+    assert isinstance(resolve_driver(Client), HttpxDriver)
+    assert isinstance(resolve_driver(AsyncClient), HttpxAsyncDriver)
+    assert isinstance(resolve_driver(ClientSession), AiohttpDriver)
+    assert resolve_driver(AsyncClient).nonblocking
+    assert resolve_driver(ClientSession).awaits_body
+    with raises(ModuleNotFoundError):
+        resolve_driver(object())
+
+
+def test_resolve_client_type_w_alternating_clients():
+    sessions = [Session(), Client()]
+    for _ in range(3):
+        assert [resolve_client_type(session) for session in sessions] == [
+            AliasSessionType.REQUESTS, AliasSessionType.HTTPX_SYNC
+        ]
+    session = Session()
+    resolve_client_type(session)
+    alive = ref(session)
+    del session
+    collect()
+    assert alive() is None
+
+
+def test_driver_resolved_on_assignment():
+    httpbin = Httpbin(base_url='http://stub/', client=Session())
+    assert isinstance(httpbin.driver, RequestsDriver)
+    httpbin.client = Client()
+    assert isinstance(httpbin.driver, HttpxDriver)
+    assert httpbin.client_type is AliasSessionType.HTTPX_SYNC
+    with raises(ModuleNotFoundError):
+        httpbin.client = object()
+    assert isinstance(httpbin.driver, HttpxDriver)
+    httpbin.close()
+
+
+def test_registered_driver(script_session):
+    driver = drivers.register(CountingSession, CountingDriver())
+    _, adapter = script_session(
+        body=lambda request: dumps({'url': request.url}).encode()
+    )
+    session = CountingSession()
+    session.mount('http://', adapter)
+    httpbin = Httpbin(base_url='http://stub/', client=session)
+    assert httpbin.driver is driver
+    assert httpbin.get_anything(1) == {'url': 'http://stub/anything/1'}
+    assert httpbin.prepare(httpbin.get_anything, 2).send_many(3) == \
+        [{'url': 'http://stub/anything/2'}] * 3
+    assert driver.sent == 4
+
+
+@mark.asyncio
+async def test_driver_nonblocking_close():
+    httpbin = Httpbin(client=AsyncClient())
+    with raises(TypeError):
+        httpbin.close()
+    await httpbin.aclose()
+
+
+def test_driver_base_class():
+    assert Driver.client_type is AliasSessionType.REQUESTS
+    assert not Driver.nonblocking
+    assert repr(HttpxDriver()) == 'HttpxDriver()'
@@ -0,0 +1,153 @@
+# Standard
+from asyncio import sleep
+from json import dumps
+from threading import current_thread
+
+# Third-party
+from httpx import AsyncClient
+from pytest import fixture, mark, raises
+
+# Local
+from toboggan import Connector, Path, get, returns
+from toboggan.clients.fanout import _clone_session
+
+
+class Api(Connector):
+
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.peak = 0
+        self.completed = 0
+
+    async def double(self, value: int, delay: float = 0):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await sleep(delay)
+            if value < 0:
+                raise ValueError(value)
+            self.completed += 1
+            return value * 2
+        finally:
+            self.in_flight -= 1
+
+
+@mark.asyncio
+async def test_amap_ordered():
+    api = Api()
+    arguments = [{'value': i, 'delay': (10 - i) / 1000} for i in range(10)]
+    results = [result async for result in api.amap(api.double, arguments, limit=4)]
+    assert results == [i * 2 for i in range(10)]
+    assert api.peak <= 4
+
+
+@mark.asyncio
+async def test_amap_as_completed():
+    api = Api()
+    arguments = [(i, (3 - i) / 100) for i in range(3)]
+    results = [
+        result async for result in api.amap(
+            api.double, arguments, limit=3, ordered=False
+        )
+    ]
+    assert results == [4, 2, 0]
+
+
+@mark.asyncio
+async def test_amap_async_iterable_and_unbound_endpoint():
+
+    async def arguments():
+        for i in range(5):
+            yield i
+
+    api = Api()
+    results = [result async for result in api.amap(Api.double, arguments())]
+    assert results == [0, 2, 4, 6, 8]
+
+
+@mark.asyncio
+async def test_amap_cancels_on_first_error():
+    api = Api()
+    arguments = [(-1, 0)] + [(i, 1) for i in range(1, 6)]
+    with raises(ValueError):
+        async for _ in api.amap(api.double, arguments, limit=3):
+            pass
+    assert api.in_flight == 0
+    assert api.completed == 0
+
+
+def test_amap_limit():
+    with raises(ValueError):
+        Api().amap(Api.double, [], limit=0)
+
+
+class Httpbin(Connector):
+
+    @returns.json
+    @get(path='anything/{no}')
+    def get_anything(self, no: Path):
+        pass
+
+
+def _echo(request):
+    return dumps({
+        'url': request.url,
+        'thread': current_thread().name,
+        'user_agent': request.headers.get('User-Agent'),
+    }).encode()
+
+
+@fixture
+def fixture_session(script_session):
+    session, _ = script_session(body=_echo)
+    session.headers['User-Agent'] = 'toboggan'
+    return session
+
+
+def test_map_ordered_w_session_clones(fixture_session):
+    session = fixture_session
+    httpbin = Httpbin(base_url='http://stub/', client=session)
+    results = list(httpbin.map(httpbin.get_anything, range(1, 21), limit=4))
+    assert [result['url'] for result in results] == [
+        f'http://stub/anything/{no}' for no in range(1, 21)
+    ]
+    assert {result['user_agent'] for result in results} == {'toboggan'}
+    assert len({result['thread'] for result in results}) <= 4
+    assert httpbin.client is session
+
+
+def test_map_as_completed(fixture_session):
+    httpbin = Httpbin(base_url='http://stub/', client=fixture_session)
+    results = httpbin.map(
+        Httpbin.get_anything, ({'no': no} for no in range(1, 11)), ordered=False
+    )
+    assert sorted(result['url'] for result in results) == sorted(
+        f'http://stub/anything/{no}' for no in range(1, 11)
+    )
+
+
+def test_map_requires_blocking_client():
+    with raises(TypeError):
+        Httpbin(client=AsyncClient()).map(Httpbin.get_anything, [])
+
+
+def test_clone_session(fixture_session):
+    session = fixture_session
+    clone = _clone_session(session)
+    assert clone is not session
+    assert clone.headers == session.headers
+    assert clone.headers is not session.headers
+    assert clone.adapters['http://'] is not session.adapters['http://']
+
+
+def test_map_raises_first_error(fixture_session):
+
+    def explode(self, no):
+        if no == 3:
+            raise ValueError(no)
+        return no
+
+    httpbin = Httpbin(base_url='http://stub/', client=fixture_session)
+    with raises(ValueError):
+        list(httpbin.map(explode, range(1, 10), limit=2))
@@ -0,0 +1,169 @@
+# Standard
+from asyncio import CancelledError, create_task, gather, sleep
+from concurrent.futures import ThreadPoolExecutor
+from json import dumps
+from threading import Barrier
+
+# Third-party
+from httpx import AsyncClient, MockTransport, Response as HttpxResponse
+from pytest import mark, raises
+
+# Local
+from toboggan import Body, Connector, Path, coalesce, get, post, returns
+from toboggan.clients.flights import SingleFlight, _flight_key
+
+
+class Counter:
+
+    def __init__(self):
+        self.hits = 0
+
+    def count(self, request):
+        self.hits += 1
+
+    def body(self, request):
+        return dumps({'hit': self.hits}).encode()
+
+
+def _async_client(counter: Counter, delay: float = 0.05) -> AsyncClient:
+
+    async def handler(request):
+        counter.hits += 1
+        await sleep(delay)
+        if request.url.path.endswith('/13'):
+            return HttpxResponse(500, content=b'not json')
+        return HttpxResponse(200, json={'hit': counter.hits})
+
+    return AsyncClient(transport=MockTransport(handler))
+
+
+class Api(Connector):
+
+    @coalesce
+    @returns.json
+    @get(path='items/{no}')
+    def get_item(self, no: Path):
+        pass
+
+    @coalesce
+    @returns.json
+    @post(path='items')
+    def post_item(self, body: Body):
+        pass
+
+    @returns.json
+    @get(path='plain/{no}')
+    def get_plain(self, no: Path):
+        pass
+
+    @coalesce(enabled=False)
+    @returns.json
+    @get(path='opted-out/{no}')
+    def get_opted_out(self, no: Path):
+        pass
+
+    @coalesce
+    @get(path='raw/{no}')
+    def get_raw(self, no: Path):
+        pass
+
+
+def test_flight_key():
+    session = object()
+    one = _flight_key(session, 'get', 'u', {'a': 1}, {'X': '1'}, {'json': {'b': 1, 'c': 2}})
+    two = _flight_key(session, 'GET', 'u', {'a': '1'}, {'x': 1}, {'json': {'c': 2, 'b': 1}})
+    assert one == two
+    assert one != _flight_key(session, 'GET', 'u', {'a': 1}, {'X': '1'}, {'json': {'b': 2}})
+    assert one != _flight_key(object(), 'GET', 'u', {'a': 1}, {'X': '1'}, {'json': {'b': 1, 'c': 2}})
+
+
+@mark.asyncio
+async def test_coalesce_async():
+    counter = Counter()
+    async with Api(base_url='http://stub/', client=_async_client(counter)) as api:
+        results = await gather(*(api.get_item(1) for _ in range(50)))
+        assert counter.hits == 1
+        assert all(result is results[0] for result in results)
+        await gather(api.get_item(1), api.get_item(2))
+        assert counter.hits == 3
+        await gather(*(api.post_item({'a': 1}) for _ in range(3)))
+        assert counter.hits == 6
+
+
+@mark.asyncio
+async def test_coalesce_async_error_and_cancel():
+    counter = Counter()
+    async with Api(base_url='http://stub/', client=_async_client(counter)) as api:
+        results = await gather(
+            *(api.get_item(13) for _ in range(5)), return_exceptions=True
+        )
+        assert counter.hits == 1
+        assert all(isinstance(result, Exception) for result in results)
+        first = create_task(api.get_item(3))
+        second = create_task(api.get_item(3))
+        await sleep(0.01)
+        first.cancel()
+        with raises(CancelledError):
+            await first
+        assert (await second) == {'hit': 2}
+
+
+@mark.asyncio
+async def test_coalesce_connector_setting():
+    counter = Counter()
+    async with Api(
+            base_url='http://stub/', client=_async_client(counter), coalesce=True
+    ) as api:
+        await gather(*(api.get_plain(1) for _ in range(5)))
+        assert counter.hits == 1
+        await gather(*(api.get_opted_out(1) for _ in range(5)))
+        assert counter.hits == 6
+
+
+def test_coalesce_threads(script_session):
+    counter = Counter()
+    session, _ = script_session(
+        body=counter.body, on_send=counter.count, delay=0.05
+    )
+    api = Api(base_url='http://stub/', client=session)
+    barrier = Barrier(8)
+
+    def call(_):
+        barrier.wait()
+        return api.get_item(1)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(call, range(8)))
+    assert counter.hits == 1
+    assert all(result is results[0] for result in results)
+    api.get_item(1)
+    assert counter.hits == 2
+
+
+def test_coalesce_skips_raw_responses(script_session):
+    counter = Counter()
+    session, _ = script_session(
+        body=counter.body, on_send=counter.count, delay=0.05
+    )
+    api = Api(base_url='http://stub/', client=session)
+    barrier = Barrier(4)
+
+    def call(_):
+        barrier.wait()
+        return api.get_raw(1)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(executor.map(call, range(4)))
+    assert counter.hits == 4
+    assert len({id(response) for response in responses}) == 4
+
+
+def test_single_flight_sync_error():
+    flights = SingleFlight()
+
+    def fail():
+        raise ValueError('boom')
+
+    with raises(ValueError):
+        flights.run_sync('key', fail)
+    assert len(flights) == 0
@@ -0,0 +1,155 @@
+# Standard
+from asyncio import gather, sleep
+from io import StringIO
+from json import loads
+
+# Third-party
+from httpx import AsyncClient, MockTransport, Response as HttpxResponse
+from pydantic import BaseModel
+from pytest import mark, raises
+from requests import ConnectionError
+
+# Local
+from toboggan import (
+    Body, ChromeTrace, Connector, Hooks, Path, get, post, retry, returns, sends,
+)
+from toboggan.models import TypeTimingDump
+
+BODY = b'{"id": 1, "name": "bulbasaur"}'
+
+
+class Pokemon(BaseModel):
+    id: int
+    name: str
+
+
+class PokeApi(Connector):
+
+    @returns.json
+    @get(path='pokemon/{id_}')
+    def get_pokemon(self, id_: Path) -> Pokemon:
+        pass
+
+    @retry(total=2, backoff_factor=0, status_forcelist=[503])
+    @sends.json
+    @returns.json(key='name')
+    @post(path='pokemon')
+    def post_pokemon(self, body: Body):
+        pass
+
+    @returns.stream.bytes
+    @get(path='pokemon/{id_}')
+    def stream_pokemon(self, id_: Path):
+        pass
+
+    @get(path='pokemon/{id_}')
+    def get_response(self, id_: Path):
+        pass
+
+
+def _api(script_session, script=(), **kwargs):
+    session, _ = script_session(script, body=BODY)
+    return PokeApi(base_url='http://stub/', client=session, **kwargs)
+
+
+def test_no_hooks(script_session):
+    api = _api(script_session)
+    assert api.hooks is None
+    assert api.get_pokemon(1) == Pokemon(id=1, name='bulbasaur')
+    assert not Hooks() and Hooks(on_error=print)
+    with raises(ValueError):
+        Hooks().register('on_send', print)
+
+
+def test_hooks_leave_raw_bodies_unread(script_session):
+    timings = []
+    session, _ = script_session(body=BODY)
+    session.stream = True
+    api = PokeApi(base_url='http://stub/', client=session)
+    api.on_response(timings.append)
+    response = api.get_response(1)
+    assert response.raw.tell() == 0
+    sized, _ = script_session(
+        body=BODY, headers={'Content-Length': str(len(BODY))}
+    )
+    api.client = sized
+    api.get_response(1)
+    assert [timing.bytes_received for timing in timings] == [None, len(BODY)]
+
+
+def test_hooks_timings(script_session):
+    events = []
+    api = _api(script_session, hooks={'on_request': lambda timing: events.append(('request', timing))})
+    api.on_response(lambda timing: events.append(('response', timing)))
+    assert api.get_pokemon(1).name == 'bulbasaur'
+    (_, sending), (_, timing) = events
+    assert isinstance(timing, TypeTimingDump)
+    assert sending.sent is not None and sending.received is None
+    assert timing.endpoint == 'PokeApi.get_pokemon'
+    assert timing.method == 'GET' and timing.url == 'http://stub/pokemon/1'
+    assert timing.status_code == 200 and timing.attempts == 1
+    assert timing.bytes_sent == 0 and timing.bytes_received == len(BODY)
+    stamps = [timing.started, timing.bound, timing.resolved, timing.sent,
+              timing.received, timing.validated, timing.finished]
+    assert stamps == sorted(stamps) and timing.decoded is None
+    durations = timing.durations()
+    assert set(durations) == {
+        'bind', 'resolve', 'wait', 'network', 'validate', 'total',
+    }
+    assert durations['total'] >= durations['network'] >= 0
+
+
+def test_hooks_retries_and_errors(script_session):
+    retries, responses, errors = [], [], []
+    hooks = Hooks(on_retry=retries.append, on_response=responses.append)
+    hooks.register('on_error', errors.append)
+    api = _api(script_session, [503], hooks=hooks)
+    assert api.post_pokemon({'name': 'bulbasaur'}) == 'bulbasaur'
+    assert [timing.status_code for timing in retries] == [503]
+    (timing,) = responses
+    assert timing.attempts == 2 and timing.status_code == 200
+    assert timing.bytes_sent == len(b'{"name": "bulbasaur"}')
+    assert timing.decoded is not None
+    with raises(ConnectionError):
+        _api(
+            script_session, [ConnectionError('connection reset')], hooks=hooks
+        ).get_pokemon(1)
+    (timing,) = errors
+    assert isinstance(timing.error, ConnectionError)
+    assert timing.received is None and timing.finished is not None
+
+
+def test_hooks_streams(script_session):
+    responses = []
+    api = _api(script_session, hooks=Hooks(on_response=responses.append))
+    assert b''.join(api.stream_pokemon(1)) == BODY
+    (timing,) = responses
+    assert timing.bytes_received == len(BODY) and timing.error is None
+
+
+@mark.asyncio
+async def test_chrome_trace():
+
+    async def handler(request):
+        await sleep(0.01)
+        return HttpxResponse(200, content=BODY)
+
+    trace = ChromeTrace()
+    async with PokeApi(
+            base_url='http://stub/',
+            client=AsyncClient(transport=MockTransport(handler)),
+            hooks=trace
+    ) as api:
+        await gather(*(api.get_pokemon(no) for no in range(1, 4)))
+        await api.get_pokemon(4)
+    assert len(trace.timings) == 4
+    events = trace.events()
+    calls = [event for event in events if event['cat'] == 'request']
+    assert sorted(event['tid'] for event in calls) == [0, 0, 1, 2]
+    assert {event['name'] for event in events if event['cat'] == 'stage'} == {
+        'bind', 'resolve', 'wait', 'network', 'validate',
+    }
+    assert all(event['ph'] == 'X' and event['dur'] >= 0 for event in events)
+    file = StringIO()
+    trace.dump(file)
+    assert loads(file.getvalue())['traceEvents'] == events
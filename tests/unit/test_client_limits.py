@@ -0,0 +1,137 @@
+# Standard
+from asyncio import gather
+from time import perf_counter, sleep, time
+
+# Third-party
+from httpx import AsyncClient, MockTransport, Response as HttpxResponse
+from pytest import approx, mark, raises
+
+# Local
+from toboggan import Connector, get, rate_limit, returns
+from toboggan.clients.limits import RateLimiter, _quota
+
+
+shared = rate_limit(rate=1, burst=5)
+
+
+@rate_limit(rate=1, burst=10)
+class Api(Connector):
+
+    @shared
+    @returns.status_code
+    @get(path='one')
+    def get_one(self):
+        pass
+
+    @shared
+    @returns.status_code
+    @get(path='two')
+    def get_two(self):
+        pass
+
+    @returns.status_code
+    @get(path='three')
+    def get_three(self):
+        pass
+
+
+def test_rate_limiter_reserve():
+    limiter = RateLimiter(rate=10, burst=2)
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == approx(0.1, abs=0.01)
+    assert limiter.reserve() == approx(0.2, abs=0.01)
+    with raises(ValueError):
+        RateLimiter(rate=0)
+
+
+def test_quota():
+    assert _quota({}) is None
+    assert _quota({'X-RateLimit-Remaining': '5'}) == (5, None)
+    assert _quota({'RateLimit-Remaining': '5', 'RateLimit-Reset': '30'}) == (5, 30)
+    remaining, reset = _quota({
+        'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(int(time()) + 60)
+    })
+    assert remaining == 0 and 58 < reset <= 60
+
+
+def test_rate_limiter_update():
+    limiter = RateLimiter(rate=100, burst=100)
+    limiter.update({'X-RateLimit-Remaining': '50', 'X-RateLimit-Reset': '10'})
+    assert limiter.rate == 5
+    assert limiter.tokens == approx(50, abs=1)
+    limiter.update({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '2'})
+    assert limiter.reserve() == approx(2, abs=0.1)
+    fixed = RateLimiter(rate=100, adaptive=False)
+    fixed.update({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '2'})
+    assert fixed.rate == 100
+
+
+def test_rate_limiter_update_never_raises_rate():
+    limiter = RateLimiter(rate=1, burst=5)
+    limiter.update({'X-RateLimit-Remaining': '5000', 'X-RateLimit-Reset': '60'})
+    assert limiter.rate == 1
+    assert repr(limiter) == 'RateLimiter(rate=1, burst=5, adaptive=True)'
+
+
+def test_rate_limiter_update_restores_rate():
+    limiter = RateLimiter(rate=100, burst=100)
+    limiter.update({'X-RateLimit-Remaining': '1', 'X-RateLimit-Reset': '0.1'})
+    assert limiter.rate == approx(10)
+    sleep(0.15)
+    assert limiter.rate == 100
+    assert limiter.tokens == approx(7, abs=2)
+
+
+def test_rate_limit_levels(script_session):
+    session, _ = script_session()
+    api = Api(base_url='http://stub/', client=session)
+    api.get_one()
+    api.get_two()
+    api.get_three()
+    assert Api.rate_limiter.tokens == approx(7, abs=0.5)
+    one = Api.get_one.__toboggan_endpoint__.spec.rate_limit
+    assert one is Api.get_two.__toboggan_endpoint__.spec.rate_limit
+    assert one.tokens == approx(3, abs=0.5)
+    assert Api.get_three.__toboggan_endpoint__.spec.rate_limit is None
+
+
+def test_rate_limit_adapts_to_headers(script_session):
+
+    @rate_limit(rate=1000)
+    class Quota(Connector):
+
+        @returns.status_code
+        @get(path='items')
+        def get_items(self):
+            pass
+
+    session, _ = script_session(headers={
+        'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '30'
+    })
+    api = Quota(base_url='http://stub/', client=session)
+    api.get_items()
+    assert Quota.rate_limiter.rate == approx(1 / 30)
+    assert Quota.rate_limiter.reserve() == approx(30, abs=0.5)
+
+
+@mark.asyncio
+async def test_rate_limit_async():
+
+    @rate_limit(rate=50, burst=1, adaptive=False)
+    class Limited(Connector):
+
+        @returns.status_code
+        @get(path='items')
+        def get_items(self):
+            pass
+
+    async with Limited(
+            base_url='http://stub/',
+            client=AsyncClient(transport=MockTransport(
+                lambda request: HttpxResponse(200)
+            ))
+    ) as api:
+        started = perf_counter()
+        assert await gather(*(api.get_items() for _ in range(5))) == [200] * 5
+        assert perf_counter() - started >= 0.07
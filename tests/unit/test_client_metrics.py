@@ -0,0 +1,112 @@
+# Standard
+from random import Random
+
+# Third-party
+from pytest import raises
+from requests import ConnectionError
+
+# Local
+from toboggan import (
+    ChromeTrace, Connector, Metrics, Path, get, retry, returns, shared_metrics,
+)
+from toboggan.clients import Histogram
+
+BODY = b'{"id": 1, "name": "bulbasaur"}'
+
+
+class PokeApi(Connector):
+
+    @retry(total=2, backoff_factor=0, status_forcelist=[503])
+    @returns.json
+    @get(path='pokemon/{id_}')
+    def get_pokemon(self, id_: Path):
+        pass
+
+    @returns.status_code
+    @get(path='pokemon/{id_}')
+    def get_status(self, id_: Path):
+        pass
+
+
+def _api(script_session, script=(), on_send=None, **kwargs):
+    session, _ = script_session(script, body=BODY, on_send=on_send)
+    return PokeApi(base_url='http://stub/', client=session, **kwargs)
+
+
+def test_histogram_quantiles():
+    histogram = Histogram(unit=1e-6)
+    assert histogram.quantile(0.5) is None
+    values = [Random(7).lognormvariate(-4, 1.5) for _ in range(20000)]
+    for value in values:
+        histogram.record(value)
+    values.sort()
+    for quantile in (0.5, 0.9, 0.99, 0.999):
+        exact = values[int(quantile * len(values)) - 1]
+        assert abs(histogram.quantile(quantile) - exact) / exact < 0.01
+    dump = histogram.dump()
+    assert dump.count == 20000 and dump.min == values[0] and dump.max == values[-1]
+    assert abs(dump.sum - sum(values)) < 1e-6
+    exact = Histogram()
+    for value in range(200):
+        exact.record(value)
+    assert exact.quantile(0.5) == 99 and exact.quantile(1) == 199
+
+
+def test_metrics(script_session):
+    metrics = Metrics()
+    in_flight = []
+    api = _api(
+        script_session,
+        [503, 200, 404],
+        on_send=lambda request: in_flight.append(
+            metrics.as_dict()['PokeApi']['get_pokemon']['in_flight']
+        ),
+        metrics=metrics
+    )
+    api.get_pokemon(1)
+    api.get_status(1)
+    api.get_status(1)
+    assert in_flight == [1, 1, 0, 0]
+    stats = metrics.as_dict()['PokeApi']
+    assert stats['get_pokemon']['requests'] == {'200': 1}
+    assert stats['get_pokemon']['retries'] == 1
+    assert stats['get_pokemon']['in_flight'] == 0
+    assert stats['get_pokemon']['latency']['count'] == 1
+    assert stats['get_pokemon']['response_size']['p50'] == len(BODY)
+    assert stats['get_status']['requests'] == {'200': 1, '404': 1}
+    with raises(ConnectionError):
+        _api(
+            script_session, [ConnectionError('reset')], metrics=metrics
+        ).get_status(1)
+    (_, status) = metrics.stats()
+    assert status.requests == {'200': 1, '404': 1, 'error': 1}
+    assert status.in_flight == 0 and status.latency.count == 3
+    metrics.reset()
+    assert metrics.stats() == []
+
+
+def test_metrics_prometheus(script_session):
+    metrics = Metrics(namespace='poke')
+    api = _api(script_session, metrics=metrics)
+    api.get_pokemon(1)
+    text = metrics.prometheus()
+    labels = 'connector="PokeApi",method="get_pokemon"'
+    assert '# TYPE poke_requests_total counter' in text
+    assert f'poke_requests_total{{{labels},status="200"}} 1' in text
+    assert f'poke_retries_total{{{labels}}} 0' in text
+    assert f'poke_in_flight_requests{{{labels}}} 0' in text
+    assert '# TYPE poke_request_duration_seconds summary' in text
+    assert f'poke_request_duration_seconds{{{labels},quantile="0.99"}}' in text
+    assert f'poke_response_size_bytes_count{{{labels}}} 1' in text
+    assert text.endswith('\n')
+
+
+def test_metrics_w_hooks(script_session):
+    trace = ChromeTrace()
+    api = _api(script_session, hooks=trace, metrics=True)
+    assert api.metrics is shared_metrics and api.hooks is not trace
+    before = sum(stats.latency.count for stats in shared_metrics.stats())
+    api.get_pokemon(1)
+    assert len(trace.timings) == 1
+    assert sum(stats.latency.count for stats in shared_metrics.stats()) == before + 1
+    assert _api(script_session).hooks is None
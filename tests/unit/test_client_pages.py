@@ -0,0 +1,188 @@
+# Standard
+from json import dumps
+from time import perf_counter, sleep
+from typing import AsyncIterator, Iterator, List
+from urllib.parse import parse_qs, urlsplit
+
+# Third-party
+from httpx import AsyncClient, MockTransport, Response as HttpxResponse
+from pydantic import BaseModel
+from pytest import mark
+
+# Local
+from toboggan import Connector, Metrics, Query, get, paginate, returns
+from toboggan.clients.pages import _item_type, _next_link
+
+ITEMS = [{'id': no} for no in range(1, 24)]
+
+
+class Item(BaseModel):
+    id: int
+
+
+def _serve(url):
+    """A paginated API over `ITEMS`: `/cursor`, `/link` and `/offset`."""
+    parts = urlsplit(url)
+    query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+    headers = {}
+    if parts.path == '/offset':
+        offset, limit = int(query['offset']), int(query['limit'])
+        body = {'count': len(ITEMS), 'results': ITEMS[offset:offset + limit]}
+    else:
+        start = int(query.get('cursor') or query.get('page') or 0)
+        chunk = ITEMS[start:start + 10]
+        following = start + 10 if start + 10 < len(ITEMS) else None
+        body = {'data': chunk, 'next_cursor': following and str(following)}
+        if parts.path == '/link' and following:
+            headers['Link'] = f'</link?page={following}>; rel="next", </link>; rel="first"'
+    content = dumps(body).encode()
+    headers['Content-Length'] = str(len(content))
+    return 200, headers, content
+
+
+class Api(Connector):
+
+    @paginate(strategy='cursor', prefetch=0)
+    @returns.json(key='data')
+    @get(path='cursor')
+    def get_cursor(self, kind: Query = None) -> Iterator[Item]:
+        pass
+
+    @paginate(strategy='link')
+    @returns.json(key='data')
+    @get(path='link')
+    def get_link(self) -> List[dict]:
+        pass
+
+    @paginate(strategy='offset', limit=5, prefetch=2)
+    @returns.json(key='results')
+    @get(path='offset')
+    def get_offset(self):
+        pass
+
+    @paginate(strategy='offset', limit=3, total_key='count', concurrency=4)
+    @returns.json(key='results')
+    @get(path='offset')
+    def get_offset_total(self):
+        pass
+
+
+def _api(script_session, delay=0.0, **kwargs):
+    urls = []
+    session, adapter = script_session(
+        respond=lambda request: _serve(request.url),
+        on_send=lambda request: urls.append(request.url),
+        delay=delay
+    )
+    return Api(base_url='http://stub/', client=session, **kwargs), urls, adapter
+
+
+def test_next_link():
+    assert _next_link({}) is None
+    assert _next_link({'Link': '<https://a/?page=2>; rel="next"'}) == 'https://a/?page=2'
+    assert _next_link({'Link': '<a>; rel="prev", <b>; rel="last next"'}) == 'b'
+    assert _next_link({'Link': '<a>; rel=first'}) is None
+
+
+def test_item_type():
+    assert _item_type(Iterator[Item]) is Item
+    assert _item_type(AsyncIterator[int]) is int
+    assert _item_type(List[dict]) is dict
+    assert _item_type(dict) is None and _item_type(None) is None
+
+
+def test_paginate_cursor(script_session):
+    api, urls, _ = _api(script_session)
+    items = api.get_cursor(kind='all')
+    assert urls == []
+    assert list(items) == [Item(**item) for item in ITEMS]
+    assert len(urls) == 3
+    assert all('kind=all' in url for url in urls)
+    assert 'cursor=20' in urls[-1]
+
+
+def test_paginate_link(script_session):
+    api, urls, _ = _api(script_session)
+    assert list(api.get_link()) == ITEMS
+    assert urls[1:] == ['http://stub/link?page=10', 'http://stub/link?page=20']
+
+
+def test_paginate_offset_until_short_page(script_session):
+    api, urls, _ = _api(script_session)
+    assert list(api.get_offset()) == ITEMS
+    assert len(urls) == 5
+    assert 'offset=20&limit=5' in urls[-1]
+
+
+def test_paginate_prefetches_and_stops_early(script_session):
+    api, urls, _ = _api(script_session, delay=0.02)
+    items = api.get_offset()
+    assert next(items) == ITEMS[0]
+    sleep(0.1)
+    assert len(urls) == 3
+    items.close()
+    sleep(0.1)
+    assert len(urls) <= 4
+
+
+def test_paginate_offset_parallel(script_session):
+    api, urls, _ = _api(script_session, delay=0.05)
+    started = perf_counter()
+    assert list(api.get_offset_total()) == ITEMS
+    assert perf_counter() - started < 0.05 * 8 * 0.75
+    offsets = [parse_qs(urlsplit(url).query)['offset'][0] for url in urls]
+    assert sorted(offsets, key=int) == [str(no) for no in range(0, 23, 3)]
+
+
+def test_paginate_threads_send_through_clones(script_session):
+    api, urls, adapter = _api(script_session)
+    assert list(api.get_offset_total()) == ITEMS
+    assert list(api.get_offset()) == ITEMS
+    assert len(urls) == 13 and adapter.hits == 0
+    assert len(list(api.get_cursor())) == len(ITEMS)
+    assert adapter.hits == 3
+
+
+def test_paginate_hooks(script_session):
+    api, _, _ = _api(script_session)
+    timings = []
+    api.on_response(timings.append)
+    assert len(list(api.get_cursor())) == len(ITEMS)
+    assert [timing.url for timing in timings] == ['http://stub/cursor'] * 3
+    assert all(timing.status_code == 200 for timing in timings)
+
+
+def test_paginate_metrics(script_session):
+    metrics = Metrics()
+    api, _, _ = _api(script_session, metrics=metrics)
+    assert len(list(api.get_cursor())) == len(ITEMS)
+    assert list(api.get_offset_total()) == ITEMS
+    stats = metrics.as_dict()['Api']
+    assert stats['get_cursor']['requests'] == {'200': 3}
+    assert stats['get_offset_total']['requests'] == {'200': 8}
+    assert stats['get_offset_total']['in_flight'] == 0
+    assert stats['get_offset_total']['response_size']['count'] == 8
+
+
+@mark.asyncio
+async def test_paginate_async(script_session):
+
+    def handler(request):
+        status, headers, content = _serve(str(request.url))
+        return HttpxResponse(status, headers=headers, content=content)
+
+    async with Api(
+            base_url='http://stub/',
+            client=AsyncClient(transport=MockTransport(handler))
+    ) as api:
+        timings = []
+        api.on_response(timings.append)
+        assert [item async for item in api.get_cursor()] == [
+            Item(**item) for item in ITEMS
+        ]
+        assert len(timings) == 3
+        assert [item async for item in api.get_link()] == ITEMS
+        assert [item async for item in api.get_offset_total()] == ITEMS
+        items = api.get_offset()
+        assert await items.__anext__() == ITEMS[0]
+        await items.aclose()
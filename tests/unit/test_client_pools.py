@@ -0,0 +1,194 @@
+# Standard
+from asyncio import run
+from copy import copy
+from socket import AF_INET, IPPROTO_TCP, SOCK_STREAM, TCP_NODELAY
+
+# Third-party
+from aiohttp import ClientSession
+from httpx import AsyncClient, Client
+from pytest import mark, raises
+from requests import Session
+
+# Local
+from toboggan import Connector
+from toboggan.clients.pools import (
+    _build_client, _close_client, _socket_factory, resolve_pool, shared_pools,
+)
+from toboggan.models import TypePoolDump
+
+_NODELAY = [(IPPROTO_TCP, TCP_NODELAY, 1)]
+
+
+def test_resolve_pool():
+    assert resolve_pool(None) is None
+    pool = resolve_pool({'max_per_host': 4, 'socket_options': _NODELAY})
+    assert pool == TypePoolDump(
+        max_per_host=4, socket_options=((IPPROTO_TCP, TCP_NODELAY, 1),)
+    )
+    hash(pool)
+    with raises(TypeError):
+        resolve_pool({'max_hosts': 4})
+
+
+def test_connector_default_client_per_instance():
+    assert Connector().client is not Connector().client
+
+
+def test_build_client_requests():
+    pool = resolve_pool({'max_per_host': 20, 'socket_options': _NODELAY})
+    session = _build_client(Session, pool)
+    for prefix in ('http://', 'https://'):
+        adapter = session.adapters[prefix]
+        assert adapter._pool_maxsize == 20
+        assert copy(adapter).poolmanager.connection_pool_kw[
+            'socket_options'
+        ] == _NODELAY
+
+
+def test_build_client_httpx():
+    pool = resolve_pool({
+        'max_connections': 5, 'keepalive_expiry': 1.5, 'socket_options': _NODELAY
+    })
+    client = _build_client(Client, pool)
+    assert client._transport._pool._max_connections == 5
+    assert client._transport._pool._keepalive_expiry == 1.5
+    client.close()
+
+
+def test_build_client_rejects_unsupported_settings():
+    with raises(ValueError):
+        _build_client(Session, resolve_pool({'keepalive_expiry': 30}))
+    with raises(ValueError):
+        Connector(client=Session(), pool={'keepalive_expiry': 30})
+    for client_cls in (Client, AsyncClient):
+        with raises(ValueError):
+            _build_client(client_cls, resolve_pool({'max_per_host': 4}))
+
+
+def test_socket_factory():
+    sock = _socket_factory(
+        tuple(_NODELAY), (AF_INET, SOCK_STREAM, IPPROTO_TCP, '', ('', 0))
+    )
+    with sock:
+        assert sock.getsockopt(IPPROTO_TCP, TCP_NODELAY)
+
+
+def test_pool_on_foreign_client():
+    with raises(ValueError):
+        Connector(client=Client(), pool={'max_connections': 5})
+
+
+def test_swap_closes_owned_client():
+    conn = Connector(client=Client)
+    owned = conn.client
+    foreign = Client()
+    conn(client=foreign)
+    assert owned.is_closed
+    conn.client = Client
+    assert not foreign.is_closed
+    conn.close()
+    assert conn.client.is_closed
+    foreign.close()
+
+
+def test_close_leaves_client_instances_open():
+    client = Client()
+    with Connector(client=client):
+        pass
+    assert not client.is_closed
+    client.close()
+
+
+@mark.asyncio
+async def test_aclose_leaves_client_instances_open():
+    client = AsyncClient()
+    async with Connector(client=client):
+        pass
+    assert not client.is_closed
+    await client.aclose()
+
+
+def test_copy_does_not_own_client():
+    conn = Connector(client=Client)
+    clone = copy(conn)
+    clone.client = Client()
+    assert not conn.client.is_closed
+    clone.close()
+    conn.close()
+
+
+def test_shared_pools():
+    first = Connector('http://shared.test/', share_pool=True)
+    second = Connector('http://shared.test/api/', share_pool=True)
+    other = Connector('http://other.test/', share_pool=True)
+    assert first.client is second.client
+    assert first.client is not other.client
+    assert shared_pools.holders(first.client) == 2
+    with first:
+        pass
+    assert shared_pools.holders(second.client) == 1
+    second.close()
+    other.close()
+    assert shared_pools.holders(second.client) == 0
+
+
+@mark.asyncio
+async def test_async_context_manager():
+    async with Connector(
+            client=AsyncClient, pool={'max_connections': 7}
+    ) as conn:
+        assert conn.client._transport._pool._max_connections == 7
+        with raises(TypeError):
+            conn.close()
+    assert conn.client.is_closed
+
+
+def test_async_client_built_on_first_use():
+    conn = Connector('http://stub/', client=ClientSession)
+    assert 'ClientSession' in repr(conn)
+
+    async def use():
+        async with conn:
+            return conn.client
+
+    client = run(use())
+    assert isinstance(client, ClientSession) and client.closed
+    assert conn.client is client
+
+
+def test_shared_async_pools_per_loop():
+
+    async def acquire():
+        conn, other = (
+            Connector('http://shared.test/', client=AsyncClient, share_pool=True)
+            for _ in range(2)
+        )
+        assert conn.client is other.client
+        return conn, other
+
+    first = run(acquire())
+    second = run(acquire())
+    assert first[0].client is not second[0].client
+    for conn in (*first, *second):
+        run(conn.aclose())
+    assert first[0].client.is_closed and second[0].client.is_closed
+
+
+def test_async_clients_closed_only_on_a_loop():
+    client = AsyncClient()
+    with raises(TypeError):
+        _close_client(client)
+
+    async def build():
+        conn = Connector('http://stub/', client=AsyncClient)
+        return conn, conn.client
+
+    conn, owned = run(build())
+    with raises(TypeError):
+        conn.client = Session
+    assert conn.client is owned and not owned.is_closed
+    run(conn.aclose())
+    conn.client = Session
+    assert owned.is_closed
+    conn.close()
+    run(client.aclose())
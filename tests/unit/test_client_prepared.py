@@ -0,0 +1,116 @@
+# Standard
+from io import BytesIO
+from json import dumps, loads
+
+# Third-party
+from httpx import AsyncClient, MockTransport, Response as HttpxResponse
+from pytest import fixture, mark, raises
+
+# Local
+from toboggan import Body, Connector, Path, Query, get, headers, post, returns
+
+
+@headers({'X-Client': 'toboggan'})
+class Httpbin(Connector):
+
+    @returns.json
+    @get(path='anything/{no}')
+    def get_anything(self, no: Path, lang: Query = None):
+        pass
+
+    @returns.json
+    @post(path='anything')
+    def post_anything(self, body: Body):
+        pass
+
+
+def _echo(request):
+    return dumps({
+        'url': request.url, 'body': (request.body or b'').decode()
+    }).encode()
+
+
+@fixture
+def fixture_httpbin(script_session):
+    sent = []
+    session, _ = script_session(body=_echo, on_send=sent.append)
+    return Httpbin(base_url='http://stub/', client=session), sent
+
+
+def test_prepared_reuses_prepared_request(fixture_httpbin):
+    httpbin, sent = fixture_httpbin
+    prepared = httpbin.prepare(httpbin.get_anything, 1, lang='en')
+    assert prepared.method == 'Get'
+    assert prepared.url == 'http://stub/anything/1'
+    assert prepared.request['params'] == {'lang': 'en'}
+    for _ in range(3):
+        assert prepared.send()['url'] == 'http://stub/anything/1?lang=en'
+    first, *rest = sent
+    assert all(request is first for request in rest)
+    assert first.headers['X-Client'] == 'toboggan'
+
+
+def test_prepared_encodes_body_once(fixture_httpbin):
+    httpbin, sent = fixture_httpbin
+    body = {'name': 'pikachu'}
+    prepared = httpbin.prepare(httpbin.post_anything, body)
+    body['name'] = 'raichu'
+    assert loads(prepared.send()['body']) == {'name': 'pikachu'}
+    assert sent[0].headers['Content-Type'] == 'application/json'
+
+
+def test_prepared_is_read_only(fixture_httpbin):
+    httpbin, _ = fixture_httpbin
+    prepared = httpbin.prepare(Httpbin.get_anything, 1)
+    with raises(TypeError):
+        prepared.request['url'] = 'http://other/'
+    with raises(AttributeError):
+        prepared.url = 'http://other/'
+
+
+def test_prepared_rejects(fixture_httpbin):
+    httpbin, _ = fixture_httpbin
+    with raises(TypeError):
+        httpbin.prepare(httpbin.post_anything, BytesIO(b'{}'))
+    with raises(TypeError):
+        httpbin.prepare(lambda self: None)
+    with raises(ValueError):
+        httpbin.prepare(httpbin.get_anything, 1).send_many(1, concurrency=0)
+
+
+def test_prepared_send_many_w_session_clones(fixture_httpbin):
+    httpbin, sent = fixture_httpbin
+    prepared = httpbin.prepare(httpbin.get_anything, 2)
+    results = prepared.send_many(20, concurrency=4)
+    assert [result['url'] for result in results] == \
+        ['http://stub/anything/2'] * 20
+    assert len(sent) == 20
+    assert {id(request) for request in sent} == {id(sent[0])}
+
+
+def test_prepared_hooks(fixture_httpbin):
+    httpbin, _ = fixture_httpbin
+    timings = []
+    httpbin.on_response(timings.append)
+    prepared = httpbin.prepare(httpbin.get_anything, 3)
+    prepared.send()
+    prepared.send()
+    assert [timing.url for timing in timings] == ['http://stub/anything/3'] * 2
+    assert all(timing.endpoint == 'Httpbin.get_anything' for timing in timings)
+
+
+@mark.asyncio
+async def test_prepared_async_send_many():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return HttpxResponse(200, json={'url': str(request.url)})
+
+    async with AsyncClient(transport=MockTransport(handler)) as client:
+        httpbin = Httpbin(base_url='http://stub/', client=client)
+        prepared = httpbin.prepare(httpbin.get_anything, 4)
+        assert (await prepared.send())['url'] == 'http://stub/anything/4'
+        results = await prepared.send_many(10, concurrency=3)
+    assert len(results) == 10
+    assert len(calls) == 11
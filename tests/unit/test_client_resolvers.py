@@ -43,11 +43,10 @@ def test_resolve_headers():
     base = {'Content-Type': 'application/json'}
     ctx_headers_value = {'User-Agent': 'toboggan'}
     assert _resolve_headers(base, ctx_headers_value) == {
-        'headers': {
-            'Content-Type': 'application/json',
-            'User-Agent': 'toboggan'
-        }
+        'Content-Type': 'application/json',
+        'User-Agent': 'toboggan'
     }
+    assert _resolve_headers(base, {}) is base
 
 def test_resolve_options():
     kw_dump = TypeKwDump(dump={
@@ -73,12 +72,12 @@ def test_resolve_query_params():
         'c': TypeKwObjDump(sig_type=Query, kw_value='3')
     })
     assert _resolve_query_params(base_query_params, ctx_query_params_value, kw_dump) == {
-        'params': {
-            'a': 1,
-            'b': 2,
-            'c': '3'
-        }
+        'a': 1,
+        'b': 2,
+        'c': '3'
     }
+    assert base_query_params == {'a': 1}
+    assert _resolve_query_params(base_query_params, {}) is base_query_params
 
 def test_resolve_send():
     kw_dump = TypeKwDump(dump={
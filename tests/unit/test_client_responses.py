@@ -0,0 +1,59 @@
+# Standard
+from typing import List
+
+# Third-party
+from pydantic import BaseModel
+from pytest import raises
+from requests import Response
+
+# Local
+from toboggan.aliases import AliasReturnType
+from toboggan.clients.codecs import resolve_codec
+from toboggan.clients.responses import Responses
+
+
+class Item(BaseModel):
+    id: int
+
+
+def response_of(content: bytes) -> Response:
+    response = Response()
+    response.status_code = 200
+    response._content = content
+    response.encoding = 'utf-8'
+    return response
+
+
+def test_resolve_json_validated_from_bytes():
+    responses = Responses(eval_type=List[Item])
+    assert responses.validates_json
+    assert responses.resolve_response_std(
+        response=response_of(b'[{"id": 1}, {"id": "2"}]'),
+        ctx_returns_type=AliasReturnType.JSON
+    ) == [Item(id=1), Item(id=2)]
+
+
+def test_resolve_json_validated_w_key():
+    responses = Responses(eval_type=Item, codec=resolve_codec('json'))
+    assert responses.resolve_response_std(
+        response=response_of(b'{"data": {"id": 1}}'),
+        ctx_returns_type=AliasReturnType.JSON,
+        ctx_returns_json_key='data'
+    ) == Item(id=1)
+
+
+def test_resolve_json_invalid():
+    with raises(Exception):
+        Responses(eval_type=Item).resolve_response_std(
+            response=response_of(b'{"id": "one"}'),
+            ctx_returns_type=AliasReturnType.JSON
+        )
+
+
+def test_resolve_json_unvalidated():
+    responses = Responses(eval_type=None)
+    assert not responses.validates_json
+    assert responses.resolve_response_std(
+        response=response_of(b'{"id": 1}'),
+        ctx_returns_type=AliasReturnType.JSON
+    ) == {'id': 1}
@@ -0,0 +1,137 @@
+# Standard
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+# Third-party
+from httpx import AsyncClient, MockTransport, Response as HttpxResponse
+from pytest import mark, raises
+from requests import ConnectionError
+
+# Local
+from toboggan import Connector, Path, get, post, retry, returns
+from toboggan.aliases import AliasJitterType
+from toboggan.clients.retries import (
+    RetryBudget, RetryPolicy, _retry_after, resolve_retry_budget,
+)
+from toboggan.models import TypeRetryBudgetDump, TypeRetryDump
+
+
+BODY = b'{"ok": true}'
+
+
+def _api(session, **kwargs):
+
+    class Api(Connector):
+
+        @retry(total=2, backoff_factor=0, status_forcelist=[503])
+        @returns.json
+        @get(path='items/{no}')
+        def get_item(self, no: Path):
+            pass
+
+        @retry(total=2, backoff_factor=0, status_forcelist=[503])
+        @returns.status_code
+        @post(path='items')
+        def post_item(self):
+            pass
+
+    return Api(base_url='http://stub/', client=session, **kwargs)
+
+
+def test_retry_after():
+    assert _retry_after('3') == 3
+    assert _retry_after(None) is None
+    assert _retry_after('soon') is None
+    later = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < _retry_after(format_datetime(later, usegmt=True)) <= 30
+
+
+def test_policy_backoff():
+    config = TypeRetryDump(total=5, backoff_factor=1, status_forcelist=[503])
+    exact = RetryPolicy(config._replace(jitter=None, max_backoff=5))
+    assert [exact.backoff(attempt, 0) for attempt in range(4)] == [1, 2, 4, 5]
+    full = RetryPolicy(config._replace(jitter='full'))
+    assert all(0 <= full.backoff(3, 0) <= 8 for _ in range(100))
+    decorrelated = RetryPolicy(config._replace(
+        jitter=AliasJitterType.DECORRELATED, max_backoff=10
+    ))
+    assert all(1 <= decorrelated.backoff(0, 2) <= 6 for _ in range(100))
+    assert decorrelated.backoff(0, 100) <= 10
+    assert exact.delay(0, 0, {'Retry-After': '3'}) == 3
+    assert exact.delay(0, 0, {'Retry-After': '7'}) == 5
+    assert exact.delay(0, 0, {'Retry-After': '86400'}) == 5
+    assert RetryPolicy(config._replace(respect_retry_after=False, jitter=None)).delay(
+        0, 0, {'Retry-After': '7'}
+    ) == 1
+
+
+def test_retry_resends_total_times(script_session):
+    session, adapter = script_session([503, 503], body=BODY)
+    api = _api(session)
+    assert api.get_item(1) == {'ok': True}
+    assert adapter.hits == 3
+    session, adapter = script_session([503, 503, 503], body=BODY)
+    api = _api(session)
+    with raises(RuntimeError):
+        api.get_item(1)
+    assert adapter.hits == 3
+
+
+def test_retry_exceptions_on_idempotent_methods(script_session):
+    session, adapter = script_session([ConnectionError('reset')], body=BODY)
+    api = _api(session)
+    assert api.get_item(1) == {'ok': True}
+    assert adapter.hits == 2
+    session, adapter = script_session([ConnectionError('reset')], body=BODY)
+    api = _api(session)
+    with raises(ConnectionError):
+        api.post_item()
+    assert adapter.hits == 1
+    session, adapter = script_session([503], body=BODY)
+    api = _api(session)
+    assert api.post_item() == 200
+
+
+def test_retry_budget(script_session):
+    budget = {'ratio': 0, 'min_per_second': 0, 'capacity': 1}
+    session, adapter = script_session([503, 503, 503], body=BODY)
+    api = _api(session, retry_budget=budget)
+    with raises(RuntimeError):
+        api.get_item(1)
+    assert adapter.hits == 2
+    assert api.retry_budget.tokens == 0
+
+
+def test_resolve_retry_budget():
+    assert resolve_retry_budget(None) is None
+    assert resolve_retry_budget(False) is None
+    assert resolve_retry_budget(True).config == TypeRetryBudgetDump()
+    budget = RetryBudget(TypeRetryBudgetDump(ratio=0.5, capacity=2))
+    assert resolve_retry_budget(budget) is budget
+    assert budget.withdraw() and budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+@mark.asyncio
+async def test_retry_async():
+    statuses = [503, 429]
+
+    def handler(request):
+        status = statuses.pop(0) if statuses else 200
+        return HttpxResponse(status, headers={'Retry-After': '0'}, json={})
+
+    class Api(Connector):
+
+        @retry(total=3, backoff_factor=5, status_forcelist=[429, 503])
+        @returns.status_code
+        @get(path='items')
+        def get_items(self):
+            pass
+
+    async with Api(
+            base_url='http://stub/',
+            client=AsyncClient(transport=MockTransport(handler))
+    ) as api:
+        assert await api.get_items() == 200
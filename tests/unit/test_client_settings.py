@@ -0,0 +1,118 @@
+# Standard
+from tracemalloc import start, stop, take_snapshot
+
+# Local
+from toboggan import Connector, Options, Path, Query, get, headers, params
+from toboggan.clients import Settings
+from toboggan.models import TypeKwDump, TypeKwObjDump
+
+CALLS = 1_000
+BASE_HEADERS = {'X-Client': 'toboggan'}
+BASE_QUERY_PARAMS = {'lang': 'en'}
+CTX_HEADERS = {'X-Endpoint': 'pokemon'}
+CTX_QUERY_PARAMS = {'limit': 10}
+
+
+@headers({'X-Client': 'toboggan'})
+@params({'lang': 'en'})
+class PokeApi(Connector):
+
+    @headers({'X-Endpoint': 'pokemon'})
+    @params({'limit': 10})
+    @get(path='pokemon/{id_}')
+    def get_pokemon(self, id_: Path, form: Query = None, options: Options = None):
+        pass
+
+
+def _kw_dump(**kwargs):
+    return TypeKwDump(dump={
+        'id_': TypeKwObjDump(sig_type=Path, kw_value=1),
+        **{
+            key: TypeKwObjDump(sig_type=sig_type, kw_value=value, key=key)
+            for key, (sig_type, value) in kwargs.items()
+        }
+    })
+
+
+def _dump(settings, kw_dump, base_headers=None, base_query_params=None):
+    return settings.dump(
+        method='Get',
+        base_url='https://pokeapi.co/api/v2/',
+        path='pokemon/{id_}',
+        base_headers=base_headers or BASE_HEADERS,
+        base_query_params=base_query_params or BASE_QUERY_PARAMS,
+        kw_dump=kw_dump,
+        ctx_headers_value=CTX_HEADERS,
+        ctx_query_params_value=CTX_QUERY_PARAMS
+    )
+
+
+def _allocations(dump):
+    dump()
+    kept = [None] * CALLS
+    start()
+    try:
+        before = take_snapshot()
+        for index in range(CALLS):
+            kept[index] = dump()
+        stats = take_snapshot().compare_to(before, 'filename')
+    finally:
+        stop()
+    return (
+        sum(stat.count_diff for stat in stats) / CALLS,
+        sum(stat.size_diff for stat in stats) / CALLS,
+    )
+
+
+def test_settings_dump():
+    settings = Settings()
+    first = _dump(settings, _kw_dump())
+    assert first == {
+        'method': 'Get',
+        'url': 'https://pokeapi.co/api/v2/pokemon/1',
+        'headers': {'X-Client': 'toboggan', 'X-Endpoint': 'pokemon'},
+        'params': {'lang': 'en', 'limit': 10},
+    }
+    second = _dump(settings, _kw_dump(form=(Query, 'alola')))
+    assert second['headers'] is first['headers']
+    assert second['params'] == {'lang': 'en', 'limit': 10, 'form': 'alola'}
+    assert first['params'] == {'lang': 'en', 'limit': 10}
+    options = {'headers': {'X-Endpoint': 'override'}, 'timeout': 5}
+    third = _dump(settings, _kw_dump(options=(Options, options)))
+    assert third['headers'] == {'X-Client': 'toboggan', 'X-Endpoint': 'override'}
+    assert third['timeout'] == 5
+    assert options == {'headers': {'X-Endpoint': 'override'}, 'timeout': 5}
+    assert first['headers'] == {'X-Client': 'toboggan', 'X-Endpoint': 'pokemon'}
+    changed = _dump(settings, _kw_dump(), base_headers={'X-Client': 'other'})
+    assert changed['headers'] == {'X-Client': 'other', 'X-Endpoint': 'pokemon'}
+
+
+def test_settings_allocations():
+    settings = Settings()
+    kw_dump = _kw_dump(form=(Query, 'alola'))
+    count, size = _allocations(lambda: _dump(settings, kw_dump))
+    assert count <= 5
+    many = {f'X-Header-{index}': str(index) for index in range(100)}
+    count_many, size_many = _allocations(
+        lambda: _dump(settings, kw_dump, base_headers=many)
+    )
+    assert count_many <= 5
+    assert abs(size_many - size) < 64
+
+
+def test_settings_through_endpoint(script_session):
+    sent = []
+    session, _ = script_session(on_send=sent.append)
+    api = PokeApi(base_url='https://pokeapi.co/api/v2/', client=session)
+    options = {'params': {'limit': 20}}
+    api.get_pokemon(25, form='alola', options=options)
+    api.get_pokemon(26)
+    first, second = sent
+    assert first.url == \
+        'https://pokeapi.co/api/v2/pokemon/25?lang=en&limit=20&form=alola'
+    assert second.url == 'https://pokeapi.co/api/v2/pokemon/26?lang=en&limit=10'
+    assert first.headers['X-Client'] == 'toboggan'
+    assert second.headers['X-Endpoint'] == 'pokemon'
+    assert options == {'params': {'limit': 20}}
+    assert PokeApi.base_headers == {'X-Client': 'toboggan'}
+    assert PokeApi.base_query_params == {'lang': 'en'}
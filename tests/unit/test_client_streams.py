@@ -0,0 +1,118 @@
+# Standard
+from io import BytesIO
+from json import dumps
+
+# Third-party
+from httpx import AsyncClient, Client, MockTransport, Response as HttpxResponse
+from pytest import mark
+
+# Local
+from toboggan import Connector, Path, get, retry, returns
+from toboggan.aliases import AliasReturnType
+from toboggan.clients.streams import _LineSplitter, _iter_stream
+
+RECORDS = [{'id': no, 'name': f'record-{no}'} for no in range(1, 6)]
+BODY = b''.join(dumps(record).encode() + b'\r\n' for record in RECORDS)
+
+
+class Raw(BytesIO):
+    """A raw body that records its connection's release, unlike `BytesIO`."""
+    released = False
+
+    def release_conn(self):
+        self.released = True
+
+
+class Exports(Connector):
+
+    @returns.stream.bytes(chunk_size=7)
+    @get(path='exports/{no}')
+    def get_bytes(self, no: Path):
+        pass
+
+    @returns.stream.lines
+    @get(path='exports/{no}')
+    def get_lines(self, no: Path):
+        pass
+
+    @retry(total=1, backoff_factor=0, status_forcelist=[503])
+    @returns.stream.ndjson(chunk_size=16)
+    @get(path='exports/{no}')
+    def get_records(self, no: Path):
+        pass
+
+
+def _handler(request):
+    return HttpxResponse(200, content=iter([BODY[:10], BODY[10:33], BODY[33:]]))
+
+
+async def _ahandler(request):
+
+    async def chunks():
+        for chunk in (BODY[:10], BODY[10:33], BODY[33:]):
+            yield chunk
+
+    return HttpxResponse(200, content=chunks())
+
+
+def test_line_splitter():
+    splitter = _LineSplitter()
+    assert splitter.feed(b'ab') == []
+    assert splitter.feed(b'c\r\nde\nf') == [b'abc', b'de']
+    assert splitter.feed(b'\n\n') == [b'f', b'']
+    assert splitter.feed(b'tail') == []
+    assert splitter.flush() == [b'tail']
+    assert splitter.flush() == []
+
+
+def test_iter_stream():
+    chunks = [BODY[i:i + 5] for i in range(0, len(BODY), 5)]
+    assert b''.join(_iter_stream(chunks, AliasReturnType.BYTES)) == BODY
+    assert list(_iter_stream(chunks, AliasReturnType.NDJSON)) == RECORDS
+    lines = list(_iter_stream([b'caf\xc3', b'\xa9\n\n'], AliasReturnType.LINES))
+    assert lines == ['café', '']
+
+
+def test_stream_requests(script_session):
+    session, adapter = script_session(body=BODY, raw=Raw)
+    api = Exports(base_url='http://stub/', client=session)
+    stream = api.get_bytes(1)
+    assert adapter.streams == []
+    chunks = list(stream)
+    assert b''.join(chunks) == BODY
+    assert max(len(chunk) for chunk in chunks) == 7
+    assert adapter.streams == [True]
+    assert adapter.responses[-1].raw.released
+    assert list(api.get_lines(1)) == [dumps(record) for record in RECORDS]
+    records = api.get_records(1)
+    assert next(records) == RECORDS[0]
+    records.close()
+    assert adapter.responses[-1].raw.closed and adapter.responses[-1].raw.released
+
+
+def test_stream_retries_before_iterating(script_session):
+    session, adapter = script_session([503], body=BODY, raw=Raw)
+    api = Exports(base_url='http://stub/', client=session)
+    assert list(api.get_records(1)) == RECORDS
+    first, second = adapter.responses
+    assert first.raw.closed and second.raw.released
+
+
+def test_stream_httpx_sync():
+    with Exports(
+            base_url='http://stub/',
+            client=Client(transport=MockTransport(_handler))
+    ) as api:
+        assert list(api.get_records(1)) == RECORDS
+        assert [len(chunk) for chunk in api.get_bytes(1)][:2] == [7, 7]
+
+
+@mark.asyncio
+async def test_stream_httpx_async():
+    async with Exports(
+            base_url='http://stub/',
+            client=AsyncClient(transport=MockTransport(_ahandler))
+    ) as api:
+        assert [record async for record in api.get_records(1)] == RECORDS
+        lines = [line async for line in api.get_lines(1)]
+        assert lines == [dumps(record) for record in RECORDS]
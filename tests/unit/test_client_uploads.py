@@ -0,0 +1,146 @@
+# Standard
+from mmap import mmap
+
+# Third-party
+from httpx import AsyncClient, Client, MockTransport, Response as HttpxResponse
+from pytest import mark, raises
+
+# Local
+from toboggan import Body, Connector, Path, post, put, retry, returns, sends
+from toboggan.aliases import AliasSessionType
+from toboggan.clients.streams import (
+    _body_size, _is_one_shot, _is_stream_body, _stream_send,
+)
+
+PAYLOAD = bytes(range(256)) * 64
+
+
+class Uploads(Connector):
+
+    @returns.status_code
+    @post(path='uploads')
+    def post_upload(self, body: Body):
+        pass
+
+    @retry(total=2, backoff_factor=0, status_forcelist=[503])
+    @sends.stream(chunk_size=1000, expect_continue=True)
+    @returns.status_code
+    @put(path='uploads/{name}')
+    def put_upload(self, name: Path, body: Body):
+        pass
+
+
+def _chunks():
+    for start in range(0, len(PAYLOAD), 4096):
+        yield PAYLOAD[start:start + 4096]
+
+
+async def _achunks():
+    for chunk in _chunks():
+        yield chunk
+
+
+def test_stream_bodies(tmp_path):
+    file = tmp_path / 'payload.bin'
+    file.write_bytes(PAYLOAD)
+    with open(file, 'rb') as stream:
+        stream.read(100)
+        assert _body_size(stream) == len(PAYLOAD) - 100
+        assert _is_stream_body(stream) and _is_one_shot(stream)
+    with mmap(-1, len(PAYLOAD)) as buffer:
+        buffer.write(PAYLOAD)
+        buffer.seek(1000)
+        assert _body_size(buffer) == len(PAYLOAD) - 1000
+        assert _is_one_shot(buffer)
+    view = memoryview(PAYLOAD)
+    assert _body_size(view) == len(PAYLOAD)
+    assert _is_stream_body(view) and not _is_one_shot(view)
+    assert _is_one_shot(_chunks()) and _is_one_shot(_achunks())
+    assert not _is_stream_body({'a': 1}) and not _is_stream_body([b'a'])
+    assert _body_size(_chunks()) is None
+    with raises(TypeError):
+        _stream_send(_achunks(), AliasSessionType.REQUESTS)
+
+
+def test_upload_requests(tmp_path, script_session):
+    file = tmp_path / 'payload.bin'
+    file.write_bytes(PAYLOAD)
+    sent = []
+    session, _ = script_session(on_send=sent.append)
+    api = Uploads(base_url='http://stub/', client=session)
+    with open(file, 'rb') as stream:
+        assert api.post_upload(stream) == 200
+    assert sent[-1].body.name == str(file)
+    assert sent[-1].headers['Content-Length'] == str(len(PAYLOAD))
+    assert api.post_upload(_chunks()) == 200
+    assert sent[-1].headers['Transfer-Encoding'] == 'chunked'
+    with mmap(-1, len(PAYLOAD)) as buffer:
+        buffer.write(PAYLOAD)
+        buffer.seek(0)
+        assert api.put_upload('buffer', buffer) == 200
+        assert sent[-1].headers['Expect'] == '100-continue'
+        assert sent[-1].headers['Content-Length'] == str(len(PAYLOAD))
+        assert sent[-1].body is buffer
+
+
+def test_one_shot_bodies_are_not_retried(script_session):
+    session, adapter = script_session([503, 503])
+    api = Uploads(base_url='http://stub/', client=session)
+    with raises(RuntimeError):
+        api.put_upload('chunks', _chunks())
+    assert adapter.hits == 1
+    assert api.put_upload('buffer', memoryview(PAYLOAD)) == 200
+    assert adapter.hits == 3
+
+
+def test_upload_httpx_sync(tmp_path):
+    received = []
+
+    def handler(request):
+        received.append((request.headers, request.read()))
+        return HttpxResponse(200)
+
+    file = tmp_path / 'payload.bin'
+    file.write_bytes(PAYLOAD)
+    with Uploads(
+            base_url='http://stub/', client=Client(transport=MockTransport(handler))
+    ) as api:
+        with open(file, 'rb') as stream:
+            api.put_upload('file', stream)
+        api.post_upload(_chunks())
+        api.put_upload('view', memoryview(PAYLOAD))
+        with mmap(-1, len(PAYLOAD)) as buffer:
+            buffer.write(PAYLOAD)
+            buffer.seek(0)
+            api.put_upload('buffer', buffer)
+    (file_headers, file_body), (chunk_headers, chunk_body), *buffers = received
+    assert file_body == chunk_body == PAYLOAD
+    assert [body for _, body in buffers] == [PAYLOAD] * 2
+    assert all(
+        headers['Content-Length'] == str(len(PAYLOAD)) for headers, _ in buffers
+    )
+    assert file_headers['Content-Length'] == str(len(PAYLOAD))
+    assert file_headers['Expect'] == '100-continue'
+    assert 'Transfer-Encoding' not in file_headers
+    assert chunk_headers['Transfer-Encoding'] == 'chunked'
+
+
+@mark.asyncio
+async def test_upload_httpx_async(tmp_path):
+    received = []
+
+    async def handler(request):
+        received.append(await request.aread())
+        return HttpxResponse(200)
+
+    file = tmp_path / 'payload.bin'
+    file.write_bytes(PAYLOAD)
+    async with Uploads(
+            base_url='http://stub/',
+            client=AsyncClient(transport=MockTransport(handler))
+    ) as api:
+        with open(file, 'rb') as stream:
+            assert await api.post_upload(stream) == 200
+        assert await api.post_upload(_achunks()) == 200
+        assert await api.post_upload(_chunks()) == 200
+    assert received == [PAYLOAD] * 3
@@ -11,8 +11,9 @@ def test_kebabize():
     assert _kebabize('test_key') == 'test-key'
 
 def test_merge_mappings():
-    base = {'params': {'a': 1, 'b': 2}}
-    supp = {'params': {'b': 3, 'c': 4}}
-    _merge_mappings(base=base, supp=supp, target='params')
-    assert base == {'params': {'a': 1, 'b': 3, 'c': 4}}
-    assert supp == {}
+    base = {'a': 1, 'b': 2}
+    supp = {'b': 3, 'c': 4}
+    assert _merge_mappings(base, supp) == {'a': 1, 'b': 3, 'c': 4}
+    assert base == {'a': 1, 'b': 2} and supp == {'b': 3, 'c': 4}
+    assert _merge_mappings(base, {}) is base
+    assert _merge_mappings({}, supp) is supp
@@ -0,0 +1,65 @@
+# Third-party
+from pytest import raises
+
+# Local
+from toboggan import Body, Connector, Options, Path, Query, QueryKebab
+from toboggan.decos.evaluators import _EvalSignature
+
+
+def method(
+        self,
+        first: Path,
+        limit: Query,
+        page_size: QueryKebab = 50,
+        body: Body = None,
+        **options: Options
+):
+    pass
+
+
+def test_dump_positional_and_keyword():
+    conn = Connector()
+    sig = _EvalSignature(method)
+    dumped_conn, kw_dump = sig.dump(conn, 'hello', limit=10)
+    assert dumped_conn is conn
+    assert kw_dump.dump['first'].sig_type is Path
+    assert kw_dump.dump['first'].kw_value == 'hello'
+    assert kw_dump.dump['limit'].kw_value == 10
+    assert kw_dump.dump['page_size'].key == 'page-size'
+    assert kw_dump.dump['page_size'].kw_value == 50
+    assert kw_dump.dump['body'].kw_value is None
+    assert 'options' not in kw_dump.dump
+
+
+def test_dump_options():
+    sig = _EvalSignature(method)
+    _, kw_dump = sig.dump(Connector(), 'hello', 10, timeout=5)
+    assert kw_dump.dump['options'].sig_type is Options
+    assert kw_dump.dump['options'].kw_value == {'timeout': 5}
+
+
+def test_dump_is_not_shared_between_calls():
+    sig = _EvalSignature(method)
+    _, first = sig.dump(Connector(), 'hello', 10, timeout=5)
+    _, second = sig.dump(Connector(), 'hello', 10)
+    assert first.dump is not second.dump
+    assert 'options' not in second.dump
+
+
+def test_dump_invalid_arguments():
+    sig = _EvalSignature(method)
+    with raises(TypeError):
+        sig.dump(Connector(), limit=10)
+    with raises(TypeError):
+        sig.dump(Connector(), 'hello', 10, first='world')
+
+
+def test_dump_positional_only():
+
+    def positional_only(self, first: Path, /, limit: Query):
+        pass
+
+    sig = _EvalSignature(positional_only)
+    _, kw_dump = sig.dump(Connector(), 'hello', limit=10)
+    assert kw_dump.dump['first'].kw_value == 'hello'
+    assert kw_dump.dump['limit'].kw_value == 10
@@ -0,0 +1,60 @@
+# Local
+from toboggan import Connector, get, headers, params, retry, returns, sends
+from toboggan.aliases import AliasReturnType, AliasSendsType
+from toboggan.decos.specs import _ENDPOINT_ATTR
+
+
+class Api(Connector):
+
+    @retry(total=3, backoff_factor=0.1, status_forcelist=[503])
+    @returns.json(key='data')
+    @sends.form_url_encoded
+    @headers({'Accept': 'text/plain', 'X-Outer': '1'})
+    @headers({'Accept': 'application/json'})
+    @params({'lang': 'en'})
+    @get(path='get')
+    def method_get(self):
+        pass
+
+    @returns.text
+    @returns.json
+    @get(path='get')
+    def method_nearest_wins(self):
+        pass
+
+    @get(path='get')
+    @returns.status_code
+    def method_beneath_verb(self):
+        pass
+
+
+def spec_of(func):
+    return getattr(func, _ENDPOINT_ATTR).spec
+
+
+def test_decorators_do_not_wrap():
+    endpoint = getattr(Api.method_get, _ENDPOINT_ATTR)
+    assert Api.method_get.__wrapped__.__name__ == 'method_get'
+    assert endpoint is getattr(Api().method_get, _ENDPOINT_ATTR)
+
+
+def test_spec_merged():
+    spec = spec_of(Api.method_get)
+    assert spec.method == 'Get'
+    assert spec.path == 'get'
+    assert spec.headers == {'Accept': 'application/json', 'X-Outer': '1'}
+    assert spec.query_params == {'lang': 'en'}
+    assert spec.sends_type is AliasSendsType.DATA
+    assert spec.retry.total == 3
+    assert spec.returns_type is AliasReturnType.JSON
+    assert spec.returns_json_key == 'data'
+
+
+def test_spec_nearest_decorator_wins():
+    spec = spec_of(Api.method_nearest_wins)
+    assert spec.returns_type is AliasReturnType.JSON
+
+
+def test_spec_beneath_verb():
+    spec = spec_of(Api.method_beneath_verb)
+    assert spec.returns_type is AliasReturnType.STATUS_CODE
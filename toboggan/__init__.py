@@ -11,7 +11,24 @@ from .decos import (
     trace,
 )
 """Verbs"""
-from .decos import headers, params, retry, returns, sends
+from .decos import (
+    cache,
+    circuit_breaker,
+    coalesce,
+    headers,
+    paginate,
+    params,
+    rate_limit,
+    retry,
+    returns,
+    sends,
+)
 """Request and response"""
 from .annotations import Body, Options, Path, Query, QueryKebab
 """Annotations"""
+from .clients import ChromeTrace, Hooks, Metrics, shared_metrics
+"""Hooks and metrics"""
+from .clients import Driver, drivers
+"""Drivers"""
+from .clients import CircuitOpenError
+"""Errors"""
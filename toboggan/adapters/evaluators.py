@@ -1,5 +1,7 @@
 # Standard
-from typing import Any
+from functools import partial
+from inspect import isclass
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 from typing import get_args
 
 
@@ -7,6 +9,10 @@ class __NoPydanticModule:
     pass
 
 
+class __NoMsgspecModule:
+    pass
+
+
 # Third-party
 try:
     from pydantic import BaseModel, ValidationError
@@ -20,49 +26,113 @@ except ImportError:
     TypeAdapter = __NoPydanticModule
 
 try:
-    from pydantic import parse_obj_as
+    from pydantic import create_model
 except ImportError:
-    parse_obj_as = __NoPydanticModule
+    create_model = __NoPydanticModule
+
+try:
+    import msgspec
+    from msgspec import DecodeError, Struct
+except ModuleNotFoundError:
+    msgspec = __NoMsgspecModule
+    DecodeError = __NoMsgspecModule
+    Struct = __NoMsgspecModule
 
 # Local
 from .resolvers import eval_adapters
 from toboggan.aliases import AdaptersEvalType
-from toboggan.models import TypeEvalErrDump
+from toboggan.models import TypeEvalErrDump, TypeValidatorDump
 
 __all__ = ('EvalReturn',)
 
+_validators: Dict[Any, Optional[TypeValidatorDump]] = {}
+"""Validators keyed by return annotation.  Each is built on the first 
+response an endpoint evaluates and reused for every response after it."""
+
+_validation_errors: Tuple[Type[Exception]] = tuple(
+    err for err in (ValidationError, DecodeError)
+    if isclass(err) and issubclass(err, Exception)
+)
+
+
+def _assessible_adapter_type(eval_type: Any, base: type) -> bool:
+    if eval_type:
+        if args := get_args(eval_type):
+            return any(
+                isclass(arg) and issubclass(arg, base) for arg in args
+            )
+        if isclass(eval_type) and issubclass(eval_type, base):
+            return True
+    return False
+
+
+def _pydantic_v1_validator(eval_type: Any) -> Callable[[Any], Any]:
+    if isclass(eval_type) and issubclass(eval_type, BaseModel):
+        return eval_type.parse_obj
+    model = create_model('ParsingModel', __root__=(eval_type, ...))
+
+    def validate_python(response: Any) -> Any:
+        return model(__root__=response).__root__
+    return validate_python
+
+
+def _compile_validator(eval_type: Any) -> Optional[TypeValidatorDump]:
+    if AdaptersEvalType.MSGSPEC in eval_adapters and \
+            _assessible_adapter_type(eval_type, Struct):
+        return TypeValidatorDump(
+            adapter_type=AdaptersEvalType.MSGSPEC,
+            validate_python=partial(msgspec.convert, type=eval_type),
+            validate_json=msgspec.json.Decoder(eval_type).decode
+        )
+    if not _assessible_adapter_type(eval_type, BaseModel):
+        return None
+    if AdaptersEvalType.PYDANTIC_V2 in eval_adapters:
+        adapter = TypeAdapter(eval_type)
+        return TypeValidatorDump(
+            adapter_type=AdaptersEvalType.PYDANTIC_V2,
+            validate_python=adapter.validate_python,
+            validate_json=adapter.validate_json
+        )
+    if AdaptersEvalType.PYDANTIC_V1 in eval_adapters:
+        return TypeValidatorDump(
+            adapter_type=AdaptersEvalType.PYDANTIC_V1,
+            validate_python=_pydantic_v1_validator(eval_type)
+        )
+    return None
+
+
+def _resolve_validator(eval_type: Any) -> Optional[TypeValidatorDump]:
+    try:
+        return _validators[eval_type]
+    except KeyError:
+        validator = _validators[eval_type] = _compile_validator(eval_type)
+        return validator
+    except TypeError:
+        return _compile_validator(eval_type)
+
 
 class EvalReturn:
-    __slots__ = ('__eval_type',)
+    __slots__ = ('__eval_type', '__validator',)
 
     def __init__(self, eval_type: Any):
         self.__eval_type = eval_type
-    
-    def __eval_pydantic_v1(self, response: Any):
-        validated = parse_obj_as(self.__eval_type, response)
-        return validated
-    
-    def __eval_pydantic_v2(self, response: Any):
-        validated = TypeAdapter(self.__eval_type).validate_python(response)
-        return validated
-
-    def __assessible_adapter_type(self) -> bool:
-        if self.__eval_type:
-            if args := get_args(self.__eval_type):
-                return any(issubclass(arg, BaseModel) for arg in args)
-            if issubclass(self.__eval_type, BaseModel):
-                return True
-        return False
-    
-    def __validate_adapter_type(self, response: Any):
+        self.__validator: Optional[TypeValidatorDump] = (
+            _resolve_validator(eval_type) if eval_type else None
+        )
+
+    @property
+    def validates_json(self) -> bool:
+        return self.__validator is not None and \
+            self.__validator.validate_json is not None
+
+    def __validate_adapter_type(self, response: Any, validate: Callable):
         try:
-            if AdaptersEvalType.PYDANTIC_V2 in eval_adapters:
-                return self.__eval_pydantic_v2(response=response)
-            if AdaptersEvalType.PYDANTIC_V1 in eval_adapters:
-                return self.__eval_pydantic_v1(response=response)
-        except ValidationError as err:
+            return validate(response)
+        except _validation_errors as err:
             err = TypeEvalErrDump(
-                type_expected=err.errors(),
+                type_expected=err.errors() if isinstance(
+                    err, ValidationError
+                ) else str(err),
                 type_evaluated=type(response)
             )
             raise Exception(err)
@@ -79,6 +149,16 @@ class EvalReturn:
         return response
 
     def evaluate(self, response: Any) -> Any:
-        if self.__assessible_adapter_type():
-            return self.__validate_adapter_type(response=response)
+        if self.__validator is not None:
+            return self.__validate_adapter_type(
+                response=response, validate=self.__validator.validate_python
+            )
         return response
+
+    def evaluate_json(self, content: bytes) -> Any:
+        """Parses and validates a raw JSON body in a single pass.  Only 
+        available when :py:attr:`validates_json` is true.
+        """
+        return self.__validate_adapter_type(
+            response=content, validate=self.__validator.validate_json
+        )
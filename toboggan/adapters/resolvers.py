@@ -8,6 +8,11 @@ try:
 except ModuleNotFoundError:
     VERSION = '0'
 
+try:
+    from msgspec import Struct
+except ModuleNotFoundError:
+    Struct = None
+
 # Local
 from toboggan.aliases import AdaptersEvalType
 
@@ -21,6 +26,8 @@ def _resolve_eval_adapters() -> Tuple[AdaptersEvalType]:
         base.append(AdaptersEvalType.PYDANTIC_V2)
     elif VERSION.startswith('1'):
         base.append(AdaptersEvalType.PYDANTIC_V1)
+    if Struct is not None:
+        base.append(AdaptersEvalType.MSGSPEC)
     return tuple(base)
 
 eval_adapters: Tuple[Optional[AdaptersEvalType]] = _resolve_eval_adapters()
@@ -3,6 +3,10 @@ from enum import Enum, auto
 
 __all__ = (
     'AdaptersEvalType',
+    'AliasCacheState',
+    'AliasCircuitState',
+    'AliasCodecType',
+    'AliasJitterType',
     'AliasReqOptType',
     'AliasReturnType',
     'AliasSessionType',
@@ -10,14 +14,50 @@ __all__ = (
 )
 
 
+class AliasCacheState(Enum):
+    MISS = auto()
+    FRESH = auto()
+    STALE = auto()
+    EXPIRED = auto()
+
+
+class AliasCircuitState(Enum):
+    CLOSED = auto()
+    OPEN = auto()
+    HALF_OPEN = auto()
+
+
+class AliasCodecType(Enum):
+    JSON = auto()
+    MSGSPEC = auto()
+    ORJSON = auto()
+
+
+class AliasJitterType(Enum):
+    NONE = auto()
+    FULL = auto()
+    DECORRELATED = auto()
+
+
 class AliasReqOptType(Enum):
     HEADERS = auto()
     QUERY = auto()
+    RATE_LIMIT = auto()
     RETRY = auto()
 
 
+class AliasPaginateType(Enum):
+    CURSOR = auto()
+    LINK = auto()
+    OFFSET = auto()
+
+
 class AliasReturnType(Enum):
+    BYTES = auto()
+    FILE = auto()
     JSON = auto()
+    LINES = auto()
+    NDJSON = auto()
     STATUS_CODE = auto()
     TEXT = auto()
 
@@ -36,5 +76,6 @@ class AliasSendsType(Enum):
 
 class AdaptersEvalType(Enum):
     NONE = auto()
+    MSGSPEC = auto()
     PYDANTIC_V1 = auto()
     PYDANTIC_V2 = auto()
@@ -1,11 +1,15 @@
 # Standard
-from typing import Dict, NewType
+from typing import Any, Dict, NewType
 
 __all__ = ('Body', 'Options', 'Path', 'Query', 'QueryKebab',)
 
-Body = NewType(name='Body', tp=Dict)
+Body = NewType(name='Body', tp=Any)
 """Annotates a parameter that will bind the body.
 
+Besides values to encode, the body can be a file object, an `mmap` or 
+`memoryview` buffer, or a sync or async iterator of bytes.  These are 
+streamed w/o being loaded into memory.
+
 ::
 
     @post(path='/post')
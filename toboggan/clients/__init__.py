@@ -1,5 +1,42 @@
 # Local
+from .breakers import (
+    Breaker, Breakers, CircuitOpenError, resolve_breakers,
+)
+from .caches import ResponseCache
+from .codecs import resolve_codec
+from .drivers import (
+    AiohttpDriver,
+    Driver,
+    Drivers,
+    HttpxAsyncDriver,
+    HttpxDriver,
+    RequestsDriver,
+    drivers,
+    resolve_driver,
+)
+from .fanout import _amap, _map
+from .flights import SingleFlight
+from .hooks import ChromeTrace, Hook, Hooks, Timing, resolve_hooks
+from .limits import RateLimiter
+from .metrics import Histogram, Metrics, resolve_metrics, shared_metrics
+from .pages import Pages
+from .pools import (
+    SharedPools,
+    resolve_pool,
+    shared_pools,
+    _aclose_client,
+    _blocking_close_error,
+    _build_client,
+    _close_client,
+    _configure_client,
+    _pool_key,
+    _running_loop,
+)
+from .prepared import Prepared
 from .requests import Requests
+from .retries import (
+    RetryBudget, RetryPolicy, resolve_retry_budget, transport_errors,
+)
 from .resolvers import (
     AsyncClient, Client, ClientSession, Session, resolve_client_type,
 )
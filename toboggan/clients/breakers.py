@@ -0,0 +1,225 @@
+# Standard
+from collections import deque
+from collections.abc import Mapping
+from threading import Lock
+from time import monotonic
+from typing import Deque, Dict, Optional, Tuple, Union
+
+# Local
+from toboggan.aliases import AliasCircuitState
+from toboggan.models import (
+    TypeCircuitBreakerDump, TypeCircuitOpenErrDump, TypeCircuitStatsDump,
+)
+
+__all__ = (
+    'Breaker',
+    'Breakers',
+    'CircuitOpenError',
+    'resolve_breakers',
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised, w/ a `TypeCircuitOpenErrDump`, when a request is rejected
+    because the circuit breaker of its endpoint is open.
+    """
+
+
+class Breaker:
+    """A circuit breaker over a sliding window of the last `window_size`
+    calls.  Calls fail if they raise or respond w/ one of
+    `failure_statuses`; they're slow if they take `slow_call_duration`
+    seconds or more.
+
+    Once `minimum_calls` have been recorded, the circuit opens if the
+    failure rate or the slow call rate reaches its threshold, and calls
+    are rejected w/ :py:class:`CircuitOpenError`.  After `open_timeout`
+    seconds it half-opens: `half_open_calls` probes are let through and
+    their outcome closes the circuit or opens it again.
+    """
+    __slots__ = (
+        '__config',
+        '__failures',
+        '__lock',
+        '__name',
+        '__opened_at',
+        '__outcomes',
+        '__permits',
+        '__probes',
+        '__slow',
+        '__state',
+    )
+
+    def __init__(
+            self,
+            name: str,
+            config: TypeCircuitBreakerDump = TypeCircuitBreakerDump()
+    ):
+        self.__name = name
+        self.__config = config
+        self.__lock = Lock()
+        self.__outcomes: Deque[Tuple[bool, bool]] = deque()
+        self.__failures = 0
+        self.__slow = 0
+        self.__state = AliasCircuitState.CLOSED
+        self.__opened_at = 0.0
+        self.__permits = 0
+        self.__probes: list = []
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(name={self.__name}, state={self.state})'
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        self.__name = name
+
+    @property
+    def config(self) -> TypeCircuitBreakerDump:
+        return self.__config
+
+    @property
+    def state(self) -> AliasCircuitState:
+        with self.__lock:
+            return self.__current_state()
+
+    def stats(self) -> TypeCircuitStatsDump:
+        with self.__lock:
+            state = self.__current_state()
+            calls = len(self.__outcomes)
+            return TypeCircuitStatsDump(
+                name=self.__name,
+                state=state,
+                calls=calls,
+                failure_rate=self.__failures / calls if calls else 0.0,
+                slow_call_rate=self.__slow / calls if calls else 0.0,
+                retry_in=max(
+                    0.0,
+                    self.__opened_at + self.__config.open_timeout - monotonic()
+                ) if state is AliasCircuitState.OPEN else None
+            )
+
+    def __current_state(self) -> AliasCircuitState:
+        if self.__state is AliasCircuitState.OPEN and monotonic() >= \
+                self.__opened_at + self.__config.open_timeout:
+            self.__state = AliasCircuitState.HALF_OPEN
+            self.__permits = 0
+            self.__probes = []
+        return self.__state
+
+    def __reset(self, state: AliasCircuitState) -> None:
+        self.__state = state
+        self.__outcomes.clear()
+        self.__failures = self.__slow = 0
+        self.__permits = 0
+        self.__probes = []
+        if state is AliasCircuitState.OPEN:
+            self.__opened_at = monotonic()
+
+    def __tripped(self, calls: int, failures: int, slow: int) -> bool:
+        return (
+            failures / calls >= self.__config.failure_rate_threshold or
+            slow / calls >= self.__config.slow_call_rate_threshold
+        )
+
+    def acquire(self) -> None:
+        """Lets a call through or raises :py:class:`CircuitOpenError`.
+        """
+        with self.__lock:
+            state = self.__current_state()
+            if state is AliasCircuitState.CLOSED:
+                return
+            if state is AliasCircuitState.HALF_OPEN and \
+                    self.__permits < self.__config.half_open_calls:
+                self.__permits += 1
+                return
+        raise CircuitOpenError(TypeCircuitOpenErrDump(stats=self.stats()))
+
+    def cancel(self) -> None:
+        """Hands back the permit of a call that ended w/o an outcome.
+        """
+        with self.__lock:
+            if self.__state is AliasCircuitState.HALF_OPEN and self.__permits:
+                self.__permits -= 1
+
+    def record(self, duration: float, failed: bool) -> None:
+        config = self.__config
+        slow = config.slow_call_duration is not None and \
+            duration >= config.slow_call_duration
+        with self.__lock:
+            if self.__state is AliasCircuitState.OPEN:
+                return
+            if self.__state is AliasCircuitState.HALF_OPEN:
+                self.__probes.append((failed, slow))
+                if len(self.__probes) >= config.half_open_calls:
+                    tripped = self.__tripped(
+                        len(self.__probes),
+                        sum(failed for failed, _ in self.__probes),
+                        sum(slow for _, slow in self.__probes)
+                    )
+                    self.__reset(
+                        AliasCircuitState.OPEN if tripped
+                        else AliasCircuitState.CLOSED
+                    )
+                return
+            outcomes = self.__outcomes
+            outcomes.append((failed, slow))
+            self.__failures += failed
+            self.__slow += slow
+            if len(outcomes) > config.window_size:
+                old_failed, old_slow = outcomes.popleft()
+                self.__failures -= old_failed
+                self.__slow -= old_slow
+            if len(outcomes) >= config.minimum_calls and self.__tripped(
+                    len(outcomes), self.__failures, self.__slow
+            ):
+                self.__reset(AliasCircuitState.OPEN)
+
+    def record_status(self, duration: float, status: int) -> None:
+        self.record(duration, status in self.__config.failure_statuses)
+
+
+class Breakers:
+    """The circuit breakers of a :py:class:`Connector`, one per endpoint,
+    built on first use from one configuration.
+    """
+    __slots__ = ('__breakers', '__config', '__lock',)
+
+    def __init__(self, config: TypeCircuitBreakerDump = TypeCircuitBreakerDump()):
+        self.__config = config
+        self.__breakers: Dict[str, Breaker] = {}
+        self.__lock = Lock()
+
+    def __getitem__(self, name: str) -> Breaker:
+        breaker = self.__breakers.get(name)
+        if breaker is None:
+            with self.__lock:
+                breaker = self.__breakers.setdefault(
+                    name, Breaker(name=name, config=self.__config)
+                )
+        return breaker
+
+    def __iter__(self):
+        return iter(tuple(self.__breakers.values()))
+
+    def stats(self) -> Dict[str, TypeCircuitStatsDump]:
+        return {breaker.name: breaker.stats() for breaker in self}
+
+
+def resolve_breakers(
+        policy: Union[None, bool, Mapping, TypeCircuitBreakerDump, Breakers]
+) -> Optional[Breakers]:
+    """Resolves the circuit breaker policy of a :py:class:`Connector`.
+    `True` uses the defaults of `TypeCircuitBreakerDump` and a mapping is
+    read as its fields.
+    """
+    if policy is None or policy is False or isinstance(policy, Breakers):
+        return policy or None
+    if policy is True:
+        return Breakers()
+    if not isinstance(policy, TypeCircuitBreakerDump):
+        policy = TypeCircuitBreakerDump(**policy)
+    return Breakers(policy)
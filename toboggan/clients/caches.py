@@ -0,0 +1,239 @@
+# Standard
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+from time import monotonic
+from typing import (
+    Any, Dict, Hashable, Iterable, Mapping, Optional, Set, Tuple,
+)
+
+# Local
+from toboggan.aliases import AliasCacheState
+from toboggan.models import TypeCacheEntryDump
+
+__all__ = ('ResponseCache', '_parse_cache_control',)
+
+_CACHEABLE_METHODS = frozenset(('GET', 'HEAD',))
+_CREDENTIAL_HEADERS = ('authorization', 'cookie', 'proxy-authorization',)
+
+
+def _parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    if not value:
+        return directives
+    for directive in value.split(','):
+        name, _, arg = directive.strip().partition('=')
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _seconds(value: Optional[str], default: float) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, (list, tuple, set)):
+        return tuple(str(item) for item in value)
+    return str(value)
+
+
+class ResponseCache:
+    """An in-memory cache of evaluated responses, bounded by entry count
+    and by the byte size of the bodies they were decoded from.
+
+    Entries are keyed on the method, the resolved URL, the query
+    parameters and the `vary` headers of a request, and on the
+    credentials it's sent w/: its `Authorization`, `Cookie` and
+    `Proxy-Authorization` headers and the default headers, auth and
+    cookies of the client, so clients w/ different credentials never
+    share entries.  A response's
+    `Cache-Control` header takes precedence over `ttl` and
+    `stale_while_revalidate`; `no-store` responses aren't cached.  Expired
+    entries w/ an `ETag` or `Last-Modified` header are revalidated w/ a
+    conditional request and kept on a `304 Not Modified`.  Values are
+    copied in and out, so callers are free to mutate what they get.
+    """
+    __slots__ = (
+        '__entries',
+        '__lock',
+        '__maxbytes',
+        '__maxsize',
+        '__nbytes',
+        '__refreshing',
+        '__stale_while_revalidate',
+        '__ttl',
+        '__vary',
+    )
+
+    def __init__(
+            self,
+            ttl: float,
+            maxsize: Optional[int] = None,
+            maxbytes: Optional[int] = None,
+            vary: Iterable[str] = (),
+            stale_while_revalidate: float = 0
+    ):
+        self.__ttl = ttl
+        self.__maxsize = maxsize
+        self.__maxbytes = maxbytes
+        self.__vary: Tuple[str] = tuple(dict.fromkeys((
+            *_CREDENTIAL_HEADERS, *(header.lower() for header in vary)
+        )))
+        self.__stale_while_revalidate = stale_while_revalidate
+        self.__entries: OrderedDict = OrderedDict()
+        self.__nbytes = 0
+        self.__refreshing: Set[Hashable] = set()
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self.__nbytes
+
+    @staticmethod
+    def cacheable(method: str) -> bool:
+        return method.upper() in _CACHEABLE_METHODS
+
+    def key(
+            self,
+            method: str,
+            url: str,
+            query_params: Mapping,
+            headers: Mapping,
+            credentials: Hashable = None
+    ) -> Hashable:
+        varying = {key.lower(): val for key, val in headers.items()}
+        return (
+            method.upper(),
+            url,
+            tuple(sorted(
+                (str(key), _freeze(val)) for key, val in query_params.items()
+            )),
+            tuple((header, varying.get(header)) for header in self.__vary),
+            credentials,
+        )
+
+    def lookup(
+            self, key: Hashable
+    ) -> Tuple[Optional[TypeCacheEntryDump], AliasCacheState]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None, AliasCacheState.MISS
+            self.__entries.move_to_end(key)
+        now = monotonic()
+        if now < entry.fresh_until:
+            return entry, AliasCacheState.FRESH
+        if now < entry.stale_until:
+            return entry, AliasCacheState.STALE
+        return entry, AliasCacheState.EXPIRED
+
+    def conditional_headers(self, entry: Optional[TypeCacheEntryDump]) -> Dict:
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def __lifetime(self, headers: Mapping) -> Optional[Tuple[float, float]]:
+        directives = _parse_cache_control(headers.get('Cache-Control'))
+        if 'no-store' in directives:
+            return None
+        ttl = 0 if 'no-cache' in directives else _seconds(
+            directives.get('max-age'), self.__ttl
+        )
+        stale = _seconds(
+            directives.get('stale-while-revalidate'),
+            self.__stale_while_revalidate
+        )
+        now = monotonic()
+        return now + ttl, now + ttl + stale
+
+    @staticmethod
+    def value(entry: TypeCacheEntryDump) -> Any:
+        """A copy of the value of `entry`.
+        """
+        return deepcopy(entry.value)
+
+    def store(
+            self, key: Hashable, value: Any, headers: Mapping, size: int
+    ) -> None:
+        self.__put(key, deepcopy(value), headers, size)
+
+    def __put(
+            self, key: Hashable, value: Any, headers: Mapping, size: int
+    ) -> None:
+        lifetime = self.__lifetime(headers)
+        if lifetime is None or (
+                self.__maxbytes is not None and size > self.__maxbytes
+        ):
+            self.discard(key)
+            return
+        entry = TypeCacheEntryDump(
+            value=value,
+            size=size,
+            fresh_until=lifetime[0],
+            stale_until=lifetime[1],
+            etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified')
+        )
+        with self.__lock:
+            previous = self.__entries.pop(key, None)
+            if previous is not None:
+                self.__nbytes -= previous.size
+            self.__entries[key] = entry
+            self.__nbytes += size
+            while self.__entries and (
+                    (self.__maxsize is not None and
+                     len(self.__entries) > self.__maxsize) or
+                    (self.__maxbytes is not None and
+                     self.__nbytes > self.__maxbytes)
+            ):
+                _, evicted = self.__entries.popitem(last=False)
+                self.__nbytes -= evicted.size
+
+    def refresh(
+            self, key: Hashable, entry: TypeCacheEntryDump, headers: Mapping
+    ) -> Any:
+        """Renews `entry` after a `304 Not Modified` and returns its value.
+        """
+        self.__put(key=key, value=entry.value, headers={
+            'Cache-Control': headers.get('Cache-Control'),
+            'ETag': headers.get('ETag') or entry.etag,
+            'Last-Modified': headers.get('Last-Modified') or entry.last_modified,
+        }, size=entry.size)
+        return self.value(entry)
+
+    def discard(self, key: Hashable) -> None:
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+            if entry is not None:
+                self.__nbytes -= entry.size
+
+    def begin_refresh(self, key: Hashable) -> bool:
+        """Claims the background revalidation of `key`.  Returns false if
+        it's already underway.
+        """
+        with self.__lock:
+            if key in self.__refreshing:
+                return False
+            self.__refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: Hashable) -> None:
+        with self.__lock:
+            self.__refreshing.discard(key)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__nbytes = 0
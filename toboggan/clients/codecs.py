@@ -0,0 +1,89 @@
+# Standard
+from functools import lru_cache
+from json import dumps as json_dumps, loads as json_loads
+from typing import Any, Optional, Tuple, Union
+
+# Local
+from toboggan.aliases import AliasCodecType
+from toboggan.models import TypeCodecDump, TypeCodecModuleErrDump
+
+
+class __NoCodecModule:
+    pass
+
+
+# Third-party
+try:
+    import msgspec
+except ModuleNotFoundError:
+    msgspec = __NoCodecModule
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = __NoCodecModule
+
+__all__ = ('codec_modules', 'resolve_codec',)
+
+_AUTO = 'auto'
+_PREFERENCE = (
+    AliasCodecType.ORJSON, AliasCodecType.MSGSPEC, AliasCodecType.JSON,
+)
+
+
+@lru_cache(maxsize=1)
+def _resolve_codec_modules() -> Tuple[AliasCodecType]:
+    base = [AliasCodecType.JSON]
+    if msgspec is not __NoCodecModule:
+        base.append(AliasCodecType.MSGSPEC)
+    if orjson is not __NoCodecModule:
+        base.append(AliasCodecType.ORJSON)
+    return tuple(base)
+
+codec_modules: Tuple[AliasCodecType] = _resolve_codec_modules()
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json_dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _build_codec(codec_type: AliasCodecType) -> TypeCodecDump:
+    if codec_type is AliasCodecType.ORJSON:
+        return TypeCodecDump(
+            codec_type=codec_type, dumps=orjson.dumps, loads=orjson.loads
+        )
+    if codec_type is AliasCodecType.MSGSPEC:
+        return TypeCodecDump(
+            codec_type=codec_type,
+            dumps=msgspec.json.Encoder().encode,
+            loads=msgspec.json.Decoder().decode
+        )
+    return TypeCodecDump(
+        codec_type=codec_type, dumps=_json_dumps, loads=json_loads
+    )
+
+
+def resolve_codec(
+        codec: Union[None, str, AliasCodecType, TypeCodecDump]
+) -> Optional[TypeCodecDump]:
+    """Resolves the codec a :py:class:`Connector` encodes `Body` values 
+    and decodes JSON responses with.
+
+    - `None` leaves both to the client's built-in JSON support.
+    - `'auto'` picks the fastest codec installed: `orjson`, then 
+      `msgspec`, then the standard library's `json`.
+    - `'orjson'`, `'msgspec'`, `'json'` or an `AliasCodecType` picks a 
+      specific codec.
+    - A `TypeCodecDump` plugs in any other codec.
+    """
+    if codec is None or isinstance(codec, TypeCodecDump):
+        return codec
+    if codec == _AUTO:
+        return _build_codec(
+            next(type_ for type_ in _PREFERENCE if type_ in codec_modules)
+        )
+    if isinstance(codec, str):
+        codec = AliasCodecType.__members__.get(codec.upper(), codec)
+    if codec not in codec_modules:
+        raise ModuleNotFoundError(TypeCodecModuleErrDump(codec=codec))
+    return _build_codec(codec)
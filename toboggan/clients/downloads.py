@@ -0,0 +1,109 @@
+# Standard
+from contextlib import suppress
+from hashlib import new as new_hash
+from os import chmod, close, fsync, fspath, replace, umask, unlink
+from os.path import abspath, basename, dirname
+from tempfile import mkstemp
+from typing import Any, Optional
+
+# Local
+from toboggan.models import TypeDownloadDump, TypeFileDump
+
+__all__ = ('Download', '_content_length',)
+
+
+def _file_mode() -> int:
+    mask = umask(0)
+    umask(mask)
+    return 0o666 & ~mask
+
+
+_FILE_MODE = _file_mode()
+
+
+def _content_length(headers: Any) -> Optional[int]:
+    try:
+        return int(headers.get('Content-Length'))
+    except (TypeError, ValueError):
+        return None
+
+
+class Download:
+    """Writes a response body to `target` chunk by chunk while hashing it.
+
+    A path is written through a temporary file in the same directory,
+    renamed over `target` once the body is complete, so a failed download
+    never leaves a partial file behind, and the file gets the mode `open`
+    would create it w/ under the process' umask.  A file object is
+    written to as is.  `progress` is called after each chunk w/ the
+    bytes written so far and the `Content-Length` of the response, if
+    any.
+    """
+    __slots__ = (
+        '__config', '__digest', '__file', '__path', '__size', '__temp', '__total',
+    )
+
+    def __init__(self, config: TypeDownloadDump, total: Optional[int] = None):
+        self.__config = config
+        self.__total = total
+        self.__digest = new_hash(config.hash_algorithm)
+        self.__size = 0
+        self.__temp: Optional[str] = None
+        if hasattr(config.target, 'write'):
+            self.__file = config.target
+            name = getattr(config.target, 'name', None)
+            self.__path = abspath(name) if isinstance(name, str) else None
+        else:
+            self.__path = abspath(fspath(config.target))
+            descriptor, self.__temp = mkstemp(
+                dir=dirname(self.__path),
+                prefix=f'.{basename(self.__path)}.',
+                suffix='.part'
+            )
+            try:
+                self.__file = open(descriptor, 'wb')
+            except BaseException:
+                close(descriptor)
+                unlink(self.__temp)
+                raise
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def write(self, chunk: bytes) -> None:
+        self.__file.write(chunk)
+        self.__digest.update(chunk)
+        self.__size += len(chunk)
+        if self.__config.progress is not None:
+            self.__config.progress(self.__size, self.__total)
+
+    def commit(self) -> TypeFileDump:
+        """Completes the download and returns its path, size and hash.
+        """
+        if self.__temp is not None:
+            temp, self.__temp = self.__temp, None
+            try:
+                with self.__file:
+                    self.__file.flush()
+                    fsync(self.__file.fileno())
+                chmod(temp, _FILE_MODE)
+                replace(temp, self.__path)
+            except BaseException:
+                with suppress(OSError):
+                    unlink(temp)
+                raise
+        return TypeFileDump(
+            path=self.__path,
+            size=self.__size,
+            hash=self.__digest.hexdigest(),
+            hash_algorithm=self.__digest.name
+        )
+
+    def abort(self) -> None:
+        """Discards the temporary file of an incomplete download.
+        """
+        if self.__temp is not None:
+            self.__file.close()
+            unlink(self.__temp)
+            self.__temp = None
@@ -0,0 +1,247 @@
+# Standard
+from inspect import isclass
+from typing import Any, Dict, Hashable, Iterable, Mapping, Optional, Union
+
+# Third-party
+from requests import Session
+
+# Local
+from .streams import _httpx_stream
+from toboggan.aliases import AliasSessionType
+from toboggan.models import TypeClientModuleErrDump
+
+
+class __NoClientModule:
+    err = TypeClientModuleErrDump()
+
+
+try:
+    from aiohttp import ClientSession
+except ModuleNotFoundError:
+    ClientSession = __NoClientModule
+
+try:
+    from httpx import AsyncClient, Client
+except ModuleNotFoundError:
+    AsyncClient = __NoClientModule
+    Client = __NoClientModule
+
+__all__ = (
+    'AiohttpDriver',
+    'AsyncClient',
+    'Client',
+    'ClientSession',
+    'Driver',
+    'Drivers',
+    'HttpxAsyncDriver',
+    'HttpxDriver',
+    'RequestsDriver',
+    'Session',
+    'drivers',
+    'resolve_driver',
+)
+
+
+def _auth(auth: Any) -> Hashable:
+    if auth is None:
+        return None
+    try:
+        hash(auth)
+    except TypeError:
+        return type(auth).__qualname__, repr(sorted(
+            getattr(auth, '__dict__', {}).items()
+        ))
+    return auth
+
+
+def _credentials(
+        headers: Mapping, auth: Any, cookies: Iterable[Hashable]
+) -> Hashable:
+    """Fingerprints what a client sends w/ every request on its own: its
+    default headers, its auth and its cookies.
+    """
+    return (
+        tuple(sorted((key.lower(), str(val)) for key, val in headers.items())),
+        _auth(auth),
+        tuple(sorted(cookies)),
+    )
+
+
+class Driver:
+    """Sends requests through one kind of client and reads the responses
+    that come back: their status, headers and body, whole or in chunks,
+    and releases them.
+
+    `send` and `stream` take the keyword arguments of a call, as assembled
+    for `client_type`.  A `nonblocking` driver returns awaitables from
+    `send`, `stream`, `read` and `release` and async iterators from
+    `chunks`.  W/ `awaits_body`, responses are decoded the way `aiohttp`'s
+    are, w/ awaitable `read`, `json` and `text` methods; otherwise the way
+    `requests`' and `httpx`' are, w/ `content`, `json` and `text`.
+
+    The base class drives a `requests.Session` or anything w/ the same
+    interface.  Subclass it and :py:meth:`Drivers.register` an instance to
+    send w/ another client, or w/ a faster driver for a built-in one.
+    """
+    __slots__ = ()
+    client_type: AliasSessionType = AliasSessionType.REQUESTS
+    nonblocking: bool = False
+    awaits_body: bool = False
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}()'
+
+    def send(self, session: Any, request: Dict) -> Any:
+        return session.request(**request)
+
+    def stream(self, session: Any, request: Dict) -> Any:
+        """Sends a request w/o reading the response body.
+        """
+        return session.request(stream=True, **request)
+
+    def status(self, response: Any) -> int:
+        return response.status_code
+
+    def headers(self, response: Any) -> Mapping:
+        return response.headers
+
+    def read(self, response: Any) -> Any:
+        return response.content
+
+    def chunks(self, response: Any, chunk_size: int) -> Any:
+        return response.iter_content(chunk_size)
+
+    def release(self, response: Any) -> Any:
+        return response.close()
+
+    def credentials(self, session: Any) -> Hashable:
+        """Fingerprints the headers, auth and cookies `session` adds to
+        each request, so responses to one set of credentials aren't served
+        to another.
+        """
+        return _credentials(session.headers, session.auth, (
+            (cookie.domain, cookie.path, cookie.name, cookie.value)
+            for cookie in session.cookies
+        ))
+
+
+class RequestsDriver(Driver):
+    """Drives a `requests.Session`.
+    """
+    __slots__ = ()
+
+
+class HttpxDriver(Driver):
+    """Drives an `httpx.Client`.
+    """
+    __slots__ = ()
+    client_type = AliasSessionType.HTTPX_SYNC
+
+    def stream(self, session: Any, request: Dict) -> Any:
+        return _httpx_stream(session, **request)
+
+    def chunks(self, response: Any, chunk_size: int) -> Any:
+        return response.iter_bytes(chunk_size)
+
+    def credentials(self, session: Any) -> Hashable:
+        return _credentials(session.headers, session.auth, (
+            (cookie.domain, cookie.path, cookie.name, cookie.value)
+            for cookie in session.cookies.jar
+        ))
+
+
+class HttpxAsyncDriver(HttpxDriver):
+    """Drives an `httpx.AsyncClient`.
+    """
+    __slots__ = ()
+    client_type = AliasSessionType.HTTPX_ASYNC
+    nonblocking = True
+
+    async def read(self, response: Any) -> bytes:
+        return response.content
+
+    def chunks(self, response: Any, chunk_size: int) -> Any:
+        return response.aiter_bytes(chunk_size)
+
+    async def release(self, response: Any) -> None:
+        await response.aclose()
+
+
+class AiohttpDriver(Driver):
+    """Drives an `aiohttp.ClientSession`.
+    """
+    __slots__ = ()
+    client_type = AliasSessionType.AIOHTTP
+    nonblocking = True
+    awaits_body = True
+
+    def stream(self, session: Any, request: Dict) -> Any:
+        return session.request(**request)
+
+    def status(self, response: Any) -> int:
+        return response.status
+
+    def read(self, response: Any) -> Any:
+        return response.read()
+
+    def chunks(self, response: Any, chunk_size: int) -> Any:
+        return response.content.iter_chunked(chunk_size)
+
+    async def release(self, response: Any) -> None:
+        response.release()
+
+    def credentials(self, session: Any) -> Hashable:
+        return _credentials(session.headers, session.auth, (
+            (morsel['domain'], morsel['path'], morsel.key, morsel.value)
+            for morsel in session.cookie_jar
+        ))
+
+
+class Drivers:
+    """The drivers of the client classes toboggan sends w/.  A client is
+    driven by the driver registered for the nearest class in its MRO, so
+    subclasses of a client share its driver.
+    """
+    __slots__ = ('__drivers',)
+
+    def __init__(self):
+        self.__drivers: Dict[type, Driver] = {}
+
+    def register(self, client_cls: type, driver: Driver) -> Driver:
+        """Registers `driver` for `client_cls` and its subclasses, in place
+        of any driver registered for it before.  Connectors resolve their
+        driver when their client is assigned, so register it before then.
+
+        ::
+
+            drivers.register(FastClient, FastDriver())
+        """
+        self.__drivers[client_cls] = driver
+        return driver
+
+    def get(self, client: Union[type, Any]) -> Optional[Driver]:
+        client_cls = client if isclass(client) else type(client)
+        for cls in client_cls.__mro__:
+            driver = self.__drivers.get(cls)
+            if driver is not None:
+                return driver
+        return None
+
+
+drivers = Drivers()
+drivers.register(Session, RequestsDriver())
+if Client is not __NoClientModule:
+    drivers.register(Client, HttpxDriver())
+    drivers.register(AsyncClient, HttpxAsyncDriver())
+if ClientSession is not __NoClientModule:
+    drivers.register(ClientSession, AiohttpDriver())
+
+
+def resolve_driver(client: Union[type, Any]) -> Driver:
+    """Resolves the driver of a client or of a client class from the
+    process-wide `drivers`.
+    """
+    driver = drivers.get(client)
+    if driver is None:
+        raise ModuleNotFoundError(__NoClientModule.err)
+    return driver
@@ -0,0 +1,266 @@
+# Standard
+from asyncio import CancelledError, Queue, Semaphore, create_task, gather
+from collections import deque
+from collections.abc import AsyncIterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from copy import copy
+from itertools import islice
+from threading import Lock, get_ident, local
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# Third-party
+from requests import Session
+
+__all__ = (
+    '_ThreadSessions',
+    '_amap',
+    '_call_args',
+    '_clone_session',
+    '_detach_session',
+    '_map',
+)
+
+_END = object()
+
+
+def _call_args(item: Any) -> Tuple[Tuple, Dict]:
+    """Unpacks one set of call arguments.  A mapping is passed as keyword
+    arguments, a tuple as positional arguments and anything else as the
+    only positional argument.
+    """
+    if isinstance(item, Mapping):
+        return (), dict(item)
+    if isinstance(item, tuple):
+        return item, {}
+    return (item,), {}
+
+
+async def _aiter(arguments: Union[Iterable, AsyncIterable]) -> AsyncIterator:
+    if isinstance(arguments, AsyncIterable):
+        async for item in arguments:
+            yield item
+    else:
+        for item in arguments:
+            yield item
+
+
+async def _amap(
+        func: Callable[..., Awaitable],
+        arguments: Union[Iterable, AsyncIterable],
+        limit: int,
+        queue_size: int,
+        ordered: bool
+) -> AsyncIterator:
+    """Calls `func` once per set of arguments w/ at most `limit` calls in
+    flight.  At most `limit + queue_size` argument sets are pulled from
+    `arguments` ahead of the results yielded, so neither the input nor
+    the results are buffered w/o bound.  The first error cancels every
+    call still in flight and is raised.
+    """
+    pending: Queue = Queue()
+    done: Queue = Queue()
+    window = Semaphore(limit + queue_size)
+
+    async def produce() -> None:
+        index = 0
+        try:
+            async for item in _aiter(arguments):
+                await window.acquire()
+                await pending.put((index, item))
+                index += 1
+        except CancelledError:
+            raise
+        except BaseException as err:
+            await done.put((None, None, err))
+        finally:
+            for _ in range(limit):
+                pending.put_nowait(None)
+        await done.put((_END, index, None))
+
+    async def work() -> None:
+        while (entry := await pending.get()) is not None:
+            index, item = entry
+            args, kwargs = _call_args(item)
+            try:
+                result = await func(*args, **kwargs)
+            except CancelledError:
+                raise
+            except BaseException as err:
+                await done.put((index, None, err))
+            else:
+                await done.put((index, result, None))
+
+    tasks = [create_task(produce())]
+    tasks.extend(create_task(work()) for _ in range(limit))
+    try:
+        total = None
+        yielded = 0
+        buffer: Dict[int, Any] = {}
+        while total is None or yielded < total:
+            index, result, err = await done.get()
+            if err is not None:
+                raise err
+            if index is _END:
+                total = result
+                continue
+            if not ordered:
+                yielded += 1
+                window.release()
+                yield result
+                continue
+            buffer[index] = result
+            while yielded in buffer:
+                result = buffer.pop(yielded)
+                yielded += 1
+                window.release()
+                yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+        await gather(*tasks, return_exceptions=True)
+
+
+def _clone_session(session: Session) -> Session:
+    """Builds a `requests.Session` w/ the same configuration as `session` 
+    but its own connection pools, so each thread can use its own.
+    """
+    clone = Session()
+    clone.headers = session.headers.copy()
+    clone.cookies = session.cookies.copy()
+    clone.auth = session.auth
+    clone.proxies = dict(session.proxies)
+    clone.hooks = {event: list(hooks) for event, hooks in session.hooks.items()}
+    clone.params = dict(session.params)
+    clone.stream = session.stream
+    clone.verify = session.verify
+    clone.cert = session.cert
+    clone.max_redirects = session.max_redirects
+    clone.trust_env = session.trust_env
+    clone.adapters.clear()
+    for prefix, adapter in session.adapters.items():
+        clone.mount(prefix, copy(adapter))
+    return clone
+
+
+def _detach_session(session: Any) -> Tuple[Any, bool]:
+    """Returns a session another thread can send through in place of 
+    `session` and whether it's a clone to close once done: a clone of a 
+    `requests.Session`, which isn't thread-safe, or `session` itself.
+    """
+    if isinstance(session, Session):
+        return _clone_session(session), True
+    detach = getattr(session, 'detach', None)
+    if detach is not None:
+        return detach(), True
+    return session, False
+
+
+class _ThreadSessions:
+    """Hands out the session each thread sends through in place of 
+    `session`: `session` itself in the `owner` thread, if any, and a 
+    session from :py:func:`_detach_session` in any other.  `close` closes 
+    the clones.
+    """
+    __slots__ = ('__clones', '__lock', '__owner', '__session', '__threads',)
+
+    def __init__(self, session: Any, owner: Optional[int] = None):
+        self.__session = session
+        self.__owner = owner
+        self.__clones: List[Any] = []
+        self.__lock = Lock()
+        self.__threads = local()
+
+    def get(self) -> Any:
+        if get_ident() == self.__owner:
+            return self.__session
+        session = getattr(self.__threads, 'session', None)
+        if session is None:
+            session, owned = _detach_session(self.__session)
+            self.__threads.session = session
+            if owned:
+                with self.__lock:
+                    self.__clones.append(session)
+        return session
+
+    def close(self) -> None:
+        with self.__lock:
+            clones, self.__clones = self.__clones, []
+        for clone in clones:
+            clone.close()
+
+
+def _map(
+        conn: Any,
+        func: Callable,
+        arguments: Iterable,
+        limit: int,
+        queue_size: int,
+        ordered: bool
+) -> Iterator:
+    """Calls the blocking endpoint function `func` once per set of 
+    arguments on a pool of `limit` threads.  `requests.Session` clients 
+    are cloned once per thread; each call runs against a shallow copy of 
+    `conn` that holds the thread's clone.  At most `limit + queue_size` 
+    calls are submitted ahead of the results yielded.  The first error 
+    cancels every call that has not started yet and is raised.
+    """
+    clones: List[Any] = []
+    lock = Lock()
+    threads = local()
+    clone_client = isinstance(conn.client, Session)
+
+    def call(item: Any) -> Any:
+        args, kwargs = _call_args(item)
+        if not clone_client:
+            return func(conn, *args, **kwargs)
+        clone = getattr(threads, 'conn', None)
+        if clone is None:
+            clone = threads.conn = copy(conn)
+            clone.client = _clone_session(conn.client)
+            with lock:
+                clones.append(clone)
+        return func(clone, *args, **kwargs)
+
+    executor = ThreadPoolExecutor(
+        max_workers=limit, thread_name_prefix='toboggan'
+    )
+    items = iter(arguments)
+    futures: deque = deque(
+        executor.submit(call, item)
+        for item in islice(items, limit + queue_size)
+    )
+
+    def submit_next() -> None:
+        for item in islice(items, 1):
+            futures.append(executor.submit(call, item))
+
+    try:
+        if ordered:
+            while futures:
+                result = futures.popleft().result()
+                submit_next()
+                yield result
+        else:
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    futures.remove(future)
+                    result = future.result()
+                    submit_next()
+                    yield result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        for clone in clones:
+            clone.client.close()
@@ -0,0 +1,114 @@
+# Standard
+from asyncio import Task, get_running_loop, shield
+from hashlib import blake2b
+from json import dumps as json_dumps
+from threading import Event, Lock
+from typing import (
+    Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Tuple,
+)
+
+__all__ = ('SingleFlight', '_flight_key',)
+
+_IDEMPOTENT_METHODS = frozenset((
+    'DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT', 'TRACE',
+))
+
+
+def _digest(send: Mapping) -> Optional[Tuple[str, bytes]]:
+    if not send:
+        return None
+    (kind, body), = send.items()
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    elif not isinstance(body, (bytes, bytearray, memoryview)):
+        body = json_dumps(body, sort_keys=True, default=str).encode('utf-8')
+    return kind, blake2b(body, digest_size=16).digest()
+
+
+def _flight_key(
+        session: Any,
+        method: str,
+        url: str,
+        query_params: Mapping,
+        headers: Mapping,
+        send: Mapping
+) -> Hashable:
+    return (
+        id(session),
+        method.upper(),
+        url,
+        tuple(sorted((str(key), str(val)) for key, val in query_params.items())),
+        tuple(sorted((key.lower(), str(val)) for key, val in headers.items())),
+        _digest(send),
+    )
+
+
+class _Flight:
+    __slots__ = ('done', 'error', 'result',)
+
+    def __init__(self):
+        self.done = Event()
+        self.error: Optional[BaseException] = None
+        self.result: Any = None
+
+
+class SingleFlight:
+    """Dedupes concurrent identical requests of one endpoint: the first
+    caller sends the request and every caller that asks for the same key
+    while it's in flight gets its result, or its error.
+
+    Async calls run in a task of their own, so a cancelled caller doesn't
+    cancel the request for the others.  Blocking calls wait on the
+    calling thread of the first caller.
+    """
+    __slots__ = ('__flights', '__lock', '__tasks',)
+
+    def __init__(self):
+        self.__flights: Dict[Hashable, _Flight] = {}
+        self.__tasks: Dict[Hashable, Task] = {}
+        self.__lock = Lock()
+
+    @staticmethod
+    def idempotent(method: str) -> bool:
+        return method.upper() in _IDEMPOTENT_METHODS
+
+    def __len__(self) -> int:
+        return len(self.__flights) + len(self.__tasks)
+
+    def run_sync(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        with self.__lock:
+            flight = self.__flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.__flights[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = call()
+        except BaseException as err:
+            flight.error = err
+            raise
+        finally:
+            with self.__lock:
+                del self.__flights[key]
+            flight.done.set()
+        return flight.result
+
+    def __land(self, key: Hashable, task: Task) -> None:
+        if self.__tasks.get(key) is task:
+            del self.__tasks[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def run_async(
+            self, key: Hashable, call: Callable[[], Awaitable]
+    ) -> Any:
+        key = (get_running_loop(), key)
+        task = self.__tasks.get(key)
+        if task is None:
+            task = self.__tasks[key] = get_running_loop().create_task(call())
+            task.add_done_callback(lambda done: self.__land(key, done))
+        return await shield(task)
@@ -0,0 +1,329 @@
+# Standard
+from collections.abc import Mapping
+from json import dump as json_dump
+from os import getpid
+from threading import Lock
+from time import perf_counter
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, List,
+    Optional, Union,
+)
+
+# Local
+from toboggan.models import TypeTimingDump
+
+__all__ = (
+    'ChromeTrace',
+    'Hook',
+    'Hooks',
+    'Timing',
+    'resolve_hooks',
+    '_acounted',
+    '_counted',
+    '_request_size',
+)
+
+_EVENTS = ('on_request', 'on_response', 'on_retry', 'on_error',)
+_STAGES = (
+    ('bind', 'started', 'bound'),
+    ('resolve', 'bound', 'resolved'),
+    ('wait', 'resolved', 'sent'),
+    ('network', 'sent', 'received'),
+    ('decode', 'received', 'decoded'),
+    ('validate', 'decoded', 'validated'),
+)
+
+Hook = Callable[[TypeTimingDump], Any]
+
+
+def _request_size(response: Any) -> Optional[int]:
+    """The size of the body sent for `response`, read from the headers of
+    the request the client sent, or `None` if it was chunked.
+    """
+    try:
+        request = getattr(response, 'request_info', None) or response.request
+        headers = request.headers
+    except (AttributeError, RuntimeError):
+        return None
+    length = headers.get('Content-Length')
+    if length is not None:
+        return int(length)
+    return None if headers.get('Transfer-Encoding') else 0
+
+
+class Hooks:
+    """The lifecycle hooks of a :py:class:`Connector`.  Each hook is called
+    w/ a `TypeTimingDump` of the call so far:
+
+    - `on_request` before each attempt is sent;
+    - `on_retry` when an attempt failed and is about to be retried;
+    - `on_response` once the call returns, or its stream is exhausted;
+    - `on_error` when the call raises.
+
+    Hooks run inline, so they should be quick; an error raised by a hook
+    is raised by the call.
+    """
+    __slots__ = _EVENTS
+
+    def __init__(
+            self,
+            on_request: Union[None, Hook, Iterable[Hook]] = None,
+            on_response: Union[None, Hook, Iterable[Hook]] = None,
+            on_retry: Union[None, Hook, Iterable[Hook]] = None,
+            on_error: Union[None, Hook, Iterable[Hook]] = None
+    ):
+        for event, hooks in zip(
+                _EVENTS, (on_request, on_response, on_retry, on_error)
+        ):
+            if hooks is None:
+                hooks = []
+            elif callable(hooks):
+                hooks = [hooks]
+            setattr(self, event, list(hooks))
+
+    def __bool__(self) -> bool:
+        return any(getattr(self, event) for event in _EVENTS)
+
+    def __repr__(self) -> str:
+        counts = ', '.join(
+            f'{event}={len(getattr(self, event))}' for event in _EVENTS
+        )
+        return f'{self.__class__.__name__}({counts})'
+
+    def merge(self, other: 'Hooks') -> 'Hooks':
+        """New hooks that call these hooks, then `other`.
+        """
+        return Hooks(**{
+            event: getattr(self, event) + getattr(other, event)
+            for event in _EVENTS
+        })
+
+    def register(self, event: str, hook: Hook) -> Hook:
+        if event not in _EVENTS:
+            raise ValueError(f'`event` must be one of {", ".join(_EVENTS)}.')
+        getattr(self, event).append(hook)
+        return hook
+
+
+class Timing:
+    """The stages of one call, stamped w/ `time.perf_counter` as it goes,
+    and the :py:class:`Hooks` it reports to.
+    """
+    __slots__ = (
+        'attempts',
+        'bound',
+        'bytes_received',
+        'bytes_sent',
+        'connector',
+        'decoded',
+        'endpoint',
+        'error',
+        'finished',
+        'hooks',
+        'method',
+        'received',
+        'resolved',
+        'sent',
+        'started',
+        'status_code',
+        'url',
+        'validated',
+    )
+
+    def __init__(
+            self,
+            hooks: Hooks,
+            endpoint: str,
+            connector: str,
+            started: float,
+            bound: float
+    ):
+        self.hooks = hooks
+        self.endpoint = endpoint
+        self.connector = connector
+        self.started = started
+        self.bound = bound
+        self.method = self.url = None
+        self.resolved = self.sent = self.received = None
+        self.decoded = self.validated = self.finished = None
+        self.attempts = 0
+        self.status_code = self.bytes_sent = self.bytes_received = None
+        self.error = None
+
+    def dump(self) -> TypeTimingDump:
+        return TypeTimingDump(
+            endpoint=self.endpoint,
+            connector=self.connector,
+            method=self.method,
+            url=self.url,
+            started=self.started,
+            bound=self.bound,
+            resolved=self.resolved,
+            sent=self.sent,
+            received=self.received,
+            decoded=self.decoded,
+            validated=self.validated,
+            finished=self.finished,
+            attempts=self.attempts,
+            status_code=self.status_code,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            error=self.error
+        )
+
+    def __emit(self, hooks: List[Hook]) -> None:
+        if hooks:
+            dump = self.dump()
+            for hook in hooks:
+                hook(dump)
+
+    def resolve(self, method: str, url: str) -> None:
+        self.method = method.upper()
+        self.url = url
+        self.resolved = perf_counter()
+
+    def send(self) -> None:
+        self.attempts += 1
+        self.received = self.decoded = self.validated = None
+        self.status_code = self.bytes_received = None
+        self.sent = perf_counter()
+        self.__emit(self.hooks.on_request)
+
+    def receive(self, response: Any, status_code: int) -> None:
+        self.received = perf_counter()
+        self.status_code = status_code
+        self.bytes_sent = _request_size(response)
+
+    def retry(self, error: Optional[BaseException] = None) -> None:
+        self.error = error
+        self.__emit(self.hooks.on_retry)
+        self.error = None
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.finished = perf_counter()
+        self.error = error
+        self.__emit(self.hooks.on_error if error is not None else self.hooks.on_response)
+
+
+def _counted(chunks: Iterable[bytes], timing: Timing) -> Iterator[bytes]:
+    timing.bytes_received = 0
+    for chunk in chunks:
+        timing.bytes_received += len(chunk)
+        yield chunk
+
+
+async def _acounted(
+        chunks: AsyncIterable[bytes], timing: Timing
+) -> AsyncIterator[bytes]:
+    timing.bytes_received = 0
+    async for chunk in chunks:
+        timing.bytes_received += len(chunk)
+        yield chunk
+
+
+class ChromeTrace(Hooks):
+    """Hooks that record every call and export them in the Chrome trace
+    event format, to be loaded in `chrome://tracing` or Perfetto.
+
+    Each call is a slice named after its endpoint w/ a nested slice per
+    stage.  Calls are laid out on as few tracks as they overlap, so the
+    concurrency of an async run reads at a glance.
+
+    ::
+
+        trace = ChromeTrace()
+        poke_api = PokeApi(client=ClientSession, hooks=trace)
+        ...
+        trace.dump('trace.json')
+    """
+    __slots__ = ('__lock', '__timings',)
+
+    def __init__(self):
+        super().__init__(on_response=self.__record, on_error=self.__record)
+        self.__lock = Lock()
+        self.__timings: List[TypeTimingDump] = []
+
+    @property
+    def timings(self) -> List[TypeTimingDump]:
+        with self.__lock:
+            return list(self.__timings)
+
+    def __record(self, timing: TypeTimingDump) -> None:
+        with self.__lock:
+            self.__timings.append(timing)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__timings.clear()
+
+    def events(self) -> List[Dict]:
+        """The recorded calls as trace events, w/ timestamps in
+        microseconds.
+        """
+        pid = getpid()
+        events: List[Dict] = []
+        lanes: List[float] = []
+        for timing in sorted(self.timings, key=lambda timing: timing.started):
+            end = timing.finished or timing.started
+            lane = next(
+                (no for no, free in enumerate(lanes) if free <= timing.started),
+                len(lanes)
+            )
+            if lane == len(lanes):
+                lanes.append(end)
+            else:
+                lanes[lane] = end
+            events.append(dict(
+                name=timing.endpoint,
+                cat='request',
+                ph='X',
+                ts=timing.started * 1e6,
+                dur=(end - timing.started) * 1e6,
+                pid=pid,
+                tid=lane,
+                args=dict(
+                    method=timing.method,
+                    url=timing.url,
+                    status_code=timing.status_code,
+                    attempts=timing.attempts,
+                    bytes_sent=timing.bytes_sent,
+                    bytes_received=timing.bytes_received,
+                    error=None if timing.error is None else repr(timing.error)
+                )
+            ))
+            for name, start, stop in _STAGES:
+                start = getattr(timing, start)
+                if name == 'validate' and start is None:
+                    start = timing.received
+                stop = getattr(timing, stop)
+                if start is None or stop is None:
+                    continue
+                events.append(dict(
+                    name=name,
+                    cat='stage',
+                    ph='X',
+                    ts=start * 1e6,
+                    dur=(stop - start) * 1e6,
+                    pid=pid,
+                    tid=lane
+                ))
+        return events
+
+    def dump(self, file: Any) -> None:
+        """Writes the trace as JSON to a path or a text file object.
+        """
+        trace = dict(traceEvents=self.events(), displayTimeUnit='ms')
+        if hasattr(file, 'write'):
+            json_dump(trace, file)
+            return
+        with open(file, 'w') as stream:
+            json_dump(trace, stream)
+
+
+def resolve_hooks(hooks: Union[None, Mapping, Hooks]) -> Optional[Hooks]:
+    """Resolves the hooks of a :py:class:`Connector`.  A mapping is read as
+    the keyword arguments of :py:class:`Hooks`.
+    """
+    if hooks is None or isinstance(hooks, Hooks):
+        return hooks
+    return Hooks(**hooks)
@@ -0,0 +1,150 @@
+# Standard
+from asyncio import sleep as sleep_async
+from threading import Lock
+from time import monotonic, sleep as sleep_sync, time
+from typing import Any, Optional, Tuple
+
+__all__ = ('RateLimiter', '_quota',)
+
+_EPOCH_THRESHOLD = 10 ** 9
+_REMAINING_HEADERS = ('X-RateLimit-Remaining', 'RateLimit-Remaining',)
+_RESET_HEADERS = ('X-RateLimit-Reset', 'RateLimit-Reset',)
+
+
+def _header(headers: Any, names: Tuple[str, ...]) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+def _quota(headers: Any) -> Optional[Tuple[float, Optional[float]]]:
+    """Reads the remaining quota and the seconds until it resets from
+    `X-RateLimit-*` or `RateLimit-*` headers.  Resets are given in seconds
+    or, above 10^9, as a Unix timestamp.
+    """
+    remaining = _header(headers, _REMAINING_HEADERS)
+    if remaining is None:
+        return None
+    reset = _header(headers, _RESET_HEADERS)
+    if reset is not None and reset > _EPOCH_THRESHOLD:
+        reset -= time()
+    return max(0.0, remaining), reset if reset is None else max(0.0, reset)
+
+
+class RateLimiter:
+    """A token bucket of `burst` tokens that refills at `rate` tokens per
+    second.  Each request takes a token; when none is left, the caller
+    reserves the next one and sleeps, or awaits, until it's due, so
+    callers are served in order w/o polling.
+
+    W/ `adaptive`, `X-RateLimit-Remaining` and `X-RateLimit-Reset`
+    response headers (or their `RateLimit-*` counterparts) narrow the
+    bucket: the remaining quota caps the tokens left and, spread evenly
+    over the time until it resets, the rate, which never exceeds `rate`
+    and goes back to it once the quota resets.
+    """
+    __slots__ = (
+        '__adaptive',
+        '__burst',
+        '__configured',
+        '__lock',
+        '__rate',
+        '__stamp',
+        '__tokens',
+        '__until',
+    )
+
+    def __init__(
+            self, rate: float, burst: Optional[float] = None, adaptive: bool = True
+    ):
+        if rate <= 0:
+            raise ValueError('`rate` must be greater than 0.')
+        self.__rate = rate
+        self.__configured = rate
+        self.__until: Optional[float] = None
+        self.__burst = max(1.0, rate) if burst is None else burst
+        self.__adaptive = adaptive
+        self.__tokens = self.__burst
+        self.__stamp = monotonic()
+        self.__lock = Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'rate={self.__configured}, burst={self.__burst}, '
+            f'adaptive={self.__adaptive})'
+        )
+
+    @property
+    def rate(self) -> float:
+        """The current rate: the configured one, or the one adapted to
+        the quota left until it resets.
+        """
+        with self.__lock:
+            self.__refill()
+            return self.__rate
+
+    @property
+    def burst(self) -> float:
+        return self.__burst
+
+    @property
+    def tokens(self) -> float:
+        with self.__lock:
+            return self.__refill()
+
+    def __refill(self) -> float:
+        now = monotonic()
+        if self.__until is not None and now >= self.__until:
+            self.__tokens = min(
+                self.__burst,
+                self.__tokens + (self.__until - self.__stamp) * self.__rate
+            )
+            self.__stamp = self.__until
+            self.__rate = self.__configured
+            self.__until = None
+        self.__tokens = min(
+            self.__burst, self.__tokens + (now - self.__stamp) * self.__rate
+        )
+        self.__stamp = now
+        return self.__tokens
+
+    def reserve(self) -> float:
+        """Takes a token and returns the seconds to wait until it's due.
+        """
+        with self.__lock:
+            self.__tokens = self.__refill() - 1
+            if self.__tokens >= 0:
+                return 0.0
+            return -self.__tokens / self.__rate
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay:
+            sleep_sync(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self.reserve()
+        if delay:
+            await sleep_async(delay)
+
+    def update(self, headers: Any) -> None:
+        if not self.__adaptive:
+            return
+        quota = _quota(headers)
+        if quota is None:
+            return
+        remaining, reset = quota
+        with self.__lock:
+            self.__refill()
+            if reset:
+                self.__rate = min(
+                    self.__configured, max(remaining, 1.0) / reset
+                )
+                self.__until = monotonic() + reset
+            self.__tokens = min(self.__tokens, remaining)
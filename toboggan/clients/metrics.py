@@ -0,0 +1,274 @@
+# Standard
+from math import ceil
+from threading import Lock
+from typing import Dict, List, Optional, Tuple, Union
+
+# Local
+from .hooks import Hooks
+from toboggan.models import (
+    TypeEndpointMetricsDump, TypeHistogramDump, TypeTimingDump,
+)
+
+__all__ = (
+    'Histogram',
+    'Metrics',
+    'resolve_metrics',
+    'shared_metrics',
+)
+
+_QUANTILES = (('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('p999', 0.999),)
+
+
+def _label(value: str) -> str:
+    return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _labels(**labels: str) -> str:
+    return ','.join(f'{key}="{_label(val)}"' for key, val in labels.items())
+
+
+class Histogram:
+    """A log-linear histogram in the manner of HDR Histogram.  Values are
+    counted in whole `unit`s, exactly below 2^(`precision` + 1) and in
+    buckets 2^-`precision` wide, relative to their value, above it, so
+    percentiles are accurate to within 2^-(`precision` + 1) of the value
+    at any scale, w/ a few thousand buckets at most.
+    """
+    __slots__ = (
+        '__count', '__counts', '__max', '__min', '__precision', '__sum', '__unit',
+    )
+
+    def __init__(self, unit: float = 1.0, precision: int = 7):
+        self.__unit = unit
+        self.__precision = precision
+        self.__counts: Dict[int, int] = {}
+        self.__count = 0
+        self.__sum = 0.0
+        self.__min: Optional[float] = None
+        self.__max: Optional[float] = None
+
+    def __index(self, value: int) -> int:
+        precision = self.__precision
+        if value < 2 << precision:
+            return value
+        shift = value.bit_length() - precision - 1
+        return (shift << precision) + (value >> shift)
+
+    def __bounds(self, index: int) -> Tuple[int, int]:
+        precision = self.__precision
+        if index < 2 << precision:
+            return index, index
+        shift = (index >> precision) - 1
+        base = index - (shift << precision)
+        return base << shift, ((base + 1) << shift) - 1
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    def record(self, value: float) -> None:
+        value = max(0.0, value)
+        index = self.__index(int(value / self.__unit))
+        self.__counts[index] = self.__counts.get(index, 0) + 1
+        self.__count += 1
+        self.__sum += value
+        self.__min = value if self.__min is None else min(self.__min, value)
+        self.__max = value if self.__max is None else max(self.__max, value)
+
+    def quantile(self, quantile: float) -> Optional[float]:
+        """The value below which `quantile` (0 to 1) of the values fall,
+        or `None` if none was recorded.
+        """
+        if not self.__count:
+            return None
+        rank = max(1, ceil(quantile * self.__count))
+        seen = 0
+        for index in sorted(self.__counts):
+            seen += self.__counts[index]
+            if seen >= rank:
+                low, high = self.__bounds(index)
+                value = (low if low == high else (low + high + 1) / 2) * self.__unit
+                return min(max(value, self.__min), self.__max)
+        return self.__max
+
+    def dump(self) -> TypeHistogramDump:
+        return TypeHistogramDump(
+            count=self.__count,
+            sum=self.__sum,
+            min=self.__min,
+            max=self.__max,
+            **{name: self.quantile(quantile) for name, quantile in _QUANTILES}
+        )
+
+
+class _EndpointMetrics:
+    __slots__ = ('in_flight', 'latency', 'requests', 'response_size', 'retries',)
+
+    def __init__(self, in_flight: int = 0):
+        self.requests: Dict[str, int] = {}
+        self.retries = 0
+        self.in_flight = in_flight
+        self.latency = Histogram(unit=1e-6)
+        self.response_size = Histogram()
+
+
+class Metrics(Hooks):
+    """Hooks that keep the metrics of every endpoint, labeled by the class
+    of its :py:class:`Connector` and its method name: calls by status code
+    (`error` when no response came back), retries, calls in flight, and
+    histograms of the latency, in seconds, and of the response size, in
+    bytes.  Responses served from the cache or shared by coalesced calls
+    aren't counted.
+
+    ::
+
+        metrics = Metrics()
+        poke_api = PokeApi(client=ClientSession, metrics=metrics)
+        ...
+        metrics.as_dict()['PokeApi']['get_pokemon']['latency']['p99']
+        metrics.prometheus()
+    """
+    __slots__ = ('__endpoints', '__lock', '__namespace',)
+
+    def __init__(self, namespace: str = 'toboggan'):
+        super().__init__(
+            on_request=self.__request,
+            on_response=self.__finish,
+            on_retry=self.__retry,
+            on_error=self.__finish
+        )
+        self.__namespace = namespace
+        self.__lock = Lock()
+        self.__endpoints: Dict[Tuple[str, str], _EndpointMetrics] = {}
+
+    def __endpoint(self, timing: TypeTimingDump) -> _EndpointMetrics:
+        key = (timing.connector, timing.endpoint.rsplit('.', 1)[-1])
+        endpoint = self.__endpoints.get(key)
+        if endpoint is None:
+            endpoint = self.__endpoints[key] = _EndpointMetrics()
+        return endpoint
+
+    def __request(self, timing: TypeTimingDump) -> None:
+        if timing.attempts == 1:
+            with self.__lock:
+                self.__endpoint(timing).in_flight += 1
+
+    def __retry(self, timing: TypeTimingDump) -> None:
+        with self.__lock:
+            self.__endpoint(timing).retries += 1
+
+    def __finish(self, timing: TypeTimingDump) -> None:
+        if not timing.attempts and timing.error is None:
+            return
+        if timing.status_code is not None:
+            status = str(timing.status_code)
+        else:
+            status = 'error'
+        with self.__lock:
+            endpoint = self.__endpoint(timing)
+            endpoint.requests[status] = endpoint.requests.get(status, 0) + 1
+            if timing.attempts:
+                endpoint.in_flight -= 1
+                endpoint.latency.record(timing.finished - timing.started)
+            if timing.bytes_received is not None:
+                endpoint.response_size.record(timing.bytes_received)
+
+    def stats(self) -> List[TypeEndpointMetricsDump]:
+        with self.__lock:
+            return [
+                TypeEndpointMetricsDump(
+                    connector=connector,
+                    method=method,
+                    requests=dict(endpoint.requests),
+                    retries=endpoint.retries,
+                    in_flight=endpoint.in_flight,
+                    latency=endpoint.latency.dump(),
+                    response_size=endpoint.response_size.dump()
+                )
+                for (connector, method), endpoint in sorted(
+                    self.__endpoints.items()
+                )
+            ]
+
+    def as_dict(self) -> Dict[str, Dict[str, Dict]]:
+        """The metrics as `{connector: {method: {metric: value}}}`.
+        """
+        metrics: Dict[str, Dict[str, Dict]] = {}
+        for stats in self.stats():
+            metrics.setdefault(stats.connector, {})[stats.method] = dict(
+                requests=stats.requests,
+                retries=stats.retries,
+                in_flight=stats.in_flight,
+                latency=stats.latency._asdict(),
+                response_size=stats.response_size._asdict()
+            )
+        return metrics
+
+    def reset(self) -> None:
+        """Clears the metrics, keeping track of the calls in flight.
+        """
+        with self.__lock:
+            self.__endpoints = {
+                key: _EndpointMetrics(in_flight=endpoint.in_flight)
+                for key, endpoint in self.__endpoints.items() if endpoint.in_flight
+            }
+
+    def prometheus(self) -> str:
+        """The metrics in the Prometheus text exposition format.  The
+        histograms are exposed as summaries w/ the 0.5, 0.9, 0.99 and
+        0.999 quantiles.
+        """
+        prefix = self.__namespace
+        stats = self.stats()
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_: str) -> str:
+            name = f'{prefix}_{name}'
+            lines.append(f'# HELP {name} {help_}')
+            lines.append(f'# TYPE {name} {kind}')
+            return name
+
+        name = family('requests_total', 'counter', 'Calls by status code.')
+        for dump in stats:
+            for status, count in sorted(dump.requests.items()):
+                labels = _labels(
+                    connector=dump.connector, method=dump.method, status=status
+                )
+                lines.append(f'{name}{{{labels}}} {count}')
+        name = family('retries_total', 'counter', 'Attempts retried.')
+        for dump in stats:
+            labels = _labels(connector=dump.connector, method=dump.method)
+            lines.append(f'{name}{{{labels}}} {dump.retries}')
+        name = family('in_flight_requests', 'gauge', 'Calls in flight.')
+        for dump in stats:
+            labels = _labels(connector=dump.connector, method=dump.method)
+            lines.append(f'{name}{{{labels}}} {dump.in_flight}')
+        for metric, help_, field in (
+                ('request_duration_seconds', 'Latency of calls.', 'latency'),
+                ('response_size_bytes', 'Size of response bodies.', 'response_size'),
+        ):
+            name = family(metric, 'summary', help_)
+            for dump in stats:
+                histogram = getattr(dump, field)
+                labels = _labels(connector=dump.connector, method=dump.method)
+                for key, quantile in _QUANTILES:
+                    value = getattr(histogram, key)
+                    if value is not None:
+                        lines.append(
+                            f'{name}{{{labels},quantile="{quantile}"}} {value}'
+                        )
+                lines.append(f'{name}_sum{{{labels}}} {histogram.sum}')
+                lines.append(f'{name}_count{{{labels}}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+
+shared_metrics = Metrics()
+
+
+def resolve_metrics(metrics: Union[None, bool, Metrics]) -> Optional[Metrics]:
+    """Resolves the metrics of a :py:class:`Connector`.  `True` uses the
+    process-wide `shared_metrics`.
+    """
+    if metrics is True:
+        return shared_metrics
+    return metrics or None
@@ -0,0 +1,413 @@
+# Standard
+from asyncio import (
+    CancelledError, Queue as AsyncQueue, Semaphore as AsyncSemaphore, create_task,
+)
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from inspect import isclass
+from json import loads as json_loads
+from queue import Queue
+from re import compile as re_compile
+from threading import Event, Semaphore, Thread, get_ident
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple, get_args, get_origin
+from urllib.parse import urljoin
+
+# Local
+from .drivers import Driver
+from .fanout import _ThreadSessions
+from .hooks import Timing
+from .requests import Requests
+from .utils import _get_nested
+from toboggan.adapters import EvalReturn
+from toboggan.aliases import AliasPaginateType
+from toboggan.models import (
+    TypePageDump, TypePaginateDump, TypeRequestSettingsDump,
+)
+
+__all__ = ('Pages', '_next_link', '_read_ahead', '_aread_ahead',)
+
+_END = object()
+_LINK = re_compile(r'<([^>]*)>([^<]*)')
+_NEXT_REL = re_compile(r'rel\s*=\s*"?([^";]*)"?')
+_ITERABLE_ORIGINS = (AsyncIterable, AsyncIterator, Iterable, Iterator, list,)
+
+
+def _next_link(headers: Any) -> Optional[str]:
+    """Reads the `rel="next"` target of a `Link` header.
+    """
+    value = headers.get('Link')
+    if not value:
+        return None
+    for target, params in _LINK.findall(value):
+        rel = _NEXT_REL.search(params)
+        if rel is not None and 'next' in rel.group(1).split():
+            return target
+    return None
+
+
+def _lookup(json: Any, key: Any) -> Any:
+    try:
+        return _get_nested(json=json, value=key)
+    except (AttributeError, KeyError, TypeError):
+        return None
+
+
+def _item_type(eval_type: Any) -> Any:
+    """The type of the items of a return annotation such as
+    `Iterator[Model]`, if any.
+    """
+    origin = get_origin(eval_type)
+    if isclass(origin) and issubclass(origin, _ITERABLE_ORIGINS):
+        args = get_args(eval_type)
+        return args[0] if args else None
+    return None
+
+
+def _read_ahead(pages: Iterator, depth: int) -> Iterator:
+    """Iterates over `pages` in a background thread, up to `depth` pages
+    ahead of the caller.
+    """
+    queue: Queue = Queue()
+    slots = Semaphore(depth)
+    stop = Event()
+
+    def produce() -> None:
+        try:
+            while True:
+                slots.acquire()
+                if stop.is_set():
+                    return
+                page = next(pages, _END)
+                queue.put((page, None))
+                if page is _END:
+                    return
+        except BaseException as error:
+            queue.put((_END, error))
+        finally:
+            pages.close()
+
+    Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            page, error = queue.get()
+            if page is _END:
+                if error is not None:
+                    raise error
+                return
+            slots.release()
+            yield page
+    finally:
+        stop.set()
+        slots.release()
+
+
+async def _aread_ahead(pages: AsyncIterator, depth: int) -> AsyncIterator:
+    """The nonblocking counterpart of :py:func:`_read_ahead`, w/ a task in
+    place of the thread.
+    """
+    queue: AsyncQueue = AsyncQueue()
+    slots = AsyncSemaphore(depth)
+
+    async def produce() -> None:
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    page = await pages.__anext__()
+                except StopAsyncIteration:
+                    queue.put_nowait((_END, None))
+                    return
+                queue.put_nowait((page, None))
+        except Exception as error:
+            queue.put_nowait((_END, error))
+
+    task = create_task(produce())
+    try:
+        while True:
+            page, error = await queue.get()
+            if page is _END:
+                if error is not None:
+                    raise error
+                return
+            slots.release()
+            yield page
+    finally:
+        task.cancel()
+        try:
+            await task
+        except CancelledError:
+            pass
+        await pages.aclose()
+
+
+class Pages(EvalReturn):
+    """Iterates over the items of a paginated endpoint, page by page.
+
+    - `CURSOR` sends the value at `cursor_key` of each page as the
+      `cursor_param` query parameter of the next; a URL is requested as is.
+    - `LINK` follows the `rel="next"` target of the `Link` header.
+    - `OFFSET` sends `offset_param` and `limit_param` query parameters.
+      W/ a `total_key`, the total count read from the first page lets the
+      remaining pages be fetched `concurrency` at a time; otherwise pages
+      are fetched until one comes back short.
+
+    The settings of the call are resolved once; each page only replaces
+    its URL and query parameters.  Up to `prefetch` pages are fetched
+    ahead of the caller, in a background thread or task, and items are
+    evaluated against the item type of the return annotation.  Threads
+    other than the caller's send through their own clone of a
+    `requests.Session`.  W/ a `timing`, the request of each page is
+    reported to its hooks as a call of its own, the first one w/ `timing`
+    itself.
+    """
+    __slots__ = (
+        '__config', '__driver', '__items_key', '__settings', '__timing',
+    )
+
+    def __init__(
+            self,
+            driver: Driver,
+            settings: TypeRequestSettingsDump,
+            config: TypePaginateDump,
+            eval_type: Any = None,
+            timing: Optional[Timing] = None
+    ):
+        self.__driver = driver
+        self.__timing = timing
+        self.__items_key = settings.returns_json_key
+        self.__settings = settings._replace(
+            returns_type=None,
+            returns_json_key=None,
+            cache=None,
+            flights=None
+        )
+        self.__config = config
+        super().__init__(eval_type=_item_type(eval_type))
+
+    @property
+    def __params(self) -> Dict:
+        return self.__settings.request.get('params', {})
+
+    def __first(self) -> Dict:
+        config = self.__config
+        if config.strategy is AliasPaginateType.OFFSET:
+            return {
+                config.offset_param: int(self.__params.get(config.offset_param, 0)),
+                config.limit_param: config.limit,
+            }
+        return {}
+
+    def __following(
+            self, page: TypePageDump, params: Dict
+    ) -> Optional[Tuple[Optional[str], Dict]]:
+        """The URL and query parameters of the page after `page`, if any.
+        """
+        config = self.__config
+        if config.strategy is AliasPaginateType.LINK:
+            target = _next_link(page.headers)
+            return None if not target else (urljoin(page.url, target), {})
+        if config.strategy is AliasPaginateType.CURSOR:
+            cursor = _lookup(page.json, config.cursor_key)
+            if cursor in (None, '') or not page.items:
+                return None
+            if isinstance(cursor, str) and cursor.startswith(('http://', 'https://')):
+                return cursor, {}
+            return None, {**params, config.cursor_param: cursor}
+        if len(page.items) < config.limit:
+            return None
+        return None, {
+            **params, config.offset_param: params[config.offset_param] + config.limit
+        }
+
+    def __remaining(self, page: TypePageDump, params: Dict) -> Optional[List[Dict]]:
+        """The query parameters of every page after the first, when the
+        total count is known.
+        """
+        config = self.__config
+        if config.strategy is not AliasPaginateType.OFFSET or \
+                config.total_key is None:
+            return None
+        total = _lookup(page.json, config.total_key)
+        if not isinstance(total, int):
+            return None
+        start = params[config.offset_param] + config.limit
+        remaining = [
+            {**params, config.offset_param: offset}
+            for offset in range(start, total, config.limit)
+        ]
+        if config.max_pages is not None:
+            remaining = remaining[:max(0, config.max_pages - 1)]
+        return remaining
+
+    def __page_timing(self, first: bool) -> Optional[Timing]:
+        timing = self.__timing
+        if timing is None or first:
+            return timing
+        started = perf_counter()
+        return Timing(
+            hooks=timing.hooks,
+            endpoint=timing.endpoint,
+            connector=timing.connector,
+            started=started,
+            bound=started
+        )
+
+    def __request(
+            self,
+            session: Any,
+            url: Optional[str],
+            params: Dict,
+            first: bool = False
+    ) -> Requests:
+        settings = self.__settings
+        request = {**settings.request, 'url': url or settings.request['url']}
+        if url is None:
+            request['params'] = {**self.__params, **params}
+        else:
+            request.pop('params', None)
+        timing = self.__page_timing(first)
+        if timing is not None:
+            timing.resolve(method=request['method'], url=request['url'])
+        return Requests(
+            driver=self.__driver,
+            eval_type=None,
+            timing=timing,
+            **settings._replace(session=session, request=request)._asdict()
+        )
+
+    def __page(self, url: str, headers: Any, content: bytes) -> TypePageDump:
+        codec = self.__settings.codec
+        json = codec.loads(content) if codec else json_loads(content)
+        key = self.__items_key
+        items = _lookup(json, key) if key else json
+        return TypePageDump(
+            url=url,
+            json=json,
+            headers=headers,
+            items=items if isinstance(items, list) else []
+        )
+
+    def __fetch_sync(
+            self,
+            sessions: _ThreadSessions,
+            url: Optional[str],
+            params: Dict,
+            first: bool = False
+    ) -> TypePageDump:
+        response = self.__request(
+            sessions.get(), url, params, first
+        ).resolve_request()
+        return self.__page(
+            str(response.url),
+            self.__driver.headers(response),
+            self.__driver.read(response)
+        )
+
+    def __pages_sync(self, owner: Optional[int]) -> Iterator[TypePageDump]:
+        config = self.__config
+        sessions = _ThreadSessions(self.__settings.session, owner)
+        try:
+            params = self.__first()
+            page = self.__fetch_sync(sessions, None, params, first=True)
+            yield page
+            remaining = self.__remaining(page, params)
+            if remaining is not None:
+                with ThreadPoolExecutor(
+                        max_workers=config.concurrency
+                ) as executor:
+                    futures = deque()
+                    try:
+                        for following in remaining:
+                            futures.append(executor.submit(
+                                self.__fetch_sync, sessions, None, following
+                            ))
+                            if len(futures) >= config.concurrency:
+                                yield futures.popleft().result()
+                        while futures:
+                            yield futures.popleft().result()
+                    finally:
+                        for future in futures:
+                            future.cancel()
+                return
+            fetched = 1
+            while config.max_pages is None or fetched < config.max_pages:
+                following = self.__following(page, params)
+                if following is None:
+                    return
+                url, params = following
+                page = self.__fetch_sync(sessions, url, params)
+                fetched += 1
+                yield page
+        finally:
+            sessions.close()
+
+    def __iter_sync(self) -> Iterator:
+        prefetch = self.__config.prefetch
+        pages = self.__pages_sync(None if prefetch else get_ident())
+        if prefetch:
+            pages = _read_ahead(pages, prefetch)
+        for page in pages:
+            for item in page.items:
+                yield self.evaluate(response=item)
+
+    async def __fetch_async(
+            self, url: Optional[str], params: Dict, first: bool = False
+    ) -> TypePageDump:
+        response = await self.__request(
+            self.__settings.session, url, params, first
+        ).resolve_request()
+        return self.__page(
+            str(response.url),
+            self.__driver.headers(response),
+            await self.__driver.read(response)
+        )
+
+    async def __pages_async(self) -> AsyncIterator[TypePageDump]:
+        config = self.__config
+        params = self.__first()
+        page = await self.__fetch_async(None, params, first=True)
+        yield page
+        remaining = self.__remaining(page, params)
+        if remaining is not None:
+            tasks = deque()
+            try:
+                for following in remaining:
+                    tasks.append(create_task(self.__fetch_async(None, following)))
+                    if len(tasks) >= config.concurrency:
+                        yield await tasks.popleft()
+                while tasks:
+                    yield await tasks.popleft()
+            finally:
+                for task in tasks:
+                    task.cancel()
+            return
+        fetched = 1
+        while config.max_pages is None or fetched < config.max_pages:
+            following = self.__following(page, params)
+            if following is None:
+                return
+            url, params = following
+            page = await self.__fetch_async(url, params)
+            fetched += 1
+            yield page
+
+    async def __iter_async(self) -> AsyncIterator:
+        pages = self.__pages_async()
+        if self.__config.prefetch:
+            pages = _aread_ahead(pages, self.__config.prefetch)
+        try:
+            async for page in pages:
+                for item in page.items:
+                    yield self.evaluate(response=item)
+        finally:
+            await pages.aclose()
+
+    def resolve(self) -> Any:
+        """A generator of items, or an async generator for nonblocking
+        clients.  No request is sent before the first item is asked for.
+        """
+        if self.__driver.nonblocking:
+            return self.__iter_async()
+        return self.__iter_sync()
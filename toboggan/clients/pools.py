@@ -0,0 +1,285 @@
+# Standard
+from asyncio import AbstractEventLoop, Task, get_running_loop
+from collections.abc import Mapping
+from functools import partial
+from inspect import signature
+from socket import socket
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Union
+from urllib.parse import urlsplit
+
+# Third-party
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+# Local
+from .resolvers import AsyncClient, Client, ClientSession
+from toboggan.models import TypePoolDump, TypePoolErrDump
+
+
+class __NoPoolModule:
+    pass
+
+
+try:
+    from aiohttp import TCPConnector
+except ModuleNotFoundError:
+    TCPConnector = __NoPoolModule
+
+try:
+    from httpx import AsyncHTTPTransport, HTTPTransport, Limits
+except ModuleNotFoundError:
+    AsyncHTTPTransport = __NoPoolModule
+    HTTPTransport = __NoPoolModule
+    Limits = __NoPoolModule
+
+__all__ = (
+    'SharedPools',
+    'resolve_pool',
+    'shared_pools',
+    '_aclose_client',
+    '_blocking_close_error',
+    '_build_client',
+    '_close_client',
+    '_configure_client',
+    '_pool_key',
+    '_running_loop',
+)
+
+_HTTPX_KEEPALIVE_EXPIRY = 5.0
+_closing: Set[Task] = set()
+
+
+def resolve_pool(
+        pool: Union[None, Mapping, TypePoolDump]
+) -> Optional[TypePoolDump]:
+    """Resolves the pool settings of a :py:class:`Connector`.  `None`
+    leaves pooling to the client's defaults; a mapping is read as the
+    fields of a `TypePoolDump`.
+    """
+    if pool is None:
+        return None
+    if not isinstance(pool, TypePoolDump):
+        pool = TypePoolDump(**pool)
+    if pool.socket_options is not None:
+        pool = pool._replace(
+            socket_options=tuple(tuple(opt) for opt in pool.socket_options)
+        )
+    return pool
+
+
+class _PoolAdapter(HTTPAdapter):
+    """An `HTTPAdapter` that hands socket options down to `urllib3`.
+    """
+    __attrs__ = HTTPAdapter.__attrs__ + ['_socket_options']
+
+    def __init__(self, socket_options: Optional[tuple] = None, **kwargs):
+        self._socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **kwargs):
+        if self._socket_options is not None:
+            kwargs.setdefault('socket_options', list(self._socket_options))
+        super().init_poolmanager(connections, maxsize, block=block, **kwargs)
+
+
+def _unsupported(client: str, setting: str) -> ValueError:
+    return ValueError(TypePoolErrDump(
+        client=client,
+        err_message=f'This error occurs when `{setting}` is set in the pool '
+        f'settings of a client that has no such setting.',
+        solution_message=[f'Leave `{setting}` unset for `{client}`.']
+    ))
+
+
+def _mount_pool(session: Session, pool: TypePoolDump) -> Session:
+    if pool.keepalive_expiry is not None:
+        raise _unsupported('requests.Session', 'keepalive_expiry')
+    for prefix in ('https://', 'http://',):
+        session.mount(prefix, _PoolAdapter(
+            socket_options=pool.socket_options,
+            pool_maxsize=pool.max_per_host or pool.max_connections
+        ))
+    return session
+
+
+def _socket_factory(options: tuple, addr_info: tuple) -> socket:
+    family, type_, proto, _, _ = addr_info
+    sock = socket(family=family, type=type_, proto=proto)
+    for option in options:
+        sock.setsockopt(*option)
+    return sock
+
+
+def _tcp_connector(pool: TypePoolDump) -> TCPConnector:
+    kwargs: Dict[str, Any] = {
+        'limit': pool.max_connections, 'limit_per_host': pool.max_per_host or 0
+    }
+    if pool.keepalive_expiry is not None:
+        kwargs['keepalive_timeout'] = pool.keepalive_expiry
+    if pool.socket_options is not None:
+        if 'socket_factory' not in signature(TCPConnector).parameters:
+            raise ValueError(TypePoolErrDump(
+                client='aiohttp.ClientSession',
+                err_message='Socket options require aiohttp>=3.12.',
+                solution_message=['pip install aiohttp>=3.12']
+            ))
+        kwargs['socket_factory'] = partial(_socket_factory, pool.socket_options)
+    return TCPConnector(**kwargs)
+
+
+def _httpx_kwargs(pool: TypePoolDump, transport_cls: type) -> Dict[str, Any]:
+    if pool.max_per_host is not None:
+        raise _unsupported('httpx', 'max_per_host')
+    limits = Limits(
+        max_connections=pool.max_connections,
+        max_keepalive_connections=pool.max_connections,
+        keepalive_expiry=_HTTPX_KEEPALIVE_EXPIRY
+        if pool.keepalive_expiry is None else pool.keepalive_expiry
+    )
+    if pool.socket_options is None:
+        return {'limits': limits}
+    return {'transport': transport_cls(
+        limits=limits, socket_options=list(pool.socket_options)
+    )}
+
+
+def _build_client(client_cls: type, pool: Optional[TypePoolDump]) -> Any:
+    """Builds a client of `client_cls` w/ its connection pool sized by
+    `pool`:
+
+    - `requests.Session`: an `HTTPAdapter` per scheme, `pool_maxsize` set
+      to `max_per_host`, or `max_connections` when unset.
+    - `aiohttp.ClientSession`: a `TCPConnector` w/ `limit`,
+      `limit_per_host`, `keepalive_timeout` and a `socket_factory`.
+    - `httpx.Client` / `httpx.AsyncClient`: `httpx.Limits`, w/ a
+      transport carrying `socket_options` when set.
+
+    A setting the client has no counterpart for, `keepalive_expiry` w/
+    `requests` and `max_per_host` w/ `httpx`, raises a `ValueError`.
+    """
+    if pool is None:
+        return client_cls()
+    if issubclass(client_cls, Session):
+        return _mount_pool(client_cls(), pool)
+    if issubclass(client_cls, ClientSession):
+        return client_cls(connector=_tcp_connector(pool))
+    if issubclass(client_cls, AsyncClient):
+        return client_cls(**_httpx_kwargs(pool, AsyncHTTPTransport))
+    if issubclass(client_cls, Client):
+        return client_cls(**_httpx_kwargs(pool, HTTPTransport))
+    return client_cls()
+
+
+def _configure_client(client: Any, pool: Optional[TypePoolDump]) -> Any:
+    """Applies `pool` to a client built outside of the :py:class:`Connector`.
+    Only a `requests.Session` can be resized after the fact.
+    """
+    if pool is None:
+        return client
+    if isinstance(client, Session):
+        return _mount_pool(client, pool)
+    raise ValueError(TypePoolErrDump(client=type(client).__name__))
+
+
+def _running_loop() -> Optional[AbstractEventLoop]:
+    try:
+        return get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _pool_key(
+        client_cls: type,
+        base_url: Optional[str],
+        pool: Optional[TypePoolDump],
+        loop: Optional[AbstractEventLoop] = None
+) -> Hashable:
+    """Keys a shared client on its class, origin and pool settings, and
+    on the event loop an async client is bound to.
+    """
+    origin = None
+    if base_url:
+        url = urlsplit(base_url)
+        origin = (url.scheme, url.netloc)
+    return client_cls, origin, pool, loop
+
+
+async def _aclose_client(client: Any) -> None:
+    if isinstance(client, AsyncClient):
+        await client.aclose()
+    elif isinstance(client, ClientSession):
+        await client.close()
+    else:
+        client.close()
+
+
+def _blocking_close_error() -> TypeError:
+    return TypeError(
+        '`close` requires a blocking client.  Use `aclose` or '
+        '`async with` w/ `aiohttp.ClientSession` or `httpx.AsyncClient`.'
+    )
+
+
+def _close_client(client: Any) -> None:
+    """Closes `client` from blocking code.  An async client is closed 
+    w/ `_aclose_client` on the running event loop; w/o one, a 
+    `TypeError` is raised, since a new loop can't close a client bound 
+    to another.
+    """
+    if not isinstance(client, (AsyncClient, ClientSession)):
+        client.close()
+        return
+    loop = _running_loop()
+    if loop is None:
+        raise _blocking_close_error()
+    task = loop.create_task(_aclose_client(client))
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+class SharedPools:
+    """A registry of clients shared on purpose by connectors w/
+    `share_pool=True`.  Connectors w/ the same client class, origin and
+    pool settings, and async clients on the same event loop, are handed
+    the same client; the last one to let go of it closes it.
+    """
+    __slots__ = ('__clients', '__lock',)
+
+    def __init__(self):
+        self.__clients: Dict[Hashable, List] = {}
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__clients)
+
+    def acquire(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        with self.__lock:
+            entry = self.__clients.get(key)
+            if entry is None:
+                entry = self.__clients[key] = [factory(), 0]
+            entry[1] += 1
+            return entry[0]
+
+    def release(self, client: Any) -> bool:
+        """Lets go of `client` and returns whether it should be closed.
+        """
+        with self.__lock:
+            for key, entry in self.__clients.items():
+                if entry[0] is client:
+                    entry[1] -= 1
+                    if entry[1] == 0:
+                        del self.__clients[key]
+                        return True
+                    return False
+        return False
+
+    def holders(self, client: Any) -> int:
+        with self.__lock:
+            for shared, count in self.__clients.values():
+                if shared is client:
+                    return count
+        return 0
+
+
+shared_pools = SharedPools()
@@ -0,0 +1,259 @@
+# Standard
+from itertools import repeat
+from time import perf_counter
+from types import MappingProxyType
+from typing import Any, Awaitable, Dict, List, Mapping, Optional, Union
+
+# Third-party
+from requests import Request
+
+# Local
+from .drivers import Driver, RequestsDriver
+from .fanout import _amap, _clone_session, _map
+from .hooks import Timing
+from .pages import Pages
+from .requests import Requests, _send
+from .streams import _is_one_shot, stream_types
+from toboggan.models import TypePaginateDump, TypeRequestSettingsDump
+
+__all__ = ('Prepared',)
+
+_PREPARE_KEYS = frozenset((
+    'auth',
+    'cookies',
+    'data',
+    'files',
+    'headers',
+    'hooks',
+    'json',
+    'method',
+    'params',
+    'url',
+))
+_SEND_KEYS = frozenset((
+    'allow_redirects', 'cert', 'proxies', 'stream', 'timeout', 'verify',
+))
+
+
+class _PreparedSession:
+    """Stands in for a `requests.Session` and sends the `PreparedRequest`
+    built once from `request` for as long as that's the request sent.
+    Any other request, such as a page or a conditional request w/ cache
+    validators, goes through the session as usual.
+    """
+    __slots__ = ('__prepared', '__request', '__send', '__session',)
+
+    def __init__(
+            self,
+            session: Any,
+            request: Dict,
+            prepared: Any = None,
+            send: Optional[Dict] = None
+    ):
+        self.__session = session
+        self.__request = request
+        if prepared is None and request.keys() <= _PREPARE_KEYS | _SEND_KEYS:
+            prepared = session.prepare_request(Request(**{
+                key: value for key, value in request.items()
+                if key in _PREPARE_KEYS
+            }))
+            send = session.merge_environment_settings(
+                prepared.url,
+                request.get('proxies') or {},
+                request.get('stream'),
+                request.get('verify'),
+                request.get('cert')
+            )
+            send['timeout'] = request.get('timeout')
+            send['allow_redirects'] = request.get('allow_redirects', True)
+        self.__prepared = prepared
+        self.__send = send
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.__session, name)
+
+    def clone(self, session: Any) -> '_PreparedSession':
+        return _PreparedSession(
+            session, self.__request, self.__prepared, self.__send
+        )
+
+    def detach(self) -> '_PreparedSession':
+        """Clones the session for use from another thread.
+        """
+        return self.clone(_clone_session(self.__session))
+
+    def request(self, stream: Optional[bool] = None, **request) -> Any:
+        if self.__prepared is None or request != self.__request:
+            if stream is not None:
+                request['stream'] = stream
+            return self.__session.request(**request)
+        send = self.__send if stream is None \
+            else {**self.__send, 'stream': stream}
+        return self.__session.send(self.__prepared, **send)
+
+
+class Prepared:
+    """A call of an endpoint w/ its arguments bound and its request
+    resolved once: the URL, headers and query parameters are merged and
+    the body is encoded, w/ the connector's codec or the standard
+    library's `json`.  W/ `requests`, the `PreparedRequest` is built once
+    too, so cookies the session receives afterwards aren't sent.  Hooks,
+    retries, rate limits and the rest of the endpoint's configuration
+    still apply to each send.
+    """
+    __slots__ = (
+        '__conn',
+        '__driver',
+        '__eval_type',
+        '__name',
+        '__paginate',
+        '__requests',
+        '__settings',
+    )
+
+    def __init__(
+            self,
+            conn: Any,
+            name: str,
+            driver: Driver,
+            settings: TypeRequestSettingsDump,
+            eval_type: Any = None,
+            paginate: Optional[TypePaginateDump] = None
+    ):
+        if any(_is_one_shot(value) for value in _send(settings.request).values()):
+            raise TypeError(
+                '`prepare` requires a body that can be sent more than once, '
+                'not a file or an iterator.'
+            )
+        if isinstance(driver, RequestsDriver):
+            settings = settings._replace(
+                session=_PreparedSession(settings.session, settings.request)
+            )
+        self.__conn = conn
+        self.__name = name
+        self.__driver = driver
+        self.__settings = settings
+        self.__eval_type = eval_type
+        self.__paginate = paginate
+        self.__requests = None if paginate is not None else Requests(
+            driver=driver, eval_type=eval_type, **settings._asdict()
+        )
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.method} {self.url})'
+
+    @property
+    def method(self) -> str:
+        return self.__settings.request['method']
+
+    @property
+    def url(self) -> str:
+        return self.__settings.request['url']
+
+    @property
+    def request(self) -> Mapping:
+        """The keyword arguments the client is called w/, read-only.
+        """
+        return MappingProxyType(self.__settings.request)
+
+    def __send(self, settings: TypeRequestSettingsDump) -> Any:
+        hooks = self.__conn.hooks
+        timing = None
+        if hooks:
+            started = perf_counter()
+            timing = Timing(
+                hooks=hooks,
+                endpoint=self.__name,
+                connector=self.__conn.__class__.__name__,
+                started=started,
+                bound=started
+            )
+        if self.__paginate is not None:
+            return Pages(
+                driver=self.__driver,
+                settings=settings,
+                config=self.__paginate,
+                eval_type=self.__eval_type,
+                timing=timing
+            ).resolve()
+        if timing is None:
+            requests = self.__requests if settings is self.__settings \
+                else Requests(
+                    driver=self.__driver,
+                    eval_type=self.__eval_type,
+                    **settings._asdict()
+                )
+            return requests.resolve_request()
+        timing.resolve(method=self.method, url=self.url)
+        return Requests(
+            driver=self.__driver,
+            eval_type=self.__eval_type,
+            timing=timing,
+            **settings._asdict()
+        ).resolve_request()
+
+    def __send_from(self, conn: Any) -> Any:
+        if conn is self.__conn:
+            return self.send()
+        session = self.__settings.session
+        if isinstance(session, _PreparedSession):
+            session = session.clone(conn.client)
+        else:
+            session = conn.session()
+        return self.__send(self.__settings._replace(session=session))
+
+    def send(self) -> Any:
+        """Sends the request and returns what the endpoint returns: its
+        value, or an awaitable of it w/ `aiohttp` or `httpx.AsyncClient`.
+
+        ::
+
+            prepared = poke_api.prepare(poke_api.get_pokemon, 25)
+            pokemon = await prepared.send()
+        """
+        return self.__send(self.__settings)
+
+    async def __send_many_async(self, n: int, concurrency: int) -> List:
+        return [result async for result in _amap(
+            func=self.send,
+            arguments=repeat((), n),
+            limit=concurrency,
+            queue_size=concurrency,
+            ordered=True
+        )]
+
+    def send_many(
+            self, n: int, concurrency: int = 10
+    ) -> Union[List, Awaitable[List]]:
+        """Sends the request `n` times, w/ at most `concurrency` requests
+        in flight, and returns the results in order; an awaitable of them
+        w/ `aiohttp` or `httpx.AsyncClient`.  Blocking clients send from a
+        pool of `concurrency` threads, w/ a clone of a `requests.Session`
+        per thread, as in :py:meth:`Connector.map`.  The first error
+        cancels the sends that haven't started yet and is raised.
+
+        ::
+
+            prepared = httpbin.prepare(httpbin.get_status, 200)
+            statuses = prepared.send_many(1000, concurrency=8)
+        """
+        if concurrency < 1:
+            raise ValueError('`concurrency` must be at least 1.')
+        if self.__paginate is not None or \
+                self.__settings.returns_type in stream_types:
+            raise TypeError(
+                '`send_many` requires an endpoint that returns a single value, '
+                'not pages or a stream.'
+            )
+        if self.__driver.nonblocking:
+            return self.__send_many_async(n, concurrency)
+        return list(_map(
+            conn=self.__conn,
+            func=self.__send_from,
+            arguments=repeat((), n),
+            limit=concurrency,
+            queue_size=concurrency,
+            ordered=True
+        ))
@@ -1,125 +1,568 @@
 # Standard
-from asyncio import sleep as sleep_async
-from time import sleep as sleep_sync
-from typing import Any, Dict, List, Optional, Tuple, Union
+from asyncio import Task, create_task, sleep as sleep_async, to_thread
+from copy import copy
+from functools import partial
+from threading import Thread
+from time import perf_counter, sleep as sleep_sync
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 # Local
+from .breakers import Breaker
+from .caches import ResponseCache
+from .downloads import Download, _content_length
+from .drivers import Driver
+from .fanout import _detach_session
+from .flights import SingleFlight, _flight_key
+from .hooks import Timing, _acounted, _counted
+from .limits import RateLimiter
 from .responses import Responses
-from .utils import _merge_mappings
-from toboggan.aliases import AliasReturnType, AliasSessionType
-from toboggan.models import TypeRetryDump, TypeRetryErrDump
+from .retries import RetryBudget, RetryPolicy
+from .streams import (
+    _CHUNK_SIZE,
+    _encoding,
+    _is_one_shot,
+    _is_stream_body,
+    stream_types,
+    unbuffered_types,
+)
+from toboggan.aliases import AliasCacheState, AliasReturnType
+from toboggan.models import (
+    TypeCacheEntryDump,
+    TypeCodecDump,
+    TypeDownloadDump,
+    TypeDownloadErrDump,
+    TypeFileDump,
+    TypeRetryErrDump,
+)
 
 __all__ = ('Requests',)
 
+_BODY_KEYS = ('content', 'data', 'json',)
+_EMPTY: Dict = {}
+_refreshing: Set[Task] = set()
+
+
+def _send(request: Dict) -> Dict:
+    """The body of a client call, by the keyword it's sent w/.
+    """
+    return {key: request[key] for key in _BODY_KEYS if key in request}
+
 
 class Requests(Responses):
     __slots__ = (
-        '__client_type',
-        '__headers',
+        '__breaker',
+        '__cache',
+        '__driver',
+        '__flights',
         '__method',
-        '__options',
-        '__query_params',
+        '__rate_limits',
+        '__request',
         '__retry',
+        '__retry_budget',
+        '__returns_chunk_size',
+        '__returns_file',
         '__returns_json_key',
         '__returns_type',
-        '__send',
         '__session',
-        '__url',
+        '__timing',
     )
 
     def __init__(
             self,
-            client_type: AliasSessionType,
+            driver: Driver,
             session: Any,
-            method: str,
-            url: str,
-            headers: Dict,
-            query_params: Dict,
-            send: Dict,
-            options: Dict,
+            request: Dict,
             eval_type: Any,
-            retry: Optional[TypeRetryDump] = None,
+            retry: Optional[RetryPolicy] = None,
             returns_type: Optional[AliasReturnType] = None,
             returns_json_key: Optional[Union[str, List[str], Tuple[str]]] = None,
-            **kwargs
+            codec: Optional[TypeCodecDump] = None,
+            cache: Optional[ResponseCache] = None,
+            flights: Optional[SingleFlight] = None,
+            retry_budget: Optional[RetryBudget] = None,
+            rate_limits: Tuple[RateLimiter, ...] = (),
+            breaker: Optional[Breaker] = None,
+            returns_chunk_size: Optional[int] = None,
+            returns_file: Optional[TypeDownloadDump] = None,
+            timing: Optional[Timing] = None
         ):
-        self.__client_type = client_type
+        self.__driver = driver
         self.__session = session
-        self.__method = method
-        self.__url = url
-        self.__headers = headers
-        self.__query_params = query_params
-        self.__send = send
-        self.__options = options
+        self.__request = request
+        self.__method = request['method']
         self.__retry = retry
+        self.__retry_budget = retry_budget
+        self.__rate_limits = rate_limits
+        self.__breaker = breaker
         self.__returns_type = returns_type
         self.__returns_json_key = returns_json_key
-        _merge_mappings(base=self.__headers, supp=self.__options, target='headers')
-        _merge_mappings(base=self.__query_params, supp=self.__options, target='params')
-        super().__init__(eval_type=eval_type)
-    
-    def __staged_request(self):
-        request = self.__session.request(
+        self.__returns_chunk_size = returns_chunk_size or _CHUNK_SIZE
+        self.__returns_file = returns_file
+        self.__cache = cache
+        self.__timing = timing
+        self.__flights = flights if flights is not None and \
+            returns_type is not None and \
+            flights.idempotent(self.__method) and not any(
+                _is_stream_body(value) for value in _send(request).values()
+            ) else None
+        super().__init__(eval_type=eval_type, codec=codec, timing=timing)
+
+    def __one_shot(self) -> bool:
+        return any(
+            _is_one_shot(value) for value in _send(self.__request).values()
+        )
+
+    def __staged_request(self, request: Optional[Dict] = None):
+        if request is None:
+            request = self.__request
+        if self.__returns_type in unbuffered_types:
+            return self.__driver.stream(self.__session, request)
+        return self.__driver.send(self.__session, request)
+
+    def __dispatch_sync(self, request: Optional[Dict] = None) -> Any:
+        breaker = self.__breaker
+        if breaker is None:
+            for limiter in self.__rate_limits:
+                limiter.acquire()
+        else:
+            breaker.acquire()
+            try:
+                for limiter in self.__rate_limits:
+                    limiter.acquire()
+            except BaseException:
+                breaker.cancel()
+                raise
+        timing = self.__timing
+        if timing is not None:
+            timing.send()
+        if breaker is None:
+            response = self.__staged_request(request)
+        else:
+            started = perf_counter()
+            try:
+                response = self.__staged_request(request)
+            except Exception:
+                breaker.record(perf_counter() - started, failed=True)
+                raise
+            except BaseException:
+                breaker.cancel()
+                raise
+            breaker.record_status(
+                perf_counter() - started, self.__driver.status(response)
+            )
+        if timing is not None:
+            timing.receive(response, self.__driver.status(response))
+        for limiter in self.__rate_limits:
+            limiter.update(self.__driver.headers(response))
+        return response
+
+    async def __dispatch_async(self, request: Optional[Dict] = None) -> Any:
+        breaker = self.__breaker
+        if breaker is None:
+            for limiter in self.__rate_limits:
+                await limiter.acquire_async()
+        else:
+            breaker.acquire()
+            try:
+                for limiter in self.__rate_limits:
+                    await limiter.acquire_async()
+            except BaseException:
+                breaker.cancel()
+                raise
+        timing = self.__timing
+        if timing is not None:
+            timing.send()
+        if breaker is None:
+            response = await self.__staged_request(request)
+        else:
+            started = perf_counter()
+            try:
+                response = await self.__staged_request(request)
+            except Exception:
+                breaker.record(perf_counter() - started, failed=True)
+                raise
+            except BaseException:
+                breaker.cancel()
+                raise
+            breaker.record_status(
+                perf_counter() - started, self.__driver.status(response)
+            )
+        if timing is not None:
+            timing.receive(response, self.__driver.status(response))
+        for limiter in self.__rate_limits:
+            limiter.update(self.__driver.headers(response))
+        return response
+
+    def __conditional(
+            self, entry: Optional[TypeCacheEntryDump]
+    ) -> Optional[Dict]:
+        conditional = self.__cache.conditional_headers(entry)
+        if not conditional:
+            return None
+        return {
+            **self.__request,
+            'headers': {**self.__request.get('headers', _EMPTY), **conditional}
+        }
+
+    def __cache_lookup(
+            self
+    ) -> Tuple[Hashable, Optional[TypeCacheEntryDump], AliasCacheState]:
+        request = self.__request
+        key = self.__cache.key(
             method=self.__method,
-            url=self.__url,
-            **self.__options,
-            **self.__headers,
-            **self.__send,
-            **self.__query_params
+            url=request['url'],
+            query_params=request.get('params', _EMPTY),
+            headers=request.get('headers', _EMPTY),
+            credentials=self.__driver.credentials(self.__session)
         )
-        return request
-    
-    def __request_sync(self) -> Union[Any, dict, int, str, None]:
-        response = self.__staged_request()
-        if self.__retry and response.status_code in self.__retry.status_forcelist:
-            for attempt in range(self.__retry.total):
-                backoff = self.__retry.backoff_factor * (2 ** attempt)
-                sleep_sync(backoff)
-                if attempt == self.__retry.total - 1:
-                    err = TypeRetryErrDump(
-                        status_code=response.status_code,
-                        config=self.__retry
-                    )
-                    raise RuntimeError(err)
-                response = self.__staged_request()
-        resolved_response = self.resolve_response_std(
+        return (key, *self.__cache.lookup(key))
+
+    def __flight_key(self) -> Hashable:
+        request = self.__request
+        return _flight_key(
+            session=self.__session,
+            method=self.__method,
+            url=request['url'],
+            query_params=request.get('params', _EMPTY),
+            headers=request.get('headers', _EMPTY),
+            send=_send(request)
+        )
+
+    def __fly_sync(self, call: Callable[[], Any]) -> Any:
+        if self.__flights is None:
+            return call()
+        return self.__flights.run_sync(self.__flight_key(), call)
+
+    async def __fly_async(self, call: Callable[[], Awaitable]) -> Any:
+        if self.__flights is None:
+            return await call()
+        return await self.__flights.run_async(self.__flight_key(), call)
+
+    def __may_retry(self, attempt: int, error: bool = False) -> bool:
+        if attempt >= self.__retry.total or self.__one_shot():
+            return False
+        if error and not self.__retry.retries_error(self.__method):
+            return False
+        return self.__retry_budget is None or self.__retry_budget.withdraw()
+
+    def __send_sync(self, request: Optional[Dict] = None) -> Any:
+        policy = self.__retry
+        if policy is None:
+            return self.__dispatch_sync(request)
+        budget = self.__retry_budget
+        if budget is not None:
+            budget.deposit()
+        delay = 0.0
+        for attempt in range(policy.total + 1):
+            try:
+                response = self.__dispatch_sync(request)
+            except policy.exceptions as error:
+                if not self.__may_retry(attempt, error=True):
+                    raise
+                delay = policy.delay(attempt, delay)
+                if self.__timing is not None:
+                    self.__timing.retry(error)
+            else:
+                status = self.__driver.status(response)
+                if not policy.retries_status(status):
+                    return response
+                if not self.__may_retry(attempt):
+                    raise RuntimeError(TypeRetryErrDump(
+                        status_code=status, config=policy.config
+                    ))
+                delay = policy.delay(
+                    attempt, delay, self.__driver.headers(response)
+                )
+                if self.__timing is not None:
+                    self.__timing.retry()
+                self.__driver.release(response)
+            sleep_sync(delay)
+
+    def __resolve_std(self, response: Any) -> Union[Any, dict, int, str, None]:
+        return self.resolve_response_std(
             response=response,
             ctx_returns_type=self.__returns_type,
             ctx_returns_json_key=self.__returns_json_key
         )
-        return self.evaluate(response=resolved_response)
-    
-    async def __request_async(self) -> Union[Any, dict, int, str, None]:
-        response = await self.__staged_request()
-        if self.__retry and response.status in self.__retry.status_forcelist:
-            for attempt in range(self.__retry.total):
-                backoff = self.__retry.backoff_factor * (2 ** attempt)
-                await sleep_async(backoff)
-                if attempt == self.__retry.total - 1:
-                    err = TypeRetryErrDump(
-                        status_code=response.status,
-                        config=self.__retry
-                    )
-                    raise RuntimeError(err)
-                response = await self.__staged_request()
-        if self.__client_type is AliasSessionType.AIOHTTP:
-            resolved_response = self.resolve_response_awaitable(
+
+    def __fetch_uncached_sync(self) -> Union[Any, dict, int, str, None]:
+        return self.__resolve_std(self.__send_sync())
+
+    def __fetch_sync(
+            self, key: Hashable, entry: Optional[TypeCacheEntryDump]
+    ) -> Union[Any, dict, int, str, None]:
+        response = self.__send_sync(self.__conditional(entry))
+        status = self.__driver.status(response)
+        headers = self.__driver.headers(response)
+        if status == 304 and entry is not None:
+            return self.__cache.refresh(key, entry, headers)
+        value = self.__resolve_std(response)
+        if 200 <= status < 300:
+            self.__cache.store(
+                key, value, headers, len(self.__driver.read(response))
+            )
+        return value
+
+    def __refresh_sync(
+            self,
+            key: Hashable,
+            entry: TypeCacheEntryDump,
+            session: Any,
+            owned: bool
+    ) -> None:
+        """Revalidates `entry` from a background thread, through `session`
+        in place of the caller's.
+        """
+        refresh = copy(self)
+        refresh.__session = session
+        try:
+            refresh.__fetch_sync(key, entry)
+        except Exception:
+            pass
+        finally:
+            self.__cache.end_refresh(key)
+            if owned:
+                session.close()
+
+    def __request_sync(self) -> Union[Any, dict, int, str, None]:
+        if self.__cache is None or not self.__cache.cacheable(self.__method):
+            return self.__fly_sync(self.__fetch_uncached_sync)
+        key, entry, state = self.__cache_lookup()
+        if state is AliasCacheState.FRESH:
+            return self.__cache.value(entry)
+        if state is AliasCacheState.STALE:
+            if self.__cache.begin_refresh(key):
+                Thread(
+                    target=self.__refresh_sync,
+                    args=(key, entry, *_detach_session(self.__session)),
+                    daemon=True
+                ).start()
+            return self.__cache.value(entry)
+        return self.__fly_sync(partial(self.__fetch_sync, key, entry))
+
+    def __chunks_sync(self, response: Any) -> Iterator[bytes]:
+        chunks = self.__driver.chunks(response, self.__returns_chunk_size)
+        return chunks if self.__timing is None else _counted(chunks, self.__timing)
+
+    def __stream_sync(self) -> Iterator:
+        response = self.__send_sync()
+        try:
+            yield from self.resolve_stream_std(
+                chunks=self.__chunks_sync(response),
+                ctx_returns_type=self.__returns_type,
+                encoding=_encoding(response)
+            )
+        finally:
+            self.__driver.release(response)
+
+    def __traced_stream_sync(self) -> Iterator:
+        timing = self.__timing
+        try:
+            yield from self.__stream_sync()
+        except GeneratorExit:
+            timing.finish()
+            raise
+        except BaseException as error:
+            timing.finish(error)
+            raise
+        timing.finish()
+
+    def __traced_sync(self, call: Callable[[], Any]) -> Any:
+        timing = self.__timing
+        try:
+            value = call()
+        except BaseException as error:
+            timing.finish(error)
+            raise
+        timing.finish()
+        return value
+
+    def __start_download(self, status: int, headers: Any) -> Download:
+        if not 200 <= status < 300:
+            raise RuntimeError(TypeDownloadErrDump(status_code=status))
+        return Download(self.__returns_file, _content_length(headers))
+
+    def __download_sync(self) -> TypeFileDump:
+        response = self.__send_sync()
+        try:
+            download = self.__start_download(
+                self.__driver.status(response), self.__driver.headers(response)
+            )
+            try:
+                for chunk in self.__chunks_sync(response):
+                    download.write(chunk)
+            except BaseException:
+                download.abort()
+                raise
+        finally:
+            self.__driver.release(response)
+        return download.commit()
+
+    async def __send_async(self, request: Optional[Dict] = None) -> Any:
+        policy = self.__retry
+        if policy is None:
+            return await self.__dispatch_async(request)
+        budget = self.__retry_budget
+        if budget is not None:
+            budget.deposit()
+        delay = 0.0
+        for attempt in range(policy.total + 1):
+            try:
+                response = await self.__dispatch_async(request)
+            except policy.exceptions as error:
+                if not self.__may_retry(attempt, error=True):
+                    raise
+                delay = policy.delay(attempt, delay)
+                if self.__timing is not None:
+                    self.__timing.retry(error)
+            else:
+                status = self.__driver.status(response)
+                if not policy.retries_status(status):
+                    return response
+                if not self.__may_retry(attempt):
+                    raise RuntimeError(TypeRetryErrDump(
+                        status_code=status, config=policy.config
+                    ))
+                delay = policy.delay(
+                    attempt, delay, self.__driver.headers(response)
+                )
+                if self.__timing is not None:
+                    self.__timing.retry()
+                await self.__driver.release(response)
+            await sleep_async(delay)
+
+    async def __resolve_async(
+            self, response: Any
+    ) -> Union[Any, dict, int, str, None]:
+        if self.__driver.awaits_body:
+            return await self.resolve_response_awaitable(
                 response=response,
                 ctx_returns_type=self.__returns_type,
                 ctx_returns_json_key=self.__returns_json_key
             )
-            response = await resolved_response
-            return self.evaluate(response=response)
-        resolved_response = self.resolve_response_std(
-            response=response,
-            ctx_returns_type=self.__returns_type,
-            ctx_returns_json_key=self.__returns_json_key
-        )
-        return self.evaluate(response=resolved_response)
+        return self.__resolve_std(response)
+
+    async def __fetch_uncached_async(self) -> Union[Any, dict, int, str, None]:
+        return await self.__resolve_async(await self.__send_async())
+
+    async def __fetch_async(
+            self, key: Hashable, entry: Optional[TypeCacheEntryDump]
+    ) -> Union[Any, dict, int, str, None]:
+        response = await self.__send_async(self.__conditional(entry))
+        status = self.__driver.status(response)
+        headers = self.__driver.headers(response)
+        if status == 304 and entry is not None:
+            return self.__cache.refresh(key, entry, headers)
+        value = await self.__resolve_async(response)
+        if 200 <= status < 300:
+            body = await self.__driver.read(response)
+            self.__cache.store(key, value, headers, len(body))
+        return value
+
+    async def __refresh_async(
+            self, key: Hashable, entry: TypeCacheEntryDump
+    ) -> None:
+        try:
+            await self.__fetch_async(key, entry)
+        except Exception:
+            pass
+        finally:
+            self.__cache.end_refresh(key)
+
+    async def __request_async(self) -> Union[Any, dict, int, str, None]:
+        if self.__cache is None or not self.__cache.cacheable(self.__method):
+            return await self.__fly_async(self.__fetch_uncached_async)
+        key, entry, state = self.__cache_lookup()
+        if state is AliasCacheState.FRESH:
+            return self.__cache.value(entry)
+        if state is AliasCacheState.STALE:
+            if self.__cache.begin_refresh(key):
+                task = create_task(self.__refresh_async(key, entry))
+                _refreshing.add(task)
+                task.add_done_callback(_refreshing.discard)
+            return self.__cache.value(entry)
+        return await self.__fly_async(partial(self.__fetch_async, key, entry))
+    
+    def __chunks_async(self, response: Any) -> AsyncIterator[bytes]:
+        chunks = self.__driver.chunks(response, self.__returns_chunk_size)
+        return chunks if self.__timing is None else _acounted(chunks, self.__timing)
+
+    async def __stream_async(self) -> AsyncIterator:
+        response = await self.__send_async()
+        try:
+            async for item in self.resolve_stream_awaitable(
+                    chunks=self.__chunks_async(response),
+                    ctx_returns_type=self.__returns_type,
+                    encoding=_encoding(response)
+            ):
+                yield item
+        finally:
+            await self.__driver.release(response)
+
+    async def __traced_stream_async(self) -> AsyncIterator:
+        timing = self.__timing
+        try:
+            async for item in self.__stream_async():
+                yield item
+        except GeneratorExit:
+            timing.finish()
+            raise
+        except BaseException as error:
+            timing.finish(error)
+            raise
+        timing.finish()
+
+    async def __traced_async(self, call: Callable[[], Awaitable]) -> Any:
+        timing = self.__timing
+        try:
+            value = await call()
+        except BaseException as error:
+            timing.finish(error)
+            raise
+        timing.finish()
+        return value
+
+    async def __download_async(self) -> TypeFileDump:
+        response = await self.__send_async()
+        try:
+            download = self.__start_download(
+                self.__driver.status(response), self.__driver.headers(response)
+            )
+            try:
+                async for chunk in self.__chunks_async(response):
+                    await to_thread(download.write, chunk)
+            except BaseException:
+                download.abort()
+                raise
+        finally:
+            await self.__driver.release(response)
+        return await to_thread(download.commit)
     
     def resolve_request(self):
-        if self.__client_type in (
-            AliasSessionType.AIOHTTP, AliasSessionType.HTTPX_ASYNC
-        ):
-            return self.__request_async()
-        return self.__request_sync()
+        traced = self.__timing is not None
+        if self.__driver.nonblocking:
+            if self.__returns_type in stream_types:
+                return self.__traced_stream_async() if traced \
+                    else self.__stream_async()
+            call = self.__download_async \
+                if self.__returns_type is AliasReturnType.FILE \
+                else self.__request_async
+            return self.__traced_async(call) if traced else call()
+        if self.__returns_type in stream_types:
+            return self.__traced_stream_sync() if traced else self.__stream_sync()
+        call = self.__download_sync if self.__returns_type is AliasReturnType.FILE \
+            else self.__request_sync
+        return self.__traced_sync(call) if traced else call()
@@ -1,45 +1,26 @@
 # Standard
-from functools import lru_cache
 from typing import Dict, Optional, Union
 
-# Third-party
-from requests import Session
-
 # Local
-from .utils import _kebabize
+from .drivers import AsyncClient, Client, ClientSession, Session, resolve_driver
+from .streams import _is_stream_body, _stream_send
+from .utils import _kebabize, _merge_mappings
 from toboggan.aliases import AliasSendsType, AliasSessionType
 from toboggan.annotations import Body, Options, Path, Query, QueryKebab
 from toboggan.models import (
-    TypeHeadersDump,
+    TypeCodecDump,
     TypeKwDump,
-    TypeClientModuleErrDump,
-    TypeQueryParamsDump,
-    TypeSendDataDump,
-    TypeSendJsonDump,
+    TypeKwObjDump,
+    TypeSendStreamDump,
 )
 
-
-class __NoClientModule:
-    err = TypeClientModuleErrDump()
-
-
-try:
-    from aiohttp import ClientSession
-except ModuleNotFoundError:
-    ClientSession = __NoClientModule
-
-try:
-    from httpx import AsyncClient, Client
-except ModuleNotFoundError:
-    AsyncClient = __NoClientModule
-    Client = __NoClientModule
-
 __all__ = (
     'AsyncClient',
     'Client',
     'ClientSession',
     'Session',
     'resolve_client_type',
+    '_resolve_body',
     '_resolve_headers',
     '_resolve_options',
     '_resolve_path_params',
@@ -47,19 +28,10 @@ __all__ = (
     '_resolve_send',
 )
 
-@lru_cache(maxsize=1)
 def resolve_client_type(
         session: Optional[Union[Session, ClientSession, AsyncClient, Client]]
 ) -> AliasSessionType:
-    if not isinstance(session, (Session, ClientSession, AsyncClient, Client,)):
-        raise ModuleNotFoundError(__NoClientModule.err)
-    if isinstance(session, ClientSession):
-        return AliasSessionType.AIOHTTP
-    if isinstance(session, AsyncClient):
-        return AliasSessionType.HTTPX_ASYNC
-    if isinstance(session, Client):
-        return AliasSessionType.HTTPX_SYNC
-    return AliasSessionType.REQUESTS
+    return resolve_driver(session).client_type
 
 def _resolve_options(kw_dump: TypeKwDump) -> Dict:
     for _, val in kw_dump.dump.items():
@@ -67,51 +39,80 @@ def _resolve_options(kw_dump: TypeKwDump) -> Dict:
             return val.kw_value
     return {}
 
-def _resolve_headers(base_headers: Dict, ctx_headers_value: Dict) -> Dict:
-    base = {}
-    base.update(base_headers)
-    base.update(ctx_headers_value)
-    return TypeHeadersDump(base)._asdict() if base else {}
+def _resolve_headers(
+        base_headers: Dict,
+        ctx_headers_value: Dict,
+        content_type: Optional[str] = None,
+        stream_headers: Optional[Dict] = None
+) -> Dict:
+    headers = _merge_mappings(base_headers, ctx_headers_value)
+    if stream_headers:
+        headers = {**headers, **stream_headers}
+    if content_type and not any(
+            key.lower() == 'content-type' for key in headers
+    ):
+        headers = {**headers, 'Content-Type': content_type}
+    return headers
 
 def _resolve_path_params(kw_dump: TypeKwDump, path: str) -> str:
-    params = [
-        {key: val.kw_value} for key, val in kw_dump.dump.items()
-        if val.sig_type is Path and val.kw_value
-    ]
-    if params:
-        resolved = {}
-        for param in params:
-            resolved.update(param)
-        return path.format(**resolved)
-    return path
+    resolved = None
+    for key, val in kw_dump.dump.items():
+        if val.sig_type is Path and val.kw_value:
+            if resolved is None:
+                resolved = {}
+            resolved[key] = val.kw_value
+    return path.format_map(resolved) if resolved is not None else path
+
+def _resolve_body(kw_dump: TypeKwDump) -> Optional[TypeKwObjDump]:
+    for obj in kw_dump.dump.values():
+        if obj.sig_type is Body:
+            return obj
+    return None
 
 def _resolve_send(
           kw_dump: TypeKwDump,
-          ctx_sends_type: Optional[AliasSendsType] = None
+          ctx_sends_type: Optional[AliasSendsType] = None,
+          codec: Optional[TypeCodecDump] = None,
+          client_type: Optional[AliasSessionType] = None,
+          ctx_sends_stream: Optional[TypeSendStreamDump] = None
     ) -> Dict:
-        body = next(
-            (obj for obj in kw_dump.dump.values() if obj.sig_type is Body),
-            None
-        )
+        body = _resolve_body(kw_dump)
         if body:
+            if _is_stream_body(body.kw_value):
+                return _stream_send(
+                    body.kw_value,
+                    client_type,
+                    ctx_sends_stream or TypeSendStreamDump()
+                )
             if ctx_sends_type and ctx_sends_type is AliasSendsType.DATA:
-                return TypeSendDataDump(body.kw_value)._asdict()
-            return TypeSendJsonDump(body.kw_value)._asdict()
+                return {'data': body.kw_value}
+            if codec:
+                content = codec.dumps(body.kw_value)
+                if client_type in (
+                    AliasSessionType.HTTPX_ASYNC, AliasSessionType.HTTPX_SYNC
+                ):
+                    return {'content': content}
+                return {'data': content}
+            return {'json': body.kw_value}
         return {}
 
 def _resolve_query_params(
         base_query_params: Dict,
         ctx_query_params_value: Dict,
-        kw_dump: TypeKwDump
+        kw_dump: Optional[TypeKwDump] = None
     ) -> Dict:
-        base = {}
-        base.update(base_query_params)
-        base.update(ctx_query_params_value)
+        params = _merge_mappings(base_query_params, ctx_query_params_value)
+        if kw_dump is None:
+            return params
+        merged = params
         for key, val in kw_dump.dump.items():
             if val.sig_type is Query and val.kw_value:
-                base[key] = val.kw_value
+                key = val.key or key
             elif val.sig_type is QueryKebab and val.kw_value:
-                base[_kebabize(key)] = val.kw_value
-        if base:
-            return TypeQueryParamsDump(base)._asdict()
-        return base
+                key = val.key or _kebabize(key)
+            else:
+                continue
+            if params is merged:
+                params = dict(merged)
+            params[key] = val.kw_value
+        return params
@@ -1,52 +1,152 @@
 # Standard
-from typing import Any, Dict, List, Optional, Tuple, Union
+from json import loads as json_loads
+from time import perf_counter
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, 
+    Optional, Tuple, Union,
+)
 
 # Local
+from .downloads import _content_length
+from .hooks import Timing
+from .streams import _aiter_stream, _iter_stream
 from .utils import _get_nested
 from toboggan.adapters import EvalReturn
 from toboggan.aliases import AliasReturnType
+from toboggan.models import TypeCodecDump
 
 __all__ = ('Responses',)
 
+_READ_TYPES = frozenset((AliasReturnType.JSON, AliasReturnType.TEXT))
+
 
 class Responses(EvalReturn):
-    __slots__ = ()
+    """Resolves a client response to the endpoint's return type and 
+    evaluates it against the return annotation.
+
+    When `returns.json` is used w/o a `key` and the annotation can be 
+    validated from JSON directly (`pydantic.BaseModel` on Pydantic v2), 
+    the raw body is parsed and validated in one pass and no intermediate 
+    `dict`/`list` tree is built.  W/ a `key`, the body is decoded first 
+    and the nested value is validated instead.
+
+    Streamed bodies are iterated over as chunks, lines or NDJSON values 
+    and aren't evaluated against the return annotation.
+
+    W/ a `timing`, the ends of decoding and validation are stamped on it; 
+    a body parsed and validated in one pass counts as validation.  The 
+    bytes received are the length of a body decoded as JSON or text, or 
+    else the `Content-Length` of the response, if any; a body the caller 
+    hasn't read isn't read for them.
+    """
+    __slots__ = ('__codec', '__timing',)
     
-    def __init__(self, eval_type: Any):
+    def __init__(
+            self,
+            eval_type: Any,
+            codec: Optional[TypeCodecDump] = None,
+            timing: Optional[Timing] = None
+    ):
+        self.__codec = codec
+        self.__timing = timing
         super().__init__(eval_type=eval_type)
 
+    def __evaluate(self, response: Any) -> Any:
+        timing = self.__timing
+        if timing is None:
+            return self.evaluate(response=response)
+        timing.decoded = perf_counter()
+        value = self.evaluate(response=response)
+        timing.validated = perf_counter()
+        return value
+
+    def __evaluate_json(self, content: bytes) -> Any:
+        value = self.evaluate_json(content)
+        if self.__timing is not None:
+            self.__timing.validated = perf_counter()
+        return value
+
+    async def __read(self, response: Any) -> None:
+        body = await response.read()
+        self.__timing.received = perf_counter()
+        self.__timing.bytes_received = len(body)
+
     def resolve_response_std(
             self,
             response: Any,
             ctx_returns_type: Optional[AliasReturnType] = None,
             ctx_returns_json_key: Optional[Union[str, List[str], Tuple[str]]] = None
     ) -> Union[Any, Dict, str, int]:
+        if self.__timing is not None:
+            self.__timing.bytes_received = len(response.content) \
+                if ctx_returns_type in _READ_TYPES \
+                else _content_length(response.headers)
         if ctx_returns_type is AliasReturnType.JSON:
-            json = response.json()
+            if not ctx_returns_json_key and self.validates_json:
+                return self.__evaluate_json(response.content)
+            if self.__codec:
+                json = self.__codec.loads(response.content)
+            else:
+                json = response.json()
             if ctx_returns_json_key:
-                if ctx_returns_json_key:
-                    return _get_nested(json=json, value=ctx_returns_json_key)
-            return json
+                json = _get_nested(json=json, value=ctx_returns_json_key)
+            return self.__evaluate(json)
         elif ctx_returns_type is AliasReturnType.STATUS_CODE:
-            return response.status_code
+            return self.__evaluate(response.status_code)
         elif ctx_returns_type is AliasReturnType.TEXT:
-            return response.text
-        return response
+            return self.__evaluate(response.text)
+        return self.__evaluate(response)
     
+    def resolve_stream_std(
+            self,
+            chunks: Iterable[bytes],
+            ctx_returns_type: AliasReturnType,
+            encoding: str = 'utf-8'
+    ) -> Iterator:
+        return _iter_stream(
+            chunks=chunks,
+            returns_type=ctx_returns_type,
+            encoding=encoding,
+            loads=self.__codec.loads if self.__codec else json_loads
+        )
+
+    def resolve_stream_awaitable(
+            self,
+            chunks: AsyncIterable[bytes],
+            ctx_returns_type: AliasReturnType,
+            encoding: str = 'utf-8'
+    ) -> AsyncIterator:
+        return _aiter_stream(
+            chunks=chunks,
+            returns_type=ctx_returns_type,
+            encoding=encoding,
+            loads=self.__codec.loads if self.__codec else json_loads
+        )
+
     async def resolve_response_awaitable(
             self,
             response: Any,
             ctx_returns_type: Optional[AliasReturnType] = None,
             ctx_returns_json_key: Optional[Union[str, List[str], Tuple[str]]] = None
     ) -> Union[Any, Dict, str, int]:
+        if self.__timing is not None:
+            if ctx_returns_type in _READ_TYPES:
+                await self.__read(response)
+            else:
+                self.__timing.bytes_received = _content_length(response.headers)
         if ctx_returns_type is AliasReturnType.JSON:
-            json = await response.json()
+            if not ctx_returns_json_key and self.validates_json:
+                return self.__evaluate_json(await response.read())
+            if self.__codec:
+                json = self.__codec.loads(await response.read())
+            else:
+                json = await response.json()
             if ctx_returns_json_key:
-                return _get_nested(json=json, value=ctx_returns_json_key)
-            return json
+                json = _get_nested(json=json, value=ctx_returns_json_key)
+            return self.__evaluate(json)
         elif ctx_returns_type is AliasReturnType.STATUS_CODE:
-            return response.status
+            return self.__evaluate(response.status)
         elif ctx_returns_type is AliasReturnType.TEXT:
-            return await response.text()
-        return response
+            return self.__evaluate(await response.text())
+        return self.__evaluate(response)
 
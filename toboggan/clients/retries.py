@@ -0,0 +1,197 @@
+# Standard
+from asyncio import TimeoutError as AsyncTimeoutError
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from random import uniform
+from threading import Lock
+from time import monotonic
+from typing import Any, FrozenSet, Optional, Tuple, Union
+
+# Third-party
+from requests import ConnectionError as RequestsConnectionError, Timeout
+
+# Local
+from toboggan.aliases import AliasJitterType
+from toboggan.models import TypeRetryBudgetDump, TypeRetryDump
+
+__all__ = (
+    'RetryBudget',
+    'RetryPolicy',
+    'resolve_retry_budget',
+    'transport_errors',
+    '_retry_after',
+)
+
+
+def _resolve_transport_errors() -> Tuple[type, ...]:
+    base = [RequestsConnectionError, Timeout, AsyncTimeoutError]
+    try:
+        from aiohttp import ClientConnectionError
+        base.append(ClientConnectionError)
+    except ModuleNotFoundError:
+        pass
+    try:
+        from httpx import TransportError
+        base.append(TransportError)
+    except ModuleNotFoundError:
+        pass
+    return tuple(base)
+
+transport_errors: Tuple[type, ...] = _resolve_transport_errors()
+"""Connection errors and timeouts of every installed client; the
+exceptions retried by default."""
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a `Retry-After` header, in seconds or as an HTTP date, into
+    a delay in seconds.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Decides whether and when a request is re-sent.
+
+    - Responses w/ a status in `status_forcelist` are retried; their
+      `Retry-After` header, if any, sets the delay.
+    - `exceptions` raised while sending are retried for `methods` only
+      (idempotent methods by default), since the request may have reached
+      the server.
+    - The delay grows exponentially from `backoff_factor`, up to
+      `max_backoff`, w/ full or decorrelated jitter so that clients don't
+      retry in lockstep.
+    - A request is re-sent at most `total` times.
+    """
+    __slots__ = ('__config', '__exceptions', '__methods', '__statuses',)
+
+    def __init__(self, config: TypeRetryDump):
+        if isinstance(config.jitter, str) or config.jitter is None:
+            config = config._replace(jitter=AliasJitterType[
+                (config.jitter or 'none').upper()
+            ])
+        self.__config = config
+        self.__exceptions: Tuple[type, ...] = transport_errors \
+            if config.exceptions is None else tuple(config.exceptions)
+        self.__methods: FrozenSet[str] = frozenset(
+            method.upper() for method in config.methods
+        )
+        self.__statuses: FrozenSet[int] = frozenset(config.status_forcelist)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.__config})'
+
+    @property
+    def config(self) -> TypeRetryDump:
+        return self.__config
+
+    @property
+    def total(self) -> int:
+        return self.__config.total
+
+    @property
+    def exceptions(self) -> Tuple[type, ...]:
+        return self.__exceptions
+
+    def retries_status(self, status: int) -> bool:
+        return status in self.__statuses
+
+    def retries_error(self, method: str) -> bool:
+        return method.upper() in self.__methods
+
+    def backoff(self, attempt: int, previous: float) -> float:
+        config = self.__config
+        if config.jitter is AliasJitterType.DECORRELATED:
+            base = config.backoff_factor
+            return min(config.max_backoff, uniform(base, max(base, previous) * 3))
+        ceiling = min(config.max_backoff, config.backoff_factor * (2 ** attempt))
+        if config.jitter is AliasJitterType.FULL:
+            return uniform(0, ceiling)
+        return ceiling
+
+    def delay(
+            self, attempt: int, previous: float, headers: Optional[Any] = None
+    ) -> float:
+        if headers is not None and self.__config.respect_retry_after:
+            retry_after = _retry_after(headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, self.__config.max_backoff)
+        return self.backoff(attempt, previous)
+
+
+class RetryBudget:
+    """A token bucket that caps retries across every endpoint of a
+    :py:class:`Connector`.  Each request adds `ratio` tokens and each
+    second adds `min_per_second`, up to `capacity`; each retry takes one.
+    When the bucket is empty, failures are surfaced instead of retried, so
+    an outage doesn't multiply the load on the server.
+    """
+    __slots__ = ('__config', '__lock', '__stamp', '__tokens',)
+
+    def __init__(self, config: TypeRetryBudgetDump = TypeRetryBudgetDump()):
+        self.__config = config
+        self.__tokens = config.capacity
+        self.__stamp = monotonic()
+        self.__lock = Lock()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.__config})'
+
+    @property
+    def config(self) -> TypeRetryBudgetDump:
+        return self.__config
+
+    @property
+    def tokens(self) -> float:
+        with self.__lock:
+            return self.__refill()
+
+    def __refill(self) -> float:
+        now = monotonic()
+        self.__tokens = min(
+            self.__config.capacity,
+            self.__tokens + (now - self.__stamp) * self.__config.min_per_second
+        )
+        self.__stamp = now
+        return self.__tokens
+
+    def deposit(self) -> None:
+        with self.__lock:
+            self.__tokens = min(
+                self.__config.capacity, self.__tokens + self.__config.ratio
+            )
+
+    def withdraw(self) -> bool:
+        with self.__lock:
+            if self.__refill() < 1:
+                return False
+            self.__tokens -= 1
+            return True
+
+
+def resolve_retry_budget(
+        budget: Union[None, bool, Mapping, TypeRetryBudgetDump, RetryBudget]
+) -> Optional[RetryBudget]:
+    """Resolves the retry budget of a :py:class:`Connector`.  `None` or
+    `False` leaves retries unbudgeted, `True` uses the defaults of
+    `TypeRetryBudgetDump` and a mapping is read as its fields.
+    """
+    if budget is None or budget is False or isinstance(budget, RetryBudget):
+        return budget or None
+    if budget is True:
+        return RetryBudget()
+    if not isinstance(budget, TypeRetryBudgetDump):
+        budget = TypeRetryBudgetDump(**budget)
+    return RetryBudget(budget)
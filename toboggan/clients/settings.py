@@ -1,37 +1,63 @@
 # Standard
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Tuple
 
 # Local
+from .streams import _is_stream_body, _stream_headers
 from .resolvers import (
+    _resolve_body,
     _resolve_headers,
     _resolve_options,
     _resolve_path_params,
     _resolve_query_params,
     _resolve_send,
 )
-from toboggan.aliases import AliasReturnType, AliasSendsType
-from toboggan.models import TypeKwDump, TypeRequestSettingsDump, TypeRetryDump
+from toboggan.aliases import AliasSendsType, AliasSessionType
+from toboggan.models import TypeCodecDump, TypeKwDump, TypeSendStreamDump
 
 __all__ = ('Settings',)
 
+_EMPTY: Dict = {}
+_NO_STREAM = TypeSendStreamDump()
+
+
+class _Merged:
+    """The merge of a class level and a method level mapping, kept for as
+    long as neither changes.  The levels are compared by value, so a
+    mapping updated in place is merged again on the next call.
+    """
+    __slots__ = ('__entry', '__merge',)
+
+    def __init__(self, merge: Callable[[Dict, Dict, Any], Dict]):
+        self.__merge = merge
+        self.__entry: Optional[Tuple[Dict, Dict, Any, Dict]] = None
+
+    def get(self, base: Dict, ctx: Dict, extra: Any = None) -> Dict:
+        entry = self.__entry
+        if entry is not None and entry[2] == extra and \
+                entry[0] == base and entry[1] == ctx:
+            return entry[3]
+        merged = self.__merge(base, ctx, extra)
+        self.__entry = (dict(base), dict(ctx), extra, merged)
+        return merged
+
 
 class Settings:
-    __slots__ = (
-        '__base_headers',
-        '__base_query_params',
-        '__base_url',
-        '__ctx_headers_value',
-        '__ctx_query_params_value',
-        '__ctx_sends_type',
-        '__ctx_retry_value',
-        '__ctx_returns_type',
-        '__ctx_returns_json_key',
-        '__kw_dump',
-        '__path',
-    )
+    """Assembles the keyword arguments of an endpoint's client call, in one
+    pass.  One `Settings` is kept per endpoint; the class and method level
+    headers and query parameters are merged once and the merge is reused,
+    w/o a copy, until either level changes or a call's arguments add to
+    it.  The mapping returned is passed to the client as is and mustn't be
+    mutated.
+    """
+    __slots__ = ('__headers', '__query_params',)
 
-    def __init__(
+    def __init__(self):
+        self.__headers = _Merged(_resolve_headers)
+        self.__query_params = _Merged(_resolve_query_params)
+
+    def dump(
             self,
+            method: str,
             base_url: str,
             path: str,
             base_headers: Dict,
@@ -39,74 +65,57 @@ class Settings:
             kw_dump: TypeKwDump,
             ctx_headers_value: Dict,
             ctx_query_params_value: Dict,
-            ctx_sends_type: AliasSendsType,
-            ctx_retry_value: Optional[TypeRetryDump] = None,
-            ctx_returns_type: Optional[AliasReturnType] = None,
-            ctx_returns_json_key: Optional[Union[str, List[str], Tuple[str]]] = None
-    ):
-        self.__base_url = base_url
-        self.__path = path
-        self.__base_headers = base_headers
-        self.__base_query_params = base_query_params
-        self.__kw_dump = kw_dump
-        self.__ctx_retry_value = ctx_retry_value
-        self.__ctx_headers_value = ctx_headers_value
-        self.__ctx_query_params_value = ctx_query_params_value
-        self.__ctx_sends_type = ctx_sends_type
-        self.__ctx_returns_type = ctx_returns_type
-        self.__ctx_returns_json_key = ctx_returns_json_key
-
-    def url(self) -> str:
-        path = _resolve_path_params(self.__kw_dump, self.__path)
-        return self.__base_url + path
-
-    def headers(self) -> Dict:
-        mapping: Dict = _resolve_headers(
-            base_headers=self.__base_headers,
-            ctx_headers_value=self.__ctx_headers_value
+            ctx_sends_type: Optional[AliasSendsType] = None,
+            ctx_sends_stream: Optional[TypeSendStreamDump] = None,
+            codec: Optional[TypeCodecDump] = None,
+            client_type: Optional[AliasSessionType] = None
+    ) -> Dict:
+        request = {
+            'method': method,
+            'url': base_url + _resolve_path_params(kw_dump, path),
+        }
+        body = _resolve_body(kw_dump)
+        send = None
+        streamed = None
+        if body is not None:
+            send = _resolve_send(
+                kw_dump, ctx_sends_type, codec, client_type, ctx_sends_stream
+            )
+            if _is_stream_body(body.kw_value):
+                streamed = body.kw_value
+        encoded = codec is not None and streamed is None and \
+            ctx_sends_type is not AliasSendsType.DATA and bool(send)
+        headers = self.__headers.get(
+            base_headers,
+            ctx_headers_value,
+            codec.content_type if encoded else None
         )
-        return mapping
-
-    def query_params(self) -> Dict:
-        mapping: Dict = _resolve_query_params(
-            base_query_params=self.__base_query_params,
-            ctx_query_params_value=self.__ctx_query_params_value,
-            kw_dump=self.__kw_dump
-        )
-        return mapping
-
-    def send(self) -> Dict:
-        type_ = _resolve_send(self.__kw_dump, self.__ctx_sends_type)
-        return type_
-
-    def options(self) -> Dict:
-        opts: Dict = _resolve_options(self.__kw_dump)
-        return opts
-
-    @property
-    def retry(self) -> Optional[TypeRetryDump]:
-        return self.__ctx_retry_value
-
-    @property
-    def returns_type(self) -> Optional[AliasReturnType]:
-        return self.__ctx_returns_type
-
-    @property
-    def returns_json_key(self) -> Optional[Union[str, List[str], Tuple[str]]]:
-        return self.__ctx_returns_json_key
-
-    def dump(
-            self, session: Any, method: str
-    ) -> TypeRequestSettingsDump:
-        return TypeRequestSettingsDump(
-            session=session,
-            method=method,
-            url=self.url(),
-            headers=self.headers(),
-            query_params=self.query_params(),
-            send=self.send(),
-            options=self.options(),
-            retry=self.retry,
-            returns_type=self.returns_type,
-            returns_json_key=self.returns_json_key
+        if streamed is not None:
+            headers = _resolve_headers(
+                headers,
+                _EMPTY,
+                stream_headers=_stream_headers(
+                    streamed, client_type, ctx_sends_stream or _NO_STREAM
+                )
+            )
+        params = _resolve_query_params(
+            self.__query_params.get(base_query_params, ctx_query_params_value),
+            _EMPTY,
+            kw_dump
         )
+        options = _resolve_options(kw_dump)
+        if options:
+            for key, value in options.items():
+                if key == 'headers':
+                    headers = {**headers, **value}
+                elif key == 'params':
+                    params = {**params, **value}
+                else:
+                    request[key] = value
+        if headers:
+            request['headers'] = headers
+        if params:
+            request['params'] = params
+        if send:
+            request.update(send)
+        return request
@@ -0,0 +1,262 @@
+# Standard
+from asyncio import to_thread
+from collections.abc import AsyncIterator as AsyncIteratorABC
+from collections.abc import Iterator as IteratorABC
+from io import IOBase
+from json import loads as json_loads
+from mmap import mmap
+from os import fstat
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+# Local
+from toboggan.aliases import AliasReturnType, AliasSessionType
+from toboggan.models import TypeSendStreamDump, TypeSendStreamErrDump
+
+__all__ = (
+    'stream_types',
+    'unbuffered_types',
+    '_CHUNK_SIZE',
+    '_LineSplitter',
+    '_aiter_stream',
+    '_encoding',
+    '_body_size',
+    '_httpx_stream',
+    '_is_one_shot',
+    '_is_stream_body',
+    '_iter_stream',
+    '_stream_headers',
+    '_stream_send',
+)
+
+_CHUNK_SIZE = 64 * 1024
+_HTTPX_SEND_OPTIONS = ('auth', 'follow_redirects',)
+
+stream_types = frozenset((
+    AliasReturnType.BYTES, AliasReturnType.LINES, AliasReturnType.NDJSON,
+))
+"""The return types that iterate over the response body."""
+
+unbuffered_types = stream_types | frozenset((AliasReturnType.FILE,))
+"""The return types that read the response body w/o buffering it."""
+
+
+class _LineSplitter:
+    """Splits a body fed in chunks into lines w/o their line endings.
+    A line that spans chunks is held until its end arrives.
+    """
+    __slots__ = ('__pending',)
+
+    def __init__(self):
+        self.__pending = bytearray()
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        self.__pending += chunk
+        if b'\n' not in chunk:
+            return []
+        *lines, pending = self.__pending.split(b'\n')
+        self.__pending = pending
+        return [bytes(line.rstrip(b'\r')) for line in lines]
+
+    def flush(self) -> List[bytes]:
+        pending, self.__pending = self.__pending, bytearray()
+        return [bytes(pending.rstrip(b'\r'))] if pending else []
+
+
+def _encoding(response: Any) -> str:
+    return getattr(response, 'charset', None) or \
+        getattr(response, 'encoding', None) or 'utf-8'
+
+
+def _items(
+        lines: List[bytes],
+        returns_type: AliasReturnType,
+        encoding: str,
+        loads: Callable[[bytes], Any]
+) -> Iterator:
+    if returns_type is AliasReturnType.LINES:
+        for line in lines:
+            yield line.decode(encoding)
+        return
+    for line in lines:
+        if line.strip():
+            yield loads(line)
+
+
+def _iter_stream(
+        chunks: Iterable[bytes],
+        returns_type: AliasReturnType,
+        encoding: str = 'utf-8',
+        loads: Callable[[bytes], Any] = json_loads
+) -> Iterator:
+    """Yields the body as chunks of bytes, decoded lines or decoded NDJSON
+    values.
+    """
+    if returns_type is AliasReturnType.BYTES:
+        yield from chunks
+        return
+    splitter = _LineSplitter()
+    for chunk in chunks:
+        yield from _items(splitter.feed(chunk), returns_type, encoding, loads)
+    yield from _items(splitter.flush(), returns_type, encoding, loads)
+
+
+async def _aiter_stream(
+        chunks: AsyncIterable[bytes],
+        returns_type: AliasReturnType,
+        encoding: str = 'utf-8',
+        loads: Callable[[bytes], Any] = json_loads
+) -> AsyncIterator:
+    """The nonblocking counterpart of :py:func:`_iter_stream`.
+    """
+    if returns_type is AliasReturnType.BYTES:
+        async for chunk in chunks:
+            yield chunk
+        return
+    splitter = _LineSplitter()
+    async for chunk in chunks:
+        for item in _items(splitter.feed(chunk), returns_type, encoding, loads):
+            yield item
+    for item in _items(splitter.flush(), returns_type, encoding, loads):
+        yield item
+
+
+def _httpx_stream(session: Any, method: str, url: str, **kwargs) -> Any:
+    """Sends a request w/ an `httpx` client w/o reading the response body.
+    Returns the response, or a coroutine of it for an `AsyncClient`.
+    """
+    send_options = {
+        option: kwargs.pop(option)
+        for option in _HTTPX_SEND_OPTIONS if option in kwargs
+    }
+    request = session.build_request(method=method, url=url, **kwargs)
+    return session.send(request, stream=True, **send_options)
+
+
+def _is_stream_body(value: Any) -> bool:
+    """Whether a body is sent as is rather than encoded: file objects,
+    `mmap`/`memoryview` buffers and sync or async iterators of bytes.
+    """
+    return isinstance(value, (memoryview, mmap, IteratorABC, AsyncIteratorABC)) \
+        or hasattr(value, 'read')
+
+
+def _is_one_shot(value: Any) -> bool:
+    """Whether a body is consumed by sending it, so it can't be re-sent.
+    Files and `mmap` buffers are read from their current position.
+    """
+    return not isinstance(value, memoryview) and _is_stream_body(value)
+
+
+def _body_size(value: Any) -> Optional[int]:
+    if isinstance(value, memoryview):
+        return value.nbytes
+    if isinstance(value, mmap):
+        return len(value) - value.tell()
+    try:
+        return fstat(value.fileno()).st_size - value.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _iter_buffer(buffer: memoryview, chunk_size: int) -> Iterator[bytes]:
+    for start in range(0, buffer.nbytes, chunk_size):
+        yield bytes(buffer[start:start + chunk_size])
+
+
+def _iter_file(file: Any, chunk_size: int) -> Iterator[bytes]:
+    while chunk := file.read(chunk_size):
+        yield chunk
+
+
+async def _aiter_sync(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _aiter_file(file: Any, chunk_size: int) -> AsyncIterator[bytes]:
+    while chunk := await to_thread(file.read, chunk_size):
+        yield chunk
+
+
+def _sent_as_is(value: Any, client_type: AliasSessionType) -> bool:
+    """Whether the client streams a body itself, rather than from the
+    iterator of chunks it's adapted to.
+    """
+    if client_type is AliasSessionType.REQUESTS:
+        return True
+    if client_type is AliasSessionType.AIOHTTP:
+        return isinstance(value, (AsyncIteratorABC, IOBase, memoryview))
+    if client_type is AliasSessionType.HTTPX_ASYNC:
+        return isinstance(value, AsyncIteratorABC)
+    return isinstance(value, IteratorABC) and not hasattr(value, 'read')
+
+
+def _stream_send(
+        value: Any,
+        client_type: AliasSessionType,
+        config: TypeSendStreamDump = TypeSendStreamDump()
+) -> Dict:
+    """Adapts a streamed body to what the client sends w/o buffering it.
+
+    `requests` streams every kind of body itself, and `aiohttp` file
+    objects, buffers and async iterators.  Otherwise the body is read in
+    `chunk_size` chunks, by an async iterator for nonblocking clients.
+    Iterators of unknown size are sent w/ chunked transfer encoding.
+    """
+    is_async = isinstance(value, AsyncIteratorABC)
+    if is_async and client_type in (
+            AliasSessionType.REQUESTS, AliasSessionType.HTTPX_SYNC
+    ):
+        raise TypeError(TypeSendStreamErrDump(
+            client=client_type.name, type_found=type(value)
+        ))
+    key = 'content' if client_type in (
+        AliasSessionType.HTTPX_ASYNC, AliasSessionType.HTTPX_SYNC
+    ) else 'data'
+    send = {}
+    if config.expect_continue and client_type is AliasSessionType.AIOHTTP:
+        send['expect100'] = True
+    if _sent_as_is(value, client_type):
+        send[key] = value
+        return send
+    if isinstance(value, memoryview):
+        chunks = _iter_buffer(value, config.chunk_size)
+    elif hasattr(value, 'read'):
+        if client_type is not AliasSessionType.HTTPX_SYNC:
+            send[key] = _aiter_file(value, config.chunk_size)
+            return send
+        chunks = _iter_file(value, config.chunk_size)
+    else:
+        chunks = value
+    send[key] = chunks if client_type is AliasSessionType.HTTPX_SYNC \
+        else _aiter_sync(chunks)
+    return send
+
+
+def _stream_headers(
+        value: Any,
+        client_type: AliasSessionType,
+        config: TypeSendStreamDump = TypeSendStreamDump()
+) -> Dict:
+    """The headers of a streamed body: `Content-Length` when its size is
+    known but the client only sees an iterator of chunks, and
+    `Expect: 100-continue`.
+    """
+    headers = {}
+    if not _sent_as_is(value, client_type):
+        size = _body_size(value)
+        if size is not None:
+            headers['Content-Length'] = str(size)
+    if config.expect_continue and client_type is not AliasSessionType.AIOHTTP:
+        headers['Expect'] = '100-continue'
+    return headers
@@ -1,5 +1,5 @@
 # Standard
-from typing import Dict, List, Literal, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 # Local
 from toboggan.models import TypeNestedKeyErrDump, TypeNestedTypeErrDump
@@ -29,14 +29,16 @@ def _get_nested(
             raise KeyError(err)
     return json
 
-def _merge_mappings(
-        base: Dict, supp: Dict, target: Literal['headers', 'params']
-) -> None:
-    common_keys = base.keys() & supp.keys()
-    if common_keys:
-        for key in common_keys:
-            base.get(target).update(supp[key])
-        supp.pop(target, None)
+def _merge_mappings(base: Dict, supp: Dict) -> Dict:
+    """`supp` merged over `base`.  Neither is mutated, and when either is 
+    empty the other is returned as is, so the result mustn't be mutated 
+    either.
+    """
+    if not supp:
+        return base
+    if not base:
+        return supp
+    return {**base, **supp}
 
 def _kebabize(key: str) -> str:
         return key.replace('_', '-')
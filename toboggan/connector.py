@@ -1,15 +1,54 @@
 # Standard
 from __future__ import annotations
-from typing import Any, Optional, Union
+from collections.abc import AsyncIterable, Mapping
+from functools import partial
+from inspect import isclass, isfunction
+from typing import (
+    Any, AsyncIterator, Callable, Iterable, Iterator, Optional, Tuple, Union,
+)
 
 # Local
-from .aliases import AliasSessionType
+from .aliases import AliasCodecType, AliasSessionType
 from .clients import (
-    AsyncClient, Client, ClientSession, Session, resolve_client_type,
+    AsyncClient,
+    Breakers,
+    Client,
+    ClientSession,
+    Driver,
+    Hook,
+    Hooks,
+    Metrics,
+    Prepared,
+    RateLimiter,
+    RetryBudget,
+    Session,
+    resolve_breakers,
+    resolve_codec,
+    resolve_driver,
+    resolve_hooks,
+    resolve_metrics,
+    resolve_pool,
+    resolve_retry_budget,
+    shared_pools,
+    _aclose_client,
+    _amap,
+    _blocking_close_error,
+    _build_client,
+    _close_client,
+    _configure_client,
+    _map,
+    _pool_key,
+    _running_loop,
+)
+from .models import (
+    TypeCircuitBreakerDump, TypeCodecDump, TypePoolDump, TypeRetryBudgetDump,
 )
 
 __all__ = ('Connector',)
 
+_PREPARE_ATTR = '__toboggan_prepare__'
+_UNSET = object()
+
 
 class MetaclassConnector(type):
 
@@ -22,41 +61,377 @@ class MetaclassConnector(type):
 
 class Connector(metaclass=MetaclassConnector):
     """Base connector class for API clients.
+
+    `client` is either a client instance, used as is, or a client class 
+    the `Connector` builds, w/ its connection pool sized by `pool`, and 
+    owns.  Owned clients are closed when swapped out and when the 
+    `Connector` is closed; a client instance is left open.  Async client 
+    classes are built on first use, or on `async with`, so they're bound 
+    to the running event loop, and can only be swapped out on it or once 
+    closed w/ `aclose`.  Requests are sent through the `Driver` 
+    registered for the client's class.  W/ `share_pool`, connectors w/ 
+    the same client class, origin and pool settings share one owned 
+    client.  W/ `coalesce`, concurrent identical idempotent requests of 
+    an endpoint are sent once and share the result.  `retry_budget` caps 
+    the retries of every endpoint w/ one token bucket.  
+    `circuit_breaker` gives every endpoint a circuit breaker of its own.  
+    `hooks` are called at each stage of every call w/ its timings.  
+    `metrics` keeps the metrics of every endpoint, in the process-wide 
+    `shared_metrics` if `True`.
     """
+    __client: Any = None
+    __driver: Optional[Driver] = None
+    __owned: bool = False
+    __pending: Optional[type] = None
+    __shared: bool = False
+    pool: Optional[TypePoolDump] = None
+    share_pool: bool = False
+    coalesce: bool = False
+    retry_budget: Optional[RetryBudget] = None
+    rate_limiter: Optional[RateLimiter] = None
+    circuit_breakers: Optional[Breakers] = None
+    hooks: Optional[Hooks] = None
+    metrics: Optional[Metrics] = None
 
     def __init__(
             self,
             base_url: Optional[str] = None,
-            client: Union[Session, Client, ClientSession, AsyncClient] = Session()
+            client: Union[
+                None, type, Session, Client, ClientSession, AsyncClient
+            ] = None,
+            codec: Union[None, str, AliasCodecType, TypeCodecDump] = None,
+            pool: Union[None, Mapping, TypePoolDump] = None,
+            share_pool: bool = False,
+            coalesce: bool = False,
+            retry_budget: Union[
+                None, bool, Mapping, TypeRetryBudgetDump, RetryBudget
+            ] = None,
+            circuit_breaker: Union[
+                None, bool, Mapping, TypeCircuitBreakerDump, Breakers
+            ] = None,
+            hooks: Union[None, Mapping, Hooks] = None,
+            metrics: Union[None, bool, Metrics] = None
         ):
         self.base_url = base_url
+        self.coalesce = coalesce
+        self.retry_budget = resolve_retry_budget(retry_budget)
+        self.circuit_breakers = resolve_breakers(circuit_breaker)
+        self.hooks = resolve_hooks(hooks)
+        self.metrics = resolve_metrics(metrics)
+        if self.metrics is not None:
+            self.hooks = (self.hooks or Hooks()).merge(self.metrics)
+        self.pool = resolve_pool(pool)
+        self.share_pool = share_pool
         self.client = client
-        self.client_type
+        self.codec = resolve_codec(codec)
 
     def __repr__(self):
         return (
             f'{self.__class__.__name__}('
             f'base_url={self.base_url}, '
-            f'client={self.client}, '
+            f'client={self.__pending or self.__client}, '
+            f'codec={getattr(self, "codec", None)}, '
+            f'pool={self.pool}, '
             f'base_headers={getattr(self, "base_headers", None)}, '
             f'base_query_params={getattr(self, "base_query_params", None)}'
             ')'
         )
 
+    def __copy__(self) -> Connector:
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.__owned = clone.__shared = False
+        return clone
+
+    def __enter__(self) -> Connector:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    async def __aenter__(self) -> Connector:
+        if self.__pending is not None:
+            self.__build()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
     def __call__(
             self,
             base_url: Optional[str] = None,
-            client: Optional[Union[Session, Client, ClientSession, AsyncClient]] = None
+            client: Union[
+                None, type, Session, Client, ClientSession, AsyncClient
+            ] = None,
+            codec: Union[None, str, AliasCodecType, TypeCodecDump] = _UNSET
     ) -> Connector:
+        """Reassigns the base URL, the client or the codec; pass
+        `codec=None` to go back to the client's own JSON decoding.
+        """
         if base_url:
             self.base_url = base_url
         if client:
             self.client = client
+        if codec is not _UNSET:
+            self.codec = resolve_codec(codec)
         return self
 
+    @property
+    def client(self) -> Union[Session, Client, ClientSession, AsyncClient]:
+        if self.__pending is not None:
+            self.__build()
+        return self.__client
+
+    @client.setter
+    def client(
+            self,
+            client: Union[
+                None, type, Session, Client, ClientSession, AsyncClient
+            ]
+    ) -> None:
+        driver = resolve_driver(client or Session)
+        if self.__driver is not None and self.__driver.nonblocking and \
+                self.__closes() and _running_loop() is None:
+            raise _blocking_close_error()
+        pending = client if isclass(client) and driver.nonblocking else None
+        acquired = (None, False, False) if pending is not None \
+            else self.__acquire(client)
+        released = self.__release()
+        self.__client, self.__owned, self.__shared = acquired
+        self.__pending = pending
+        self.__driver = driver
+        if released is not None and released is not self.__client:
+            _close_client(released)
+
+    def __build(self) -> None:
+        """Builds the pending async client on the running event loop.
+        """
+        client_cls, self.__pending = self.__pending, None
+        self.__client, self.__owned, self.__shared = self.__acquire(
+            client_cls, _running_loop()
+        )
+
+    def __acquire(
+            self, client: Any, loop: Optional[Any] = None
+    ) -> Tuple[Any, bool, bool]:
+        if client is not None and not isclass(client):
+            return _configure_client(client, self.pool), False, False
+        client_cls = client or Session
+        if not self.share_pool:
+            return _build_client(client_cls, self.pool), True, False
+        return shared_pools.acquire(
+            _pool_key(client_cls, self.base_url, self.pool, loop),
+            partial(_build_client, client_cls, self.pool)
+        ), True, True
+
+    def __closes(self) -> bool:
+        """Whether letting go of the client closes it.
+        """
+        if self.__shared:
+            return shared_pools.holders(self.__client) == 1
+        return self.__owned
+
+    def __release(self) -> Optional[Any]:
+        """Lets go of the client and returns it if it should be closed: 
+        owned clients always and shared ones once the last holder lets go.  
+        A client instance passed in is never closed.
+        """
+        client, owned, shared = self.__client, self.__owned, self.__shared
+        self.__owned = self.__shared = False
+        self.__pending = None
+        if shared:
+            return client if shared_pools.release(client) else None
+        return client if owned else None
+
+    def close(self) -> None:
+        """Closes the client the `Connector` built and its connection 
+        pool.  A shared client is closed once every `Connector` holding it 
+        is closed.  A client instance passed in is left open for its owner 
+        to close.
+
+        ::
+
+            with Httpbin(
+                    base_url='https://httpbin.org', pool={'max_per_host': 20}
+            ) as httpbin:
+                httpbin.get_anything()
+        """
+        if self.__driver.nonblocking:
+            raise _blocking_close_error()
+        client = self.__release()
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Closes the client the `Connector` built and its connection 
+        pool from async code.  A client instance passed in is left open.
+
+        ::
+
+            async with PokeApi(
+                    client=ClientSession, pool={'max_connections': 50}
+            ) as poke_api:
+                await poke_api.get_pokemon(25)
+        """
+        client = self.__release()
+        if client is not None:
+            await _aclose_client(client)
+
     def session(self) -> Any:
         return self.client
 
+    def __register(self, event: str, hook: Hook) -> Hook:
+        if self.hooks is None:
+            self.hooks = Hooks()
+        return self.hooks.register(event, hook)
+
+    def on_request(self, hook: Hook) -> Hook:
+        """Registers a hook called before each attempt of every call is 
+        sent.  Usable as a decorator.
+
+        ::
+
+            @httpbin.on_request
+            def log_request(timing):
+                print(timing.method, timing.url, timing.attempts)
+        """
+        return self.__register('on_request', hook)
+
+    def on_response(self, hook: Hook) -> Hook:
+        """Registers a hook called once a call returns, w/ the timings of 
+        every stage.  Usable as a decorator.
+
+        ::
+
+            @httpbin.on_response
+            def log_timings(timing):
+                print(timing.endpoint, timing.durations())
+        """
+        return self.__register('on_response', hook)
+
+    def on_retry(self, hook: Hook) -> Hook:
+        """Registers a hook called when an attempt failed and is about to 
+        be retried.  Usable as a decorator.
+        """
+        return self.__register('on_retry', hook)
+
+    def on_error(self, hook: Hook) -> Hook:
+        """Registers a hook called when a call raises.  Usable as a 
+        decorator.
+        """
+        return self.__register('on_error', hook)
+
+    def map(
+            self,
+            endpoint: Callable,
+            arguments: Iterable,
+            limit: int = 10,
+            queue_size: Optional[int] = None,
+            ordered: bool = True
+    ) -> Iterator:
+        """Calls a blocking endpoint once per set of arguments on a pool of 
+        `limit` threads and yields the results.
+
+        W/ `requests`, each thread sends through its own clone of the 
+        client, w/ the same headers, cookies, auth and adapters, since a 
+        `requests.Session` isn't safe to share across threads.  An 
+        `httpx.Client` is thread-safe and is shared.  Arguments, 
+        `queue_size`, `ordered` and errors behave as in :py:meth:`amap`; 
+        calls that already started when an error is raised are allowed to 
+        finish.
+
+        ::
+
+            for response in httpbin.map(
+                httpbin.get_anything,
+                ({'no': no} for no in range(1, 101)),
+                limit=8
+            ):
+                ...
+        """
+        if limit < 1:
+            raise ValueError('`limit` must be at least 1.')
+        if self.__driver.nonblocking:
+            raise TypeError(
+                '`map` requires a blocking client.  Use `amap` w/ '
+                '`aiohttp.ClientSession` or `httpx.AsyncClient`.'
+            )
+        return _map(
+            conn=self,
+            func=getattr(endpoint, '__func__', endpoint),
+            arguments=arguments,
+            limit=limit,
+            queue_size=limit if queue_size is None else queue_size,
+            ordered=ordered
+        )
+
+    def amap(
+            self,
+            endpoint: Callable,
+            arguments: Union[Iterable, AsyncIterable],
+            limit: int = 10,
+            queue_size: Optional[int] = None,
+            ordered: bool = True
+    ) -> AsyncIterator:
+        """Calls an async endpoint once per set of arguments, w/ at most 
+        `limit` requests in flight, and yields the results.
+
+        Each item of `arguments` is a mapping of keyword arguments, a tuple 
+        of positional arguments or a single positional argument; it can be 
+        an iterable or an async iterable.  At most `queue_size` (defaults 
+        to `limit`) items are read ahead of the requests in flight.  
+        Results are yielded in input order, or in completion order if 
+        `ordered` is false.  The first error cancels every request still 
+        in flight and is raised.
+
+        ::
+
+            async with PokeApi(client=ClientSession) as poke_api:
+                async for pokemon in poke_api.amap(
+                    poke_api.get_pokemon, range(1, 152), limit=20
+                ):
+                    ...
+        """
+        if limit < 1:
+            raise ValueError('`limit` must be at least 1.')
+        if isfunction(endpoint):
+            endpoint = endpoint.__get__(self)
+        return _amap(
+            func=endpoint,
+            arguments=arguments,
+            limit=limit,
+            queue_size=limit if queue_size is None else queue_size,
+            ordered=ordered
+        )
+
+    def prepare(self, endpoint: Callable, *args, **kwargs) -> Prepared:
+        """Binds the arguments of an endpoint and resolves its request 
+        once, for a request sent many times as is, e.g. when polling.  
+        The :py:class:`Prepared` request returned is sent w/ `send` or 
+        `send_many`.
+
+        ::
+
+            prepared = httpbin.prepare(httpbin.get_anything, 1)
+            for _ in range(100):
+                prepared.send()
+        """
+        prepare = getattr(
+            getattr(endpoint, '__func__', endpoint), _PREPARE_ATTR, None
+        )
+        if prepare is None:
+            raise TypeError(
+                '`prepare` requires an endpoint decorated w/ a verb.'
+            )
+        return prepare(self, *args, **kwargs)
+
+    @property
+    def driver(self) -> Driver:
+        """The :py:class:`Driver` the client is sent through, resolved 
+        when the client is assigned.
+        """
+        return self.__driver
+
     @property
     def client_type(self) -> AliasSessionType:
-        return resolve_client_type(self.client)
+        return self.__driver.client_type
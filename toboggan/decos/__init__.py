@@ -1,5 +1,7 @@
-from .monomorphic import retry, returns, sends
-from .polymorphic import headers, params
+from .monomorphic import (
+    cache, circuit_breaker, coalesce, paginate, retry, returns, sends,
+)
+from .polymorphic import headers, params, rate_limit
 from .verbs import (
     connect,
     delete,
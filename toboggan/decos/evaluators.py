@@ -1,57 +1,149 @@
 # Standard
-from inspect import signature
-from typing import Any, Callable, Dict, Optional, Tuple, Union, get_type_hints
+from inspect import Parameter, signature
+from typing import (
+    Any, Callable, Dict, FrozenSet, Optional, Tuple, get_type_hints,
+)
 
 # Local
 from toboggan import Connector
 from toboggan.annotations import Body, Options, Path, Query, QueryKebab
-from toboggan.models import TypeKwDump, TypeKwObjDump
+from toboggan.clients.utils import _kebabize
+from toboggan.models import TypeKwDump, TypeKwObjDump, TypeSlotDump
 
 __all__ = ('_EvalSignature',)
 
+_ROLES = (Body, Options, Path, Query, QueryKebab,)
+_POSITIONAL = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD,)
+
 
 class _EvalSignature:
-    __slots__ = ('__eval_type', '__signature',  '__type_hints',)
+    """Compiles the signature of a verb-decorated function into a call
+    plan.  The plan is built once, at decoration time, and maps every
+    positional and keyword slot straight to its annotated role, w/
+    kebab-cased query keys precomputed.  Signatures the plan can't
+    express (`*args`, positional-only parameters) are bound through
+    :py:meth:`inspect.Signature.bind` instead.
+    """
+    __slots__ = (
+        '__eval_type',
+        '__has_self',
+        '__keywords',
+        '__plan',
+        '__positional',
+        '__signature',
+        '__type_hints',
+        '__var_keyword',
+    )
 
     def __init__(self, func: Callable):
         self.__signature = signature(func)
         self.__type_hints: Dict = get_type_hints(func)
         self.__eval_type: Any = self.__type_hints.get('return')
-    
+        self.__compile()
+
     @property
     def eval_type(self) -> Optional[Any]:
         return self.__eval_type
-    
-    def __eval_std(
-            self,
-            base: TypeKwDump,
-            sig_key: Union[Body, Path, Query, QueryKebab, Any],
-            sig_value: Union[Dict, str, int]
-        ) -> None:
-        annotation = self.__type_hints.get(sig_key)
-        if annotation in (Body, Path, Query, QueryKebab,):
-            base.dump[sig_key] = TypeKwObjDump(
-                sig_type=annotation, kw_value=sig_value
-            )
 
-    def __eval_options(
-            self,
-            base: TypeKwDump,
-            sig_key: Union[Options, Any],
-            sig_value: Union[Dict, str, int]
-        ) -> None:
-        annotation = self.__type_hints.get(sig_key)
-        if annotation is Options and sig_value:
-            base.dump[sig_key] = TypeKwObjDump(
-                sig_type=annotation, kw_value=sig_value
-            )
+    def __role(self, name: str) -> Optional[Any]:
+        annotation = self.__type_hints.get(name)
+        return annotation if annotation in _ROLES else None
+
+    def __compile(self) -> None:
+        plan = []
+        keywords = set()
+        self.__positional: int = 0
+        self.__var_keyword: Optional[TypeSlotDump] = None
+        for param in self.__signature.parameters.values():
+            sig_type = self.__role(param.name)
+            if param.kind in (
+                    Parameter.POSITIONAL_ONLY, Parameter.VAR_POSITIONAL,
+            ):
+                plan = None
+                break
+            if param.kind is Parameter.VAR_KEYWORD:
+                self.__var_keyword = TypeSlotDump(
+                    name=param.name,
+                    position=None,
+                    sig_type=sig_type,
+                    key=param.name,
+                    default=Parameter.empty
+                )
+                continue
+            position = None
+            if param.kind in _POSITIONAL:
+                position = self.__positional
+                self.__positional += 1
+            keywords.add(param.name)
+            plan.append(TypeSlotDump(
+                name=param.name,
+                position=position,
+                sig_type=sig_type,
+                key=_kebabize(param.name) if sig_type is QueryKebab
+                else param.name,
+                default=param.default
+            ))
+        self.__plan: Optional[Tuple[TypeSlotDump]] = (
+            tuple(plan) if plan is not None else None
+        )
+        self.__keywords: FrozenSet[str] = frozenset(keywords)
+        self.__has_self: bool = bool(plan) and plan[0].name == 'self'
 
-    def dump(self, *args, **kwargs) -> Tuple[Connector,TypeKwDump]:
-        base = TypeKwDump()
+    def __dump_bound(self, *args, **kwargs) -> Tuple[Connector, TypeKwDump]:
+        base = TypeKwDump(dump={})
         bound = self.__signature.bind(*args, **kwargs)
         bound.apply_defaults()
         conn: Connector = bound.arguments.get('self', Connector)
         for sig_key, sig_value in bound.arguments.items():
-            self.__eval_std(base=base, sig_key=sig_key, sig_value=sig_value)
-            self.__eval_options(base=base, sig_key=sig_key, sig_value=sig_value)
+            sig_type = self.__role(sig_key)
+            if sig_type is None or (sig_type is Options and not sig_value):
+                continue
+            base.dump[sig_key] = TypeKwObjDump(
+                sig_type=sig_type,
+                kw_value=sig_value,
+                key=_kebabize(sig_key) if sig_type is QueryKebab else sig_key
+            )
         return conn, base
+
+    def dump(self, *args, **kwargs) -> Tuple[Connector, TypeKwDump]:
+        if self.__plan is None or len(args) > self.__positional:
+            return self.__dump_bound(*args, **kwargs)
+        dump = {}
+        count = len(args)
+        consumed = 0
+        for slot in self.__plan:
+            if slot.position is not None and slot.position < count:
+                if slot.name in kwargs:
+                    return self.__dump_bound(*args, **kwargs)
+                value = args[slot.position]
+            elif slot.name in kwargs:
+                value = kwargs[slot.name]
+                consumed += 1
+            elif slot.default is not Parameter.empty:
+                value = slot.default
+            else:
+                return self.__dump_bound(*args, **kwargs)
+            if slot.sig_type is not None and (
+                    slot.sig_type is not Options or value
+            ):
+                dump[slot.name] = TypeKwObjDump(
+                    sig_type=slot.sig_type, kw_value=value, key=slot.key
+                )
+        var_keyword = self.__var_keyword
+        if consumed != len(kwargs) and var_keyword is None:
+            return self.__dump_bound(*args, **kwargs)
+        if var_keyword is not None and var_keyword.sig_type is not None:
+            extra = {
+                key: val for key, val in kwargs.items()
+                if key not in self.__keywords
+            } if consumed != len(kwargs) else {}
+            if var_keyword.sig_type is not Options or extra:
+                dump[var_keyword.name] = TypeKwObjDump(
+                    sig_type=var_keyword.sig_type,
+                    kw_value=extra,
+                    key=var_keyword.key
+                )
+        conn = args[0] if self.__has_self and args else kwargs.get(
+            'self', Connector
+        )
+        return conn, TypeKwDump(dump=dump)
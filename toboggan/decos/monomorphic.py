@@ -1,29 +1,50 @@
 # Standard
-from functools import wraps
-from typing import Callable, List, Optional, Set, Tuple, Union
+from hashlib import new as new_hash
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple, Union
 
 # Local
-from .contexts import (
-   _ctx_retry_value,
-   _ctx_returns_type,
-   _ctx_returns_json_value,
-   _ctx_sends_type,
+from .specs import _configure_endpoint
+from toboggan.clients.breakers import Breaker
+from toboggan.clients.caches import ResponseCache
+from toboggan.clients.retries import RetryPolicy
+from toboggan.aliases import (
+    AliasCircuitState,
+    AliasJitterType,
+    AliasPaginateType,
+    AliasReqOptType,
+    AliasReturnType,
+    AliasSendsType,
+)
+from toboggan.models import (
+    TypeCircuitBreakerDump,
+    TypeCircuitStatsDump,
+    TypeDownloadDump,
+    TypePaginateDump,
+    TypeRetryDump,
+    TypeSendStreamDump,
 )
-from toboggan.aliases import AliasReqOptType, AliasReturnType, AliasSendsType
-from toboggan.connector import Connector
-from toboggan.models import TypeRetryDump
 
 
-__all__ = ('retry', 'returns', 'sends',)
+__all__ = (
+    'cache',
+    'circuit_breaker',
+    'coalesce',
+    'paginate',
+    'retry',
+    'returns',
+    'sends',
+)
 
 
 class _Context:
     __slots__ = (
         '__context',
         '__key',
+        '__chunk_size',
         '__total',
         '__backoff_factor',
         '__status_forcelist',
+        '__retry_options',
     )
 
     def __init__(
@@ -33,54 +54,30 @@ class _Context:
     ) -> None:
         self.__context = context
         self.__key = kwargs.get('key')
+        self.__chunk_size = kwargs.get('chunk_size')
         self.__total = kwargs.get('total')
         self.__backoff_factor = kwargs.get('backoff_factor')
         self.__status_forcelist = kwargs.get('status_forcelist')
+        self.__retry_options = kwargs.get('retry_options', {})
 
     def __call__(self, func: Callable, **kwargs) -> Callable:
-
-        @wraps(func)
-        def wrapper(*args: Connector, **kwargs):
-            if self.__context in (
-                    AliasReturnType.JSON,
-                    AliasReturnType.STATUS_CODE,
-                    AliasReturnType.TEXT,
-            ):
-                return self._wrapper_returns(func, *args, **kwargs)
-            elif self.__context in (AliasSendsType.DATA, AliasSendsType.JSON,):
-                return self._wrapper_sends(func, *args, **kwargs)
-            elif self.__context is AliasReqOptType.RETRY:
-                return self._wrapper_retry(func, *args, **kwargs)
-        return wrapper
-    
-    def _wrapper_retry(self, func: Callable, *args: Connector, **kwargs):
-        retry = TypeRetryDump(
-            total=self.__total,
-            backoff_factor=self.__backoff_factor,
-            status_forcelist=self.__status_forcelist
-        )
-        ctx_retry_value = _ctx_retry_value.set(retry)
-        try:
-            return func(*args, **kwargs)
-        finally:
-            _ctx_retry_value.reset(ctx_retry_value)
-
-    def _wrapper_returns(self, func: Callable, *args: Connector, **kwargs):
-        ctx_returns_type = _ctx_returns_type.set(self.__context)
-        ctx_return_json_value = _ctx_returns_json_value.set(self.__key)
-        try:
-            return func(*args, **kwargs)
-        finally:
-            _ctx_returns_type.reset(ctx_returns_type)
-            if self.__context is AliasReturnType.JSON and self.__key:
-                _ctx_returns_json_value.reset(ctx_return_json_value)
-
-    def _wrapper_sends(self, func: Callable, *args: Connector, **kwargs):
-        ctx_sends_type = _ctx_sends_type.set(self.__context)
-        try:
-            return func(*args, **kwargs)
-        finally:
-            _ctx_sends_type.reset(ctx_sends_type)
+        if isinstance(self.__context, AliasReturnType):
+            return _configure_endpoint(
+                func,
+                returns_type=self.__context,
+                returns_json_key=self.__key,
+                returns_chunk_size=self.__chunk_size
+            )
+        elif self.__context in (AliasSendsType.DATA, AliasSendsType.JSON,):
+            return _configure_endpoint(func, sends_type=self.__context)
+        elif self.__context is AliasReqOptType.RETRY:
+            return _configure_endpoint(func, retry=RetryPolicy(TypeRetryDump(
+                total=self.__total,
+                backoff_factor=self.__backoff_factor,
+                status_forcelist=self.__status_forcelist,
+                **self.__retry_options
+            )))
+        return func
 
 
 class Retry(_Context):
@@ -92,9 +89,19 @@ class Retry(_Context):
     between retries (`backoff_factor`) and conditions for a retry to 
     occur (`status_forcelist`).
 
+    Delays are capped at `max_backoff` and randomized w/ `'full'` or 
+    `'decorrelated'` `jitter` (or `None`).  A `Retry-After` header sets 
+    the delay, up to `max_backoff`, if `respect_retry_after` is set.  
+    `exceptions`, connection errors and timeouts of the installed 
+    clients by default, are retried for `methods`, idempotent methods by 
+    default.  A request is re-sent at most `total` times, within the 
+    `retry_budget` of its `Connector`.
+
     ::
 
-        @retry(total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
+        @retry(
+            total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504]
+        )
         @get(path='/get')
         def get_request(self): pass
     """
@@ -104,20 +111,208 @@ class Retry(_Context):
             self,
             total: int,
             backoff_factor: float,
-            status_forcelist: Union[List[int], Tuple[int], Set[int]]
+            status_forcelist: Union[List[int], Tuple[int], Set[int]],
+            jitter: Union[None, str, AliasJitterType] = AliasJitterType.FULL,
+            max_backoff: float = 120.0,
+            respect_retry_after: bool = True,
+            exceptions: Optional[Iterable[type]] = None,
+            methods: Optional[Iterable[str]] = None
     ) -> None:
+        retry_options = dict(
+            jitter=jitter,
+            max_backoff=max_backoff,
+            respect_retry_after=respect_retry_after,
+            exceptions=None if exceptions is None else tuple(exceptions)
+        )
+        if methods is not None:
+            retry_options['methods'] = frozenset(methods)
         super().__init__(
             context=AliasReqOptType.RETRY,
             total=total,
             backoff_factor=backoff_factor,
-            status_forcelist=status_forcelist
+            status_forcelist=status_forcelist,
+            retry_options=retry_options
         )
 
 
+class Cache:
+    """The `cache` decorator keeps the evaluated results of GET and HEAD 
+    requests in memory.  Results are stored after `returns.*` and the 
+    return annotation have been applied, so a hit costs no decoding or 
+    validation.
+
+    Entries are keyed on the resolved URL, query parameters and the 
+    headers named in `vary`, and on the credentials of the client and of 
+    the request, so connectors w/ different credentials don't share 
+    entries.  They're fresh for `ttl` seconds, or for the 
+    `max-age` of the response's `Cache-Control` header, and may be served 
+    for `stale_while_revalidate` seconds more while a single background 
+    request refreshes them.  Expired entries w/ an `ETag` or 
+    `Last-Modified` header are revalidated w/ `If-None-Match` / 
+    `If-Modified-Since`.  The least recently used entries are evicted 
+    past `maxsize` entries or `maxbytes` bytes of response bodies.
+
+    ::
+
+        @cache(ttl=300, maxsize=256, stale_while_revalidate=60)
+        @returns.json
+        @get(path='/pokemon/{name}')
+        def get_pokemon(self, name: Path): pass
+    """
+    __slots__ = ('__cache',)
+
+    def __init__(
+            self,
+            ttl: float = 60,
+            maxsize: Optional[int] = 128,
+            maxbytes: Optional[int] = None,
+            vary: Iterable[str] = ('Accept', 'Authorization',),
+            stale_while_revalidate: float = 0
+    ) -> None:
+        self.__cache = ResponseCache(
+            ttl=ttl,
+            maxsize=maxsize,
+            maxbytes=maxbytes,
+            vary=vary,
+            stale_while_revalidate=stale_while_revalidate
+        )
+
+    def __call__(self, func: Callable) -> Callable:
+        return _configure_endpoint(func, cache=self.__cache)
+
+    def clear(self) -> None:
+        self.__cache.clear()
+
+
+class CircuitBreaker:
+    """The `circuit_breaker` decorator stops sending requests to an 
+    endpoint that keeps failing.  Requests fail if they raise or respond 
+    w/ one of `failure_statuses`, and are slow if they take 
+    `slow_call_duration` seconds or more.  Once `minimum_calls` of the 
+    last `window_size` requests have been recorded, the circuit opens 
+    when their failure rate reaches `failure_rate_threshold` or their 
+    slow call rate reaches `slow_call_rate_threshold`.
+
+    While open, requests raise `CircuitOpenError` w/o being sent.  After 
+    `open_timeout` seconds, `half_open_calls` probe requests are let 
+    through; the circuit closes if they succeed and opens again if not.  
+    Rejected requests aren't retried.
+
+    ::
+
+        @circuit_breaker(failure_rate_threshold=0.5, open_timeout=30)
+        @returns.json
+        @get(path='/pokemon/{name}')
+        def get_pokemon(self, name: Path): pass
+    """
+    __slots__ = ('__breaker',)
+
+    def __init__(self, **config) -> None:
+        self.__breaker = Breaker(
+            name='', config=TypeCircuitBreakerDump(**config)
+        )
+
+    def __call__(self, func: Callable) -> Callable:
+        if not self.__breaker.name:
+            self.__breaker.name = func.__qualname__
+        return _configure_endpoint(func, circuit_breaker=self.__breaker)
+
+    @property
+    def state(self) -> AliasCircuitState:
+        return self.__breaker.state
+
+    def stats(self) -> TypeCircuitStatsDump:
+        return self.__breaker.stats()
+
+
+class Coalesce:
+    """The `coalesce` decorator dedupes concurrent identical requests: 
+    while a request is in flight, identical calls wait for it and share 
+    its result, or its error, instead of sending their own.  Calls are 
+    identical if they share the client, method, URL, query parameters, 
+    headers and body.  Only idempotent methods of endpoints w/ a 
+    `returns` decorator are coalesced, as a raw response's body can only 
+    be read once.  It works for coroutines and, thread-safely, for 
+    blocking clients.
+
+    Results are shared as is, so they shouldn't be mutated in place.  
+    `coalesce=True` on the `Connector` applies it to every endpoint; 
+    `coalesce(enabled=False)` opts an endpoint out.
+
+    ::
+
+        @coalesce
+        @cache(ttl=60)
+        @returns.json
+        @get(path='/config')
+        def get_config(self): pass
+    """
+    __slots__ = ('__enabled',)
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.__enabled = enabled
+
+    def __call__(self, func: Optional[Callable] = None, **kwargs) -> Callable:
+        if not func:
+            return self.__class__(**kwargs)
+        return _configure_endpoint(func, coalesce=self.__enabled)
+
+
+class Paginate:
+    """The `paginate` decorator turns an endpoint into a lazy iterator 
+    over the items of every page.  `strategy` is one of:
+
+    - `cursor`: the value at `cursor_key` of each page is sent as the 
+      `cursor_param` query parameter of the next.  A URL is requested as 
+      is.
+    - `link`: the `rel="next"` target of the `Link` header is requested.
+    - `offset`: `offset_param` and `limit_param` query parameters walk 
+      the pages `limit` items at a time.  W/ a `total_key`, the total 
+      count of the first page lets the remaining pages be fetched 
+      `concurrency` at a time.
+
+    Items are the pages' JSON bodies, or their `returns.json` key.  Up to 
+    `prefetch` pages are fetched ahead while the current one is consumed, 
+    and no more than `max_pages` pages are fetched.
+
+    ::
+
+        @paginate(strategy='offset', limit=50, total_key='count')
+        @returns.json(key='results')
+        @get(path='/pokemon')
+        def get_pokemon(self) -> Iterator[Pokemon]: pass
+    """
+    __slots__ = ('__config',)
+
+    def __init__(
+            self, strategy: Union[str, AliasPaginateType], **kwargs
+    ) -> None:
+        if isinstance(strategy, str):
+            strategy = AliasPaginateType[strategy.upper()]
+        self.__config = TypePaginateDump(strategy=strategy, **kwargs)
+
+    def __call__(self, func: Callable) -> Callable:
+        return _configure_endpoint(func, paginate=self.__config)
+
+
 class Returns:
-    __slots__ = ('json', 'status_code', 'text',)
+    __slots__ = ('file', 'json', 'status_code', 'stream', 'text',)
 
     def __init__(self):
+        self.file = self.File
+        """The response's body can be downloaded to `target`, a path or 
+        a file object, w/ bounded memory.  It's written in `chunk_size` 
+        chunks through a temporary file that's renamed over the path once 
+        complete, and the file's path, size and `hash_algorithm` digest 
+        are returned as a `TypeFileDump`.  `progress` is called after 
+        each chunk w/ the bytes written and the `Content-Length`, if any.
+
+        ::
+
+            @returns.file('report.csv', progress=print)
+            @get(path='/reports/{name}')
+            def get_report(self, name: Path): pass
+        """
         self.json = self.Json()
         """If wanting to exclusively return the response's JSON object, 
         a flat decoration can be used.
@@ -148,6 +343,20 @@ class Returns:
             @post(path='/post')
             def post_request(self, **kwargs): pass
         """
+        self.stream = self.Streams()
+        """The response's body can be iterated over w/o being buffered, 
+        as chunks of bytes (`bytes`), decoded lines (`lines`) or decoded 
+        NDJSON values (`ndjson`).  The endpoint returns a generator, or an 
+        async generator for nonblocking clients; the request is sent on 
+        the first iteration and the connection is released when 
+        iteration ends.  `chunk_size` defaults to 64 KiB.
+
+        ::
+
+            @returns.stream.ndjson(chunk_size=1_048_576)
+            @get(path='/exports/{name}')
+            def get_export(self, name: Path): pass
+        """
         self.text = self.Adaptable(context=AliasReturnType.TEXT)
         """The response's text representation can be exclusively 
         returned.
@@ -173,6 +382,53 @@ class Returns:
                 return self.__class__(**kwargs)
             return super().__call__(func=func)
 
+    class File:
+        __slots__ = ('__chunk_size', '__download',)
+
+        def __init__(
+                self,
+                target: Any,
+                chunk_size: Optional[int] = None,
+                hash_algorithm: str = 'sha256',
+                progress: Optional[Callable[[int, Optional[int]], Any]] = None
+        ) -> None:
+            new_hash(hash_algorithm)
+            self.__chunk_size = chunk_size
+            self.__download = TypeDownloadDump(
+                target=target, hash_algorithm=hash_algorithm, progress=progress
+            )
+
+        def __call__(self, func: Callable) -> Callable:
+            return _configure_endpoint(
+                func,
+                returns_type=AliasReturnType.FILE,
+                returns_json_key=None,
+                returns_chunk_size=self.__chunk_size,
+                returns_file=self.__download
+            )
+
+    class Stream(_Context):
+        __slots__ = ('__stream_type',)
+
+        def __init__(self, context: AliasReturnType, **kwargs) -> None:
+            self.__stream_type = context
+            super().__init__(context=context, **kwargs)
+
+        def __call__(
+                self, func: Optional[Callable] = None, **kwargs
+        ) -> Callable:
+            if not func:
+                return self.__class__(context=self.__stream_type, **kwargs)
+            return super().__call__(func=func)
+
+    class Streams:
+        __slots__ = ('bytes', 'lines', 'ndjson',)
+
+        def __init__(self):
+            self.bytes = Returns.Stream(context=AliasReturnType.BYTES)
+            self.lines = Returns.Stream(context=AliasReturnType.LINES)
+            self.ndjson = Returns.Stream(context=AliasReturnType.NDJSON)
+
     class Adaptable(_Context):
 
         def __init__(self, context: AliasReturnType, **kwargs) -> None:
@@ -180,7 +436,7 @@ class Returns:
 
 
 class Sends:
-    __slots__ = ('form_url_encoded', 'json',)
+    __slots__ = ('form_url_encoded', 'json', 'stream',)
 
     def __init__(self):
         self.form_url_encoded = self.Adaptable(context=AliasSendsType.DATA)
@@ -201,6 +457,32 @@ class Sends:
             @post(path='/post')
             def post_json(self, body: Body): pass
         """
+        self.stream = self.Stream()
+        """Configures how file objects, buffers and iterators bound to 
+        `Body` are streamed: `chunk_size` is the size of the chunks read 
+        from files and buffers, and `expect_continue` sends an 
+        `Expect: 100-continue` header so the server can reject the upload 
+        before it's transmitted.
+
+        ::
+
+            @sends.stream(chunk_size=1_048_576, expect_continue=True)
+            @put(path='/uploads/{name}')
+            def put_upload(self, name: Path, body: Body): pass
+        """
+
+    class Stream:
+        __slots__ = ('__config',)
+
+        def __init__(self, **kwargs) -> None:
+            self.__config = TypeSendStreamDump(**kwargs)
+
+        def __call__(
+                self, func: Optional[Callable] = None, **kwargs
+        ) -> Callable:
+            if not func:
+                return self.__class__(**kwargs)
+            return _configure_endpoint(func, sends_stream=self.__config)
 
     class Adaptable(_Context):
 
@@ -210,11 +492,15 @@ class Sends:
 
 returns = Returns()
 """Provides access to decorators that allow a method to default to 
-returning JSON, text or status code when invoked.  Declaring a 
-subsequent return type will overwrite a previous declared return 
-type."""
+returning JSON, text or status code when invoked.  If several return 
+types are stacked, the one declared nearest to the verb takes 
+precedence."""
 sends = Sends()
 """Provides access to decorators that allow a method to default to 
-sending form-encoded data or JSON.  Declaring a subsequent send type 
-will overwrite a previous declared send type."""
+sending form-encoded data or JSON.  If several send types are stacked, 
+the one declared nearest to the verb takes precedence."""
 retry = Retry
+cache = Cache
+paginate = Paginate
+circuit_breaker = CircuitBreaker
+coalesce = Coalesce()
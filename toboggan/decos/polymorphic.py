@@ -1,20 +1,23 @@
 # Standard
 from functools import wraps
 from inspect import isclass
-from typing import Callable, Dict, Union
+from typing import Callable, Dict, Optional, Union
 
 # Local
-from .contexts import _ctx_headers_value, _ctx_query_params_value
+from .specs import _configure_endpoint
 from toboggan import Connector
 from toboggan.aliases import AliasReqOptType
+from toboggan.clients import RateLimiter
 
-__all__ = ('headers', 'params',)
+__all__ = ('headers', 'params', 'rate_limit',)
 
 
 class Polymorphic:
     __slots__ = ('__context', '__value',)
 
-    def __init__(self, context: AliasReqOptType, value: Dict):
+    def __init__(
+            self, context: AliasReqOptType, value: Union[Dict, RateLimiter]
+    ):
         self.__context = context
         self.__value = value
 
@@ -35,28 +38,18 @@ class Polymorphic:
             cls.base_headers.update(self.__value)
         elif self.__context is AliasReqOptType.QUERY:
             cls.base_query_params.update(self.__value)
+        elif self.__context is AliasReqOptType.RATE_LIMIT:
+            cls.rate_limiter = self.__value
         return cls
 
     def _for_func(self, func: Callable) -> Callable:
-
-        @wraps(func)
-        def wrapper(*args: Connector, **kwargs):
-            if self.__context is AliasReqOptType.HEADERS:
-                ctx_headers_value = _ctx_headers_value.set(self.__value)
-                try:
-                    return func(*args, **kwargs)
-                finally:
-                    _ctx_headers_value.reset(ctx_headers_value)
-            elif self.__context is AliasReqOptType.QUERY:
-                ctx_query_params_value = _ctx_query_params_value.set(
-                    self.__value
-                )
-                try:
-                    return func(*args, **kwargs)
-                finally:
-                    _ctx_query_params_value.reset(ctx_query_params_value)
-            return func(*args, **kwargs)
-        return wrapper
+        if self.__context is AliasReqOptType.HEADERS:
+            return _configure_endpoint(func, headers=self.__value)
+        elif self.__context is AliasReqOptType.QUERY:
+            return _configure_endpoint(func, query_params=self.__value)
+        elif self.__context is AliasReqOptType.RATE_LIMIT:
+            return _configure_endpoint(func, rate_limit=self.__value)
+        return func
 
 
 class Headers(Polymorphic):
@@ -108,5 +101,41 @@ class Params(Polymorphic):
         super().__init__(AliasReqOptType.QUERY, value)
 
 
+class RateLimit(Polymorphic):
+    """Provides access to the rate limit decorator and can be used to 
+    decorate classes and instance methods.  Allows `rate` requests per 
+    second w/ bursts of up to `burst` requests.  Requests over the limit 
+    sleep, or await, until a token is due instead of being sent.
+
+    If used to decorate a class, one bucket is shared by every instance 
+    method of the :py:class:`Connector`.  If used to decorate an instance 
+    method, the bucket is exclusive to it, or shared by every method the 
+    same decorator is applied to.  Both apply to a method decorated at 
+    both levels.
+
+    W/ `adaptive`, `X-RateLimit-Remaining` and `X-RateLimit-Reset` 
+    response headers slow the bucket down to the quota left until it 
+    resets.
+
+    ::
+
+        @rate_limit(rate=10, burst=20)
+        class Httpbin(Connector):
+            
+            @rate_limit(rate=1)
+            @get(path='/get')
+            def get_request(self): pass
+    """
+
+    def __init__(
+            self, rate: float, burst: Optional[float] = None, adaptive: bool = True
+    ):
+        super().__init__(
+            AliasReqOptType.RATE_LIMIT,
+            RateLimiter(rate=rate, burst=burst, adaptive=adaptive)
+        )
+
+
 headers = Headers
 params = Params
+rate_limit = RateLimit
@@ -0,0 +1,65 @@
+# Standard
+from typing import Callable, Dict, List
+
+# Local
+from toboggan.models import TypeEndpointSpecDump
+
+__all__ = ('_Endpoint', '_configure_endpoint', '_merge_spec',)
+
+_ENDPOINT_ATTR = '__toboggan_endpoint__'
+_PENDING_ATTR = '__toboggan_pending__'
+_MAPPING_FIELDS = ('headers', 'query_params',)
+
+
+def _merge_spec(spec: TypeEndpointSpecDump, **fields) -> TypeEndpointSpecDump:
+    """Merges one decorator's configuration into a frozen endpoint spec.
+
+    The decorator nearest to the function takes precedence.  Mappings are
+    merged key by key; any other group of fields is only applied when none
+    of them has been set by a nearer decorator.
+    """
+    updates: Dict = {}
+    scalars: Dict = {}
+    for field, value in fields.items():
+        if field in _MAPPING_FIELDS:
+            updates[field] = {**value, **getattr(spec, field)}
+        else:
+            scalars[field] = value
+    if scalars and all(getattr(spec, field) is None for field in scalars):
+        updates.update(scalars)
+    return spec._replace(**updates)
+
+
+def _configure_endpoint(func: Callable, **fields) -> Callable:
+    """Attaches static configuration to an endpoint and returns it as is.
+
+    If `func` has not been decorated by a verb yet, the configuration is
+    held on the function until the verb decorator picks it up.
+    """
+    endpoint = getattr(func, _ENDPOINT_ATTR, None)
+    if endpoint is not None:
+        endpoint.configure(**fields)
+    else:
+        func.__dict__.setdefault(_PENDING_ATTR, []).append(fields)
+    return func
+
+
+class _Endpoint:
+    """Holds the frozen spec of a verb-decorated function.  Decorators
+    replace the spec as they are applied, at import time, so a call only
+    reads a single attribute.
+    """
+    __slots__ = ('spec',)
+
+    def __init__(self, func: Callable, spec: TypeEndpointSpecDump):
+        self.spec = spec
+        pending: List[Dict] = func.__dict__.pop(_PENDING_ATTR, [])
+        for fields in pending:
+            self.configure(**fields)
+
+    def configure(self, **fields) -> None:
+        self.spec = _merge_spec(self.spec, **fields)
+
+    def attach(self, wrapper: Callable) -> Callable:
+        setattr(wrapper, _ENDPOINT_ATTR, self)
+        return wrapper
@@ -1,19 +1,31 @@
 # Standard
 from functools import wraps
-from typing import Callable
+from time import perf_counter
+from typing import Callable, Optional, Tuple
 
 # Local
-from .contexts import (
-    _ctx_headers_value,
-    _ctx_query_params_value,
-    _ctx_retry_value,
-    _ctx_returns_type,
-    _ctx_returns_json_value,
-    _ctx_sends_type,
-)
 from .evaluators import _EvalSignature
-from toboggan.clients import Requests, Settings
-from toboggan.connector import Connector
+from .specs import _Endpoint
+from toboggan.clients import (
+    Breaker,
+    Breakers,
+    Pages,
+    Prepared,
+    RateLimiter,
+    Requests,
+    Settings,
+    SingleFlight,
+    Timing,
+    resolve_codec,
+)
+from toboggan.aliases import AliasCodecType
+from toboggan.connector import Connector, _PREPARE_ATTR
+from toboggan.models import (
+    TypeCodecDump,
+    TypeEndpointSpecDump,
+    TypeKwDump,
+    TypeRequestSettingsDump,
+)
 
 __all__ = (
     'connect',
@@ -27,6 +39,25 @@ __all__ = (
     'trace',
 )
 
+_JSON_CODEC = resolve_codec(AliasCodecType.JSON)
+
+
+def _rate_limits(
+        conn_limiter: Optional[RateLimiter], spec_limiter: Optional[RateLimiter]
+) -> Tuple[RateLimiter, ...]:
+    if conn_limiter is None:
+        return () if spec_limiter is None else (spec_limiter,)
+    return (conn_limiter,) if spec_limiter is None \
+        else (conn_limiter, spec_limiter)
+
+
+def _breaker(
+        breaker: Optional[Breaker], breakers: Optional[Breakers], name: str
+) -> Optional[Breaker]:
+    if breaker is not None or breakers is None:
+        return breaker
+    return breakers[name]
+
 
 class Verb:
     __slots__ = ('__method', '__path',)
@@ -37,33 +68,104 @@ class Verb:
 
     def __call__(self, func: Callable) -> Callable:
         sig = _EvalSignature(func)
-
-        @wraps(func)
-        def wrapper(*args: Connector, **kwargs):
-            conn, kw_dump = sig.dump(*args, **kwargs)
-            resolve = Settings(
+        endpoint = _Endpoint(
+            func=func,
+            spec=TypeEndpointSpecDump(method=self.__method, path=self.__path)
+        )
+        settings = Settings()
+        flights = SingleFlight()
+        name = func.__qualname__
+
+        def dump(
+                conn: Connector,
+                kw_dump: TypeKwDump,
+                codec: Optional[TypeCodecDump]
+        ) -> TypeRequestSettingsDump:
+            """Resolves the settings of a call to `conn`, its request body
+            encoded w/ `codec`.
+            """
+            spec = endpoint.spec
+            request = settings.dump(
+                method=spec.method,
                 base_url=conn.base_url,
-                path=self.__path,
+                path=spec.path,
                 base_headers=conn.base_headers,
                 base_query_params=conn.base_query_params,
                 kw_dump=kw_dump,
-                ctx_headers_value=_ctx_headers_value.get(),
-                ctx_query_params_value=_ctx_query_params_value.get(),
-                ctx_sends_type=_ctx_sends_type.get(),
-                ctx_retry_value=_ctx_retry_value.get(),
-                ctx_returns_type=_ctx_returns_type.get(),
-                ctx_returns_json_key=_ctx_returns_json_value.get(),
+                ctx_headers_value=spec.headers,
+                ctx_query_params_value=spec.query_params,
+                ctx_sends_type=spec.sends_type,
+                ctx_sends_stream=spec.sends_stream,
+                codec=codec,
+                client_type=conn.driver.client_type
             )
-            settings = resolve.dump(
-                session=conn.session(), method=self.__method
+            coalesce = conn.coalesce if spec.coalesce is None else spec.coalesce
+            return TypeRequestSettingsDump(
+                session=conn.session(),
+                request=request,
+                retry=spec.retry,
+                returns_type=spec.returns_type,
+                returns_json_key=spec.returns_json_key,
+                codec=conn.codec,
+                cache=spec.cache,
+                flights=flights if coalesce else None,
+                retry_budget=conn.retry_budget,
+                rate_limits=_rate_limits(conn.rate_limiter, spec.rate_limit),
+                breaker=_breaker(spec.circuit_breaker, conn.circuit_breakers, name),
+                returns_chunk_size=spec.returns_chunk_size,
+                returns_file=spec.returns_file
             )
-            build_request = Requests(
-                client_type=conn.client_type,
+
+        @wraps(func)
+        def wrapper(*args: Connector, **kwargs):
+            started = perf_counter()
+            conn, kw_dump = sig.dump(*args, **kwargs)
+            hooks = conn.hooks
+            timing = Timing(
+                hooks=hooks,
+                endpoint=name,
+                connector=conn.__class__.__name__,
+                started=started,
+                bound=perf_counter()
+            ) if hooks else None
+            try:
+                call = dump(conn, kw_dump, conn.codec)
+            except BaseException as error:
+                if timing is not None:
+                    timing.finish(error)
+                raise
+            if endpoint.spec.paginate is not None:
+                return Pages(
+                    driver=conn.driver,
+                    settings=call,
+                    config=endpoint.spec.paginate,
+                    eval_type=sig.eval_type,
+                    timing=timing
+                ).resolve()
+            if timing is not None:
+                timing.resolve(
+                    method=call.request['method'], url=call.request['url']
+                )
+            return Requests(
+                driver=conn.driver,
                 eval_type=sig.eval_type,
-                **settings._asdict()
+                timing=timing,
+                **call._asdict()
+            ).resolve_request()
+
+        def prepare(*args: Connector, **kwargs) -> Prepared:
+            conn, kw_dump = sig.dump(*args, **kwargs)
+            return Prepared(
+                conn=conn,
+                name=name,
+                driver=conn.driver,
+                settings=dump(conn, kw_dump, conn.codec or _JSON_CODEC),
+                eval_type=sig.eval_type,
+                paginate=endpoint.spec.paginate
             )
-            return build_request.resolve_request()
-        return wrapper
+
+        setattr(wrapper, _PREPARE_ATTR, prepare)
+        return endpoint.attach(wrapper)
 
 
 class connect(Verb):
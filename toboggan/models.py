@@ -1,68 +1,271 @@
 # Standard
-from typing import Any, Dict, List, NamedTuple, Optional, Union
+from typing import (
+    Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Union,
+)
 
 # Local
-from toboggan.aliases import AliasReturnType
+from toboggan.aliases import (
+    AdaptersEvalType,
+    AliasCircuitState,
+    AliasCodecType,
+    AliasJitterType,
+    AliasPaginateType,
+    AliasReturnType,
+    AliasSendsType,
+)
 
 __all__ = (
+    'TypeCacheEntryDump',
+    'TypeCircuitBreakerDump',
+    'TypeCircuitOpenErrDump',
+    'TypeCircuitStatsDump',
     'TypeClientModuleErrDump',
-    'TypeHeadersDump',
+    'TypeCodecDump',
+    'TypeCodecModuleErrDump',
+    'TypeDownloadDump',
+    'TypeDownloadErrDump',
+    'TypeEndpointMetricsDump',
+    'TypeEndpointSpecDump',
+    'TypeFileDump',
+    'TypeHistogramDump',
     'TypeKwDump',
     'TypeKwObjDump',
     'TypeNestedKeyErrDump',
     'TypeNestedTypeErrDump',
-    'TypeQueryParamsDump',
+    'TypePageDump',
+    'TypePaginateDump',
+    'TypePoolDump',
+    'TypePoolErrDump',
     'TypeRequestSettingsDump',
+    'TypeRetryBudgetDump',
     'TypeRetryDump',
     'TypeRetryErrDump',
-    'TypeSendDataDump',
-    'TypeSendJsonDump',
+    'TypeSendStreamDump',
+    'TypeSendStreamErrDump',
+    'TypeSlotDump',
+    'TypeTimingDump',
+    'TypeValidatorDump',
     'TypeEvalErrDump',
 )
 
 
-class TypeHeadersDump(NamedTuple):
-    headers: Dict[str, str]
-
-
 class TypeKwObjDump(NamedTuple):
     sig_type: Any
     kw_value: Union[Dict, str, int]
+    key: Optional[str] = None
 
 
 class TypeKwDump(NamedTuple):
     dump: Dict = {}
 
 
-class TypeQueryParamsDump(NamedTuple):
-    params: Dict
-
-
 class TypeRetryDump(NamedTuple):
     total: int
     backoff_factor: float
     status_forcelist: list[int]
+    jitter: AliasJitterType = AliasJitterType.FULL
+    max_backoff: float = 120.0
+    respect_retry_after: bool = True
+    exceptions: Optional[Tuple[type, ...]] = None
+    methods: FrozenSet[str] = frozenset((
+        'DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT', 'TRACE',
+    ))
+
+
+class TypeRetryBudgetDump(NamedTuple):
+    ratio: float = 0.2
+    min_per_second: float = 1.0
+    capacity: float = 10.0
+
+
+class TypeEndpointSpecDump(NamedTuple):
+    method: str
+    path: str
+    headers: Dict = {}
+    query_params: Dict = {}
+    sends_type: Optional[AliasSendsType] = None
+    sends_stream: Optional['TypeSendStreamDump'] = None
+    retry: Optional[Any] = None
+    returns_type: Optional[AliasReturnType] = None
+    returns_json_key: Union[None, str, list[str], tuple[str]] = None
+    returns_chunk_size: Optional[int] = None
+    returns_file: Optional['TypeDownloadDump'] = None
+    paginate: Optional['TypePaginateDump'] = None
+    cache: Optional[Any] = None
+    coalesce: Optional[bool] = None
+    rate_limit: Optional[Any] = None
+    circuit_breaker: Optional[Any] = None
 
 
 class TypeRequestSettingsDump(NamedTuple):
     session: object
-    method: str
-    url: str
-    headers: Dict
-    query_params: Dict
-    send: Union[Dict, str]
-    options: Dict
-    retry: Optional[TypeRetryDump]
+    request: Dict
+    retry: Optional[Any]
     returns_type: Optional[AliasReturnType]
     returns_json_key: Union[None, str, list[str], tuple[str]]
+    codec: Optional['TypeCodecDump'] = None
+    cache: Optional[Any] = None
+    flights: Optional[Any] = None
+    retry_budget: Optional[Any] = None
+    rate_limits: Tuple = ()
+    breaker: Optional[Any] = None
+    returns_chunk_size: Optional[int] = None
+    returns_file: Optional['TypeDownloadDump'] = None
+
+
+class TypeCacheEntryDump(NamedTuple):
+    value: Any
+    size: int
+    fresh_until: float
+    stale_until: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class TypePaginateDump(NamedTuple):
+    strategy: AliasPaginateType
+    cursor_param: str = 'cursor'
+    cursor_key: Union[str, List[str], Tuple[str, ...]] = 'next_cursor'
+    offset_param: str = 'offset'
+    limit_param: str = 'limit'
+    limit: int = 100
+    total_key: Union[None, str, List[str], Tuple[str, ...]] = None
+    max_pages: Optional[int] = None
+    prefetch: int = 1
+    concurrency: int = 4
+
+
+class TypePageDump(NamedTuple):
+    url: str
+    json: Any
+    headers: Any
+    items: List
+
+
+class TypeDownloadDump(NamedTuple):
+    target: Any
+    hash_algorithm: str = 'sha256'
+    progress: Optional[Callable[[int, Optional[int]], Any]] = None
+
+
+class TypeFileDump(NamedTuple):
+    path: Optional[str]
+    size: int
+    hash: str
+    hash_algorithm: str = 'sha256'
+
+
+class TypeTimingDump(NamedTuple):
+    endpoint: str
+    connector: Optional[str] = None
+    method: Optional[str] = None
+    url: Optional[str] = None
+    started: float = 0.0
+    bound: Optional[float] = None
+    resolved: Optional[float] = None
+    sent: Optional[float] = None
+    received: Optional[float] = None
+    decoded: Optional[float] = None
+    validated: Optional[float] = None
+    finished: Optional[float] = None
+    attempts: int = 0
+    status_code: Optional[int] = None
+    bytes_sent: Optional[int] = None
+    bytes_received: Optional[int] = None
+    error: Optional[BaseException] = None
+
+    def durations(self) -> Dict[str, float]:
+        """The seconds spent in each stage that was reached: `bind`,
+        `resolve`, `wait` (rate limits, retries and backoff), `network`,
+        `decode`, `validate` and `total`.
+        """
+        stages = (
+            ('bind', self.started, self.bound),
+            ('resolve', self.bound, self.resolved),
+            ('wait', self.resolved, self.sent),
+            ('network', self.sent, self.received),
+            ('decode', self.received, self.decoded),
+            ('validate', self.decoded or self.received, self.validated),
+            ('total', self.started, self.finished),
+        )
+        return {
+            name: end - start for name, start, end in stages
+            if start is not None and end is not None
+        }
+
+
+class TypeHistogramDump(NamedTuple):
+    count: int = 0
+    sum: float = 0.0
+    min: Optional[float] = None
+    max: Optional[float] = None
+    p50: Optional[float] = None
+    p90: Optional[float] = None
+    p99: Optional[float] = None
+    p999: Optional[float] = None
+
 
+class TypeEndpointMetricsDump(NamedTuple):
+    connector: str
+    method: str
+    requests: Dict[str, int]
+    retries: int
+    in_flight: int
+    latency: TypeHistogramDump
+    response_size: TypeHistogramDump
+
+
+class TypeCircuitBreakerDump(NamedTuple):
+    failure_rate_threshold: float = 0.5
+    slow_call_rate_threshold: float = 1.0
+    slow_call_duration: Optional[float] = 10.0
+    window_size: int = 20
+    minimum_calls: int = 10
+    open_timeout: float = 30.0
+    half_open_calls: int = 3
+    failure_statuses: FrozenSet[int] = frozenset(range(500, 600))
+
+
+class TypeCircuitStatsDump(NamedTuple):
+    name: str
+    state: AliasCircuitState
+    calls: int
+    failure_rate: float
+    slow_call_rate: float
+    retry_in: Optional[float] = None
+
+
+class TypeSlotDump(NamedTuple):
+    name: str
+    position: Optional[int]
+    sig_type: Any
+    key: str
+    default: Any
 
-class TypeSendDataDump(NamedTuple):
-    data: Union[Dict, str]
 
+class TypeSendStreamDump(NamedTuple):
+    chunk_size: int = 64 * 1024
+    expect_continue: bool = False
 
-class TypeSendJsonDump(NamedTuple):
-    json: Union[Dict, str]
+
+class TypeCodecDump(NamedTuple):
+    codec_type: Optional[AliasCodecType]
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+    content_type: str = 'application/json'
+
+
+class TypePoolDump(NamedTuple):
+    max_connections: int = 100
+    max_per_host: Optional[int] = None
+    keepalive_expiry: Optional[float] = None
+    socket_options: Optional[Tuple[Tuple[int, int, Any], ...]] = None
+
+
+class TypeValidatorDump(NamedTuple):
+    adapter_type: AdaptersEvalType
+    validate_python: Callable[[Any], Any]
+    validate_json: Optional[Callable[[bytes], Any]] = None
 
 
 class TypeClientModuleErrDump(NamedTuple):
@@ -83,6 +286,58 @@ class TypeClientModuleErrDump(NamedTuple):
     ]
 
 
+class TypeCodecModuleErrDump(NamedTuple):
+    codec: Any
+    optional_dependencies: List[str] = ['msgspec', 'orjson']
+    err_message: str = 'This error occurs when attempting to use an ' \
+    'unknown codec or when a supported codec has not been installed.'
+    solution_message: List[str] = [
+        "Pass one of 'auto', 'json', 'msgspec' or 'orjson', an "
+        '`AliasCodecType` or a `TypeCodecDump`.', 'OR',
+        'pip install msgspec', 'OR',
+        'pip install orjson'
+    ]
+
+
+class TypePoolErrDump(NamedTuple):
+    client: str
+    err_message: str = 'This error occurs when attempting to apply pool ' \
+    'settings to a client that was built outside of the `Connector`.'
+    solution_message: List[str] = [
+        'Pass the client class, e.g. `client=httpx.Client`, so the '
+        '`Connector` builds it w/ the pool settings.', 'OR',
+        'Configure the pool on the client directly and leave `pool` unset.'
+    ]
+
+
+class TypeSendStreamErrDump(NamedTuple):
+    client: str
+    type_found: type
+    err_message: str = 'This error occurs when a body that can only be ' \
+    'iterated over asynchronously is sent w/ a blocking client.'
+    solution_message: str = 'Use a nonblocking client, e.g. ' \
+    '`aiohttp.ClientSession` or `httpx.AsyncClient`, or pass a file ' \
+    'object or a sync iterator of bytes instead.'
+
+
+class TypeDownloadErrDump(NamedTuple):
+    status_code: int
+    err_message: str = 'This error occurs when a response to be ' \
+    'downloaded has a status code outside of the 2xx range.  Nothing is ' \
+    'written to the target.'
+    solution_message: str = 'Check the request, or use another return ' \
+    'type to inspect the response.'
+
+
+class TypeCircuitOpenErrDump(NamedTuple):
+    stats: TypeCircuitStatsDump
+    err_message: str = 'This error occurs when a request is rejected w/o ' \
+    'being sent because the circuit breaker of its endpoint is open.'
+    solution_message: str = 'The upstream has been failing or slow.  ' \
+    'Retry after `stats.retry_in` seconds, when probe requests are let ' \
+    'through again.'
+
+
 class TypeNestedTypeErrDump(NamedTuple):
     type_expected: type
     type_found: type
@@ -107,14 +362,14 @@ class TypeRetryErrDump(NamedTuple):
     status_code: int
     config: TypeRetryDump
     err_message: str = 'This error occurs when a request fails after ' \
-    'exhausting all retry attempts.'
+    'exhausting all retry attempts or the retry budget of its `Connector`.'
     solution_message: str = 'Consider increasing the number of retry ' \
     'attempts or adjusting the backoff factor to allow for more time ' \
     'between retry attempts.'
 
 
 class TypeEvalErrDump(NamedTuple):
-    type_expected: Union[type, List]
+    type_expected: Union[type, List, str]
     type_evaluated: type
     err_message: Union[List, str] = 'This error occurs when the ' \
     'annotated return type hint does not evaluate to the response ' \